@@ -6,12 +6,16 @@ Shares the same AUTH_SECRET and user schema as the teammate's Login-Register bac
 so that a single JWT works across both services.
 """
 
+import hashlib
 import os
+import threading
+import time
 from datetime import datetime, timezone, timedelta
 from typing import Optional
 
 import bcrypt
-from jose import jwt, JWTError
+from cachetools import TLRUCache
+import jwt
 from fastapi import Header, HTTPException, Depends
 from pydantic import BaseModel, Field
 from typing import Literal
@@ -24,6 +28,10 @@ load_dotenv()
 AUTH_SECRET = os.getenv("AUTH_SECRET", "smartagri_secret_key_change_in_production")
 MONGODB_URL = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
 MONGODB_DATABASE = os.getenv("MONGODB_DATABASE", "smartagri")
+MONGODB_MAX_POOL_SIZE = int(os.getenv("MONGODB_MAX_POOL_SIZE", "200"))
+MONGODB_MIN_POOL_SIZE = int(os.getenv("MONGODB_MIN_POOL_SIZE", "20"))
+# Work factor for new password hashes; existing hashes keep the cost they were made with
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "10"))
 
 
 # ─── MongoDB Connection (Motor async) ─────────────────────
@@ -40,6 +48,12 @@ def get_mongo_db():
             MONGODB_URL,
             serverSelectionTimeoutMS=10000,
             tlsAllowInvalidCertificates=True,
+            maxPoolSize=MONGODB_MAX_POOL_SIZE,
+            minPoolSize=MONGODB_MIN_POOL_SIZE,
+            maxIdleTimeMS=60000,
+            waitQueueTimeoutMS=5000,
+            compressors="zstd,snappy,zlib",
+            retryWrites=True,
         )
         _mongo_db = _mongo_client[MONGODB_DATABASE]
     return _mongo_db
@@ -57,7 +71,7 @@ async def close_mongo():
 # ─── Password helpers ──────────────────────────────────────
 def hash_password(password: str) -> str:
     password_bytes = password.encode("utf-8")[:72]
-    return bcrypt.hashpw(password_bytes, bcrypt.gensalt()).decode("utf-8")
+    return bcrypt.hashpw(password_bytes, bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode("utf-8")
 
 
 def verify_password(plain: str, hashed: str) -> bool:
@@ -78,26 +92,85 @@ def create_token(user_id: str, username: str, role: str) -> str:
     return jwt.encode(payload, AUTH_SECRET, algorithm="HS256")
 
 
+# Verified payloads keyed by a digest of the token. Every authenticated
+# request re-presents the same token, so this turns the HMAC check +
+# base64/JSON decode into a dict lookup. Entries live at most
+# TOKEN_CACHE_TTL seconds and never past the token's own exp claim.
+# Rejected tokens are cached too (payload None) so a client retrying with
+# an expired or tampered token doesn't cost a decode per request.
+TOKEN_CACHE_TTL = int(os.getenv("TOKEN_CACHE_TTL", "60"))
+
+
+def _token_ttu(_key: bytes, payload: Optional[dict], now: float) -> float:
+    """Per-entry expiry: the sooner of the cache TTL and the token's exp."""
+    expires_at = now + TOKEN_CACHE_TTL
+    exp = payload.get("exp") if payload else None
+    if isinstance(exp, (int, float)):
+        expires_at = min(expires_at, float(exp))
+    return expires_at
+
+
+# Wall-clock timer so entries can be compared against the exp claim
+_token_cache: TLRUCache = TLRUCache(maxsize=10_000, ttu=_token_ttu, timer=time.time)
+_token_cache_lock = threading.Lock()
+_MISSING = object()
+
+
+def _token_cache_key(token: str) -> bytes:
+    # Fixed-size key; avoids holding full bearer tokens in memory
+    return hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+
+
+def _is_compact_jws(token: str) -> bool:
+    """Cheap shape check: three non-empty dot-separated segments."""
+    header, _, rest = token.partition(".")
+    body, _, signature = rest.partition(".")
+    return bool(header and body and signature) and "." not in signature
+
+
 def verify_token(token: str) -> Optional[dict]:
-    try:
-        return jwt.decode(token, AUTH_SECRET, algorithms=["HS256"])
-    except JWTError:
-        return None
+    key = _token_cache_key(token)
+    with _token_cache_lock:
+        payload = _token_cache.get(key, _MISSING)
+    if payload is not _MISSING:
+        return payload
+
+    # Garbage bearer values are rejected before PyJWT parses any JSON
+    payload = None
+    if _is_compact_jws(token):
+        try:
+            payload = jwt.decode(token, AUTH_SECRET, algorithms=["HS256"])
+        except jwt.InvalidTokenError:
+            payload = None
+
+    with _token_cache_lock:
+        _token_cache[key] = payload
+    return payload
 
 
 # ─── FastAPI dependencies ─────────────────────────────────
-def get_current_user_id(authorization: str = Header(None)) -> Optional[str]:
+def _bearer_token(authorization: Optional[str]) -> Optional[str]:
+    """Return the token from a ``Bearer <token>`` header, or None."""
+    if not authorization:
+        return None
+    scheme, _, token = authorization.partition(" ")
+    if scheme != "Bearer" or not token:
+        return None
+    return token
+
+
+# Declared async so FastAPI runs them inline on the event loop rather than
+# dispatching each request's auth check to the threadpool; verification
+# is a cache lookup on the hot path.
+async def get_current_user_id(authorization: str = Header(None)) -> Optional[str]:
     """
     Extract the MongoDB user‐id from the JWT *if* a valid token is present.
     Returns None when no token is supplied (allows unauthenticated access).
     """
-    if not authorization:
-        return None
-
-    if not authorization.startswith("Bearer "):
+    token = _bearer_token(authorization)
+    if token is None:
         return None
 
-    token = authorization[7:]
     payload = verify_token(token)
     if not payload:
         return None
@@ -105,14 +178,14 @@ def get_current_user_id(authorization: str = Header(None)) -> Optional[str]:
     return payload.get("sub")
 
 
-def require_auth(authorization: str = Header(...)) -> str:
+async def require_auth(authorization: str = Header(...)) -> str:
     """
     Strict variant — raises 401 when no valid token is present.
     """
-    if not authorization or not authorization.startswith("Bearer "):
+    token = _bearer_token(authorization)
+    if token is None:
         raise HTTPException(status_code=401, detail="Authorization header required")
 
-    token = authorization[7:]
     payload = verify_token(token)
     if not payload:
         raise HTTPException(status_code=401, detail="Invalid or expired token")
@@ -0,0 +1,41 @@
+"""
+Shared FastAPI dependencies for the cultivator endpoints.
+
+Handlers declare ``Depends(current_user)`` or ``Depends(current_interviewer)``
+instead of resolving the user themselves; FastAPI evaluates each dependency
+once per request, so the user lookup is never repeated within a request.
+"""
+
+from bson import ObjectId
+from fastapi import Depends, HTTPException
+
+from auth_utils import require_auth
+from cultivator.core.database import get_db
+
+# Only the fields the endpoints read off the resolved user
+USER_PROJECTION = {"username": 1, "role": 1}
+
+
+async def get_current_user(user_id: str) -> dict:
+    """Resolve authenticated user data for role and username checks."""
+    db = get_db()
+    user = await db.users.find_one({"_id": ObjectId(user_id)}, USER_PROJECTION)
+    if not user:
+        raise HTTPException(status_code=401, detail="User not found")
+    return {
+        "sub": user_id,
+        "username": user.get("username", "unknown"),
+        "role": user.get("role", "client"),
+    }
+
+
+async def current_user(user_id: str = Depends(require_auth)) -> dict:
+    """Dependency: the authenticated user."""
+    return await get_current_user(user_id)
+
+
+async def current_interviewer(user: dict = Depends(current_user)) -> dict:
+    """Dependency: the authenticated user, who must be an interviewer."""
+    if user["role"] != "interviewer":
+        raise HTTPException(status_code=403, detail="Only interviewer can access this endpoint")
+    return user
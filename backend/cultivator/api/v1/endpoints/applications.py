@@ -3,14 +3,17 @@ Job application endpoints.
 Allows clients to apply for jobs and admin to manage applications.
 """
 
+import asyncio
 from datetime import datetime, timezone
 from bson import ObjectId
 from fastapi import APIRouter, HTTPException, Depends, Query
+from pymongo.errors import DuplicateKeyError
 from typing import Optional
 
 from cultivator.core.database import get_db
 from cultivator.core.logging import get_logger
-from auth_utils import require_auth
+from cultivator.api.deps import current_user
+from cultivator.utils.ids import parse_object_id
 from cultivator.schemas.application import (
     ApplicationCreate,
     ApplicationStatusUpdate,
@@ -22,18 +25,18 @@ from cultivator.services.admin_assignment import get_today_colombo_date_str, ass
 logger = get_logger(__name__)
 router = APIRouter(prefix="/applications", tags=["Applications"])
 
-
-async def get_current_user(user_id: str) -> dict:
-    """Resolve authenticated user data for role and username checks."""
-    db = get_db()
-    user = await db.users.find_one({"_id": ObjectId(user_id)})
-    if not user:
-        raise HTTPException(status_code=401, detail="User not found")
-    return {
-        "sub": user_id,
-        "username": user.get("username", "unknown"),
-        "role": user.get("role", "client"),
-    }
+# Fields read by application_to_response
+APPLICATION_PROJECTION = {
+    "jobId": 1,
+    "applicantUserId": 1,
+    "applicantName": 1,
+    "applicantDistrict": 1,
+    "workType": 1,
+    "availability": 1,
+    "status": 1,
+    "createdAt": 1,
+    "updatedAt": 1,
+}
 
 
 def application_to_response(app: dict) -> ApplicationResponse:
@@ -53,31 +56,27 @@ def application_to_response(app: dict) -> ApplicationResponse:
 
 
 @router.post("/", response_model=ApplicationResponse)
-async def apply_to_job(data: ApplicationCreate, user_id: str = Depends(require_auth)):
+async def apply_to_job(data: ApplicationCreate, user: dict = Depends(current_user)):
     """Apply to a job. Only clients can apply."""
-    user = await get_current_user(user_id)
-    
     if user["role"] != "client":
         raise HTTPException(status_code=403, detail="Only clients can apply to jobs")
     
     db = get_db()
     
-    # Check if job exists
-    job = await db.jobs.find_one({"_id": ObjectId(data.jobId)})
+    # Fetch the job and applicant profile concurrently (one round-trip of latency)
+    job, user_doc = await asyncio.gather(
+        db.jobs.find_one(
+            {"_id": parse_object_id(data.jobId, "job")},
+            {"title": 1, "startsOnText": 1},
+        ),
+        db.users.find_one(
+            {"_id": ObjectId(user["sub"])},
+            {"fullName": 1, "address": 1},
+        ),
+    )
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    # Check if already applied
-    existing = await db.job_applications.find_one({
-        "jobId": data.jobId,
-        "applicantUserId": user["sub"],
-    })
-    if existing:
-        raise HTTPException(status_code=400, detail="Already applied to this job")
-    
-    # Get user info from users collection
-    user_doc = await db.users.find_one({"_id": ObjectId(user["sub"])})
-    
     now = datetime.now(timezone.utc)
     
     app_doc = {
@@ -92,7 +91,11 @@ async def apply_to_job(data: ApplicationCreate, user_id: str = Depends(require_a
         "updatedAt": now,
     }
     
-    result = await db.job_applications.insert_one(app_doc)
+    # The unique (jobId, applicantUserId) index rejects repeat applications
+    try:
+        result = await db.job_applications.insert_one(app_doc)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="Already applied to this job")
     app_doc["_id"] = result.inserted_id
     
     # Create CallTask for automated follow-up
@@ -121,11 +124,9 @@ async def apply_to_job(data: ApplicationCreate, user_id: str = Depends(require_a
 @router.get("/", response_model=ApplicationListResponse)
 async def get_applications(
     status: Optional[str] = Query(None),
-    user_id: str = Depends(require_auth)
+    user: dict = Depends(current_user)
 ):
     """Get all applications. Interviewer sees all, clients see their own."""
-    user = await get_current_user(user_id)
-    
     db = get_db()
     
     query = {}
@@ -135,11 +136,15 @@ async def get_applications(
     if status:
         query["status"] = status
     
-    cursor = db.job_applications.find(query).sort("createdAt", -1)
-    applications = await cursor.to_list(length=200)
+    cursor = (
+        db.job_applications.find(query, APPLICATION_PROJECTION)
+        .sort("createdAt", -1)
+        .limit(200)
+    )
+    applications = [application_to_response(app) async for app in cursor]
     
     return ApplicationListResponse(
-        applications=[application_to_response(app) for app in applications],
+        applications=applications,
         total=len(applications),
     )
 
@@ -148,18 +153,16 @@ async def get_applications(
 async def update_application_status(
     application_id: str,
     data: ApplicationStatusUpdate,
-    user_id: str = Depends(require_auth)
+    user: dict = Depends(current_user)
 ):
     """Update application status. Only interviewer can update."""
-    user = await get_current_user(user_id)
-    
     if user["role"] != "interviewer":
         raise HTTPException(status_code=403, detail="Only interviewer can update application status")
     
     db = get_db()
     
     result = await db.job_applications.update_one(
-        {"_id": ObjectId(application_id)},
+        {"_id": parse_object_id(application_id, "application")},
         {"$set": {"status": data.status, "updatedAt": datetime.now(timezone.utc)}}
     )
     
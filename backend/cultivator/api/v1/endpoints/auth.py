@@ -3,9 +3,11 @@ Authentication endpoints.
 Simple register and login functionality.
 """
 
+import asyncio
 from datetime import datetime, timezone
 from bson import ObjectId
 from fastapi import APIRouter, HTTPException, Depends
+from pymongo.errors import DuplicateKeyError
 
 from cultivator.core.database import get_db
 from cultivator.core.logging import get_logger
@@ -47,19 +49,8 @@ async def register(data: UserRegister):
         logger.error("[REGISTER] Database connection is not available")
         raise HTTPException(status_code=503, detail="Database connection unavailable")
     
-    # Check if username exists
-    logger.debug(f"[REGISTER] Checking if username exists: {data.username}")
-    existing = await db.users.find_one({"username": data.username})
-    if existing:
-        logger.warning(f"[REGISTER] Username already exists: {data.username}")
-        raise HTTPException(status_code=400, detail="Username already exists")
-    
-    # Check if email exists
-    logger.debug(f"[REGISTER] Checking if email exists: {data.email}")
-    existing = await db.users.find_one({"email": data.email})
-    if existing:
-        logger.warning(f"[REGISTER] Email already exists: {data.email}")
-        raise HTTPException(status_code=400, detail="Email already exists")
+    # bcrypt is deliberately slow; hash off the event loop
+    password_hash = await asyncio.to_thread(hash_password, data.password)
     
     now = datetime.now(timezone.utc)
     user_doc = {
@@ -69,13 +60,25 @@ async def register(data: UserRegister):
         "address": data.address,
         "age": data.age,
         "role": normalized_role,
-        "passwordHash": hash_password(data.password),
+        "passwordHash": password_hash,
+        "unreadNotifications": 0,
         "createdAt": now,
         "updatedAt": now,
     }
     
+    # Unique indexes on username/email reject duplicates atomically, so there
+    # is no separate existence check (and no race between check and insert).
     logger.debug(f"[REGISTER] Inserting new user: {data.username}")
-    await db.users.insert_one(user_doc)
+    try:
+        await db.users.insert_one(user_doc)
+    except DuplicateKeyError as e:
+        key_pattern = (e.details or {}).get("keyPattern") or {}
+        if "email" in key_pattern:
+            logger.warning(f"[REGISTER] Email already exists: {data.email}")
+            raise HTTPException(status_code=400, detail="Email already exists")
+        logger.warning(f"[REGISTER] Username already exists: {data.username}")
+        raise HTTPException(status_code=400, detail="Username already exists")
+    
     logger.info(f"[REGISTER] User registered successfully: {data.username} (role: {normalized_role})")
     
     return MessageResponse(success=True, message="Registration successful. Please login.")
@@ -103,7 +106,8 @@ async def login(data: UserLogin):
     
     # Verify password
     logger.debug(f"[LOGIN] Verifying password for user: {data.username}")
-    if not verify_password(data.password, user["passwordHash"]):
+    password_ok = await asyncio.to_thread(verify_password, data.password, user["passwordHash"])
+    if not password_ok:
         logger.warning(f"[LOGIN] Invalid password for user: {data.username}")
         raise HTTPException(status_code=401, detail="Invalid username or password")
     
@@ -6,12 +6,12 @@ Admin-only endpoints for managing call tasks.
 from datetime import datetime, timezone
 from typing import List
 
-from bson import ObjectId
 from fastapi import APIRouter, HTTPException, Depends
 
 from cultivator.core.database import get_db
 from cultivator.core.logging import get_logger
-from auth_utils import require_auth
+from cultivator.api.deps import current_interviewer
+from cultivator.utils.ids import parse_object_id
 from cultivator.schemas.call_task import CallTaskOut
 from cultivator.services.admin_assignment import assign_or_queue_call_task, get_today_colombo_date_str
 
@@ -19,24 +19,14 @@ logger = get_logger(__name__)
 router = APIRouter(prefix="/call-tasks", tags=["Call Tasks"])
 
 
-async def get_interviewer_user(user_id: str) -> dict:
-    """Resolve authenticated interviewer from user id."""
-    db = get_db()
-    user = await db.users.find_one({"_id": ObjectId(user_id)})
-    if not user:
-        raise HTTPException(status_code=401, detail="User not found")
-    if user.get("role") != "interviewer":
-        raise HTTPException(status_code=403, detail="Only interviewer can access this endpoint")
-    return {
-        "sub": user_id,
-        "username": user.get("username", "interviewer"),
-        "role": user.get("role"),
-    }
-
-
 def call_task_to_response(task: dict) -> CallTaskOut:
-    """Convert MongoDB call task to response."""
-    return CallTaskOut(
+    """
+    Convert MongoDB call task to response.
+    
+    apply_to_job writes every field of a call task, already typed, so the
+    model is built with model_construct rather than re-validated.
+    """
+    return CallTaskOut.model_construct(
         id=str(task["_id"]),
         jobId=task["jobId"],
         clientId=task["clientId"],
@@ -50,9 +40,8 @@ def call_task_to_response(task: dict) -> CallTaskOut:
 
 
 @router.get("/admin/today", response_model=List[CallTaskOut])
-async def get_today_tasks(user_id: str = Depends(require_auth)):
+async def get_today_tasks(admin: dict = Depends(current_interviewer)):
     """Get today's assigned tasks for current interviewer."""
-    admin = await get_interviewer_user(user_id)
     db = get_db()
 
     today = get_today_colombo_date_str()
@@ -71,10 +60,9 @@ async def get_today_tasks(user_id: str = Depends(require_auth)):
 async def update_task_status(
     task_id: str,
     status: str,
-    user_id: str = Depends(require_auth)
+    admin: dict = Depends(current_interviewer)
 ):
     """Update call task status."""
-    admin = await get_interviewer_user(user_id)
     db = get_db()
 
     # Validate status transition
@@ -83,33 +71,44 @@ async def update_task_status(
         "IN_PROGRESS": ["COMPLETED", "CANCELLED"],
     }
 
-    task = await db.call_tasks.find_one({"_id": ObjectId(task_id)})
-    if not task:
-        raise HTTPException(status_code=404, detail="Call task not found")
+    task_oid = parse_object_id(task_id, "call task")
+    from_statuses = [
+        current for current, targets in allowed_transitions.items() if status in targets
+    ]
+
+    # Fast path: check ownership and transition in the update filter itself
+    result = await db.call_tasks.update_one(
+        {
+            "_id": task_oid,
+            "assignedAdminId": admin["sub"],
+            "status": {"$in": from_statuses},
+        },
+        {"$set": {"status": status, "updatedAt": datetime.now(timezone.utc)}}
+    )
+    if result.matched_count == 0:
+        # Slow path: work out which precondition failed
+        task = await db.call_tasks.find_one(
+            {"_id": task_oid}, {"assignedAdminId": 1, "status": 1}
+        )
+        if not task:
+            raise HTTPException(status_code=404, detail="Call task not found")
 
-    if task["assignedAdminId"] != admin["sub"]:
-        raise HTTPException(status_code=403, detail="Task not assigned to you")
+        if task["assignedAdminId"] != admin["sub"]:
+            raise HTTPException(status_code=403, detail="Task not assigned to you")
 
-    current_status = task["status"]
-    if status not in allowed_transitions.get(current_status, []):
+        current_status = task["status"]
         raise HTTPException(
             status_code=400,
             detail=f"Invalid status transition from {current_status} to {status}"
         )
 
-    await db.call_tasks.update_one(
-        {"_id": ObjectId(task_id)},
-        {"$set": {"status": status, "updatedAt": datetime.now(timezone.utc)}}
-    )
-
     logger.info(f"Call task {task_id} status updated to {status} by interviewer {admin['username']}")
     return {"message": f"Task status updated to {status}"}
 
 
 @router.post("/retry-queued")
-async def retry_queued_tasks(user_id: str = Depends(require_auth)):
+async def retry_queued_tasks(admin: dict = Depends(current_interviewer)):
     """Retry assigning queued tasks for today."""
-    admin = await get_interviewer_user(user_id)
     db = get_db()
 
     today = get_today_colombo_date_str()
@@ -9,6 +9,7 @@ Agora Integration:
 """
 
 import os
+import shutil
 import time
 import uuid
 import asyncio
@@ -17,19 +18,36 @@ import hashlib
 import json
 import io
 import wave
+from contextlib import suppress
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Set, Union
 
 import numpy as np
 
 from bson import ObjectId
-from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form, BackgroundTasks
+from fastapi import (
+    APIRouter,
+    HTTPException,
+    Depends,
+    UploadFile,
+    File,
+    Form,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
+from pymongo import ReturnDocument, WriteConcern
+from pymongo.errors import OperationFailure
 
 from cultivator.core.database import get_db
 from cultivator.core.config import get_settings
 from cultivator.core.logging import get_logger
-from auth_utils import require_auth
+from cultivator.utils.ids import parse_object_id
+from cultivator.utils.uploads import save_upload_file
+from auth_utils import verify_token
+from cultivator.api.deps import current_user, get_current_user
 from cultivator.schemas.call import (
     CallInitiate,
     CallInitiateResponse,
@@ -42,9 +60,14 @@ from cultivator.schemas.call import (
     StartRecordingResponse,
     StopRecordingResponse,
 )
-from cultivator.services.inference import get_classifier
+from cultivator.services.inference import (
+    get_classifier,
+    decode_audio,
+    estimate_active_speech_seconds,
+)
 from cultivator.services.agora import (
     generate_agora_token,
+    generate_agora_tokens,
     get_agora_app_id,
     get_cloud_recording,
     RtcTokenRole,
@@ -57,25 +80,42 @@ router = APIRouter(prefix="/calls", tags=["Calls"])
 CALL_TIMEOUT_SECONDS = 120
 STALE_ACCEPTED_CALL_SECONDS = 15 * 60
 
+# How often the lifespan-managed sweeper marks timed-out calls as missed
+MISSED_CALL_SWEEP_SECONDS = 10
+_missed_call_sweep_lock = asyncio.Lock()
+
+# Open /incoming/ws sockets per client user id. initiate_call pushes to
+# sockets on its own worker; one change stream per process on new ringing
+# calls covers calls initiated on other workers
+INCOMING_CALL_QUEUE_SIZE = 8
+INCOMING_CALL_WATCH_RETRY_SECONDS = 30
+INCOMING_CALL_WATCH_PIPELINE = [
+    {"$match": {"operationType": "insert", "fullDocument.status": "ringing"}},
+]
+_incoming_call_waiters: Dict[str, Set[asyncio.Queue]] = {}
+
+# /incoming/ws authentication: either the subprotocol pair
+# ("bearer", <token>) or a first message {"token": <token>} within the timeout.
+# The token never goes in the URL, where proxies and access logs record it.
+WS_AUTH_SUBPROTOCOL = "bearer"
+WS_AUTH_TIMEOUT_SECONDS = 10
+
+# Call-state transitions only need the primary's acknowledgement; recording
+# analysis writes keep the client's default (durable) write concern
+CALL_STATE_WRITE_CONCERN = WriteConcern(w=1, j=False)
+
 # UID ranges for Agora (to distinguish admin, client, recording bot)
 ADMIN_UID_BASE = 1000
 CLIENT_UID_BASE = 2000
 RECORDING_UID_BASE = 9000
 
 
-async def get_current_user(user_id: str) -> dict:
-    """Resolve authenticated user data for role and username checks."""
-    db = get_db()
-    user = await db.users.find_one({"_id": ObjectId(user_id)})
-    if not user:
-        raise HTTPException(status_code=401, detail="User not found")
-    return {
-        "sub": user_id,
-        "username": user.get("username", "unknown"),
-        "role": user.get("role", "client"),
-    }
+def _calls_for_state_changes(db):
+    """Calls collection handle using the lighter call-state write concern."""
+    return db.calls.with_options(write_concern=CALL_STATE_WRITE_CONCERN)
 
 
+@lru_cache(maxsize=4096)
 def generate_uid_from_user_id(user_id: str, base: int) -> int:
     """Generate a consistent Agora UID from a user ID string."""
     # Create a hash of the user_id and take last 8 digits
@@ -111,8 +151,31 @@ async def check_missed_calls():
         logger.info(f"Marked {result.modified_count} calls as missed")
 
 
-def _inspect_audio_payload(audio_bytes: bytes) -> dict:
-    """Inspect raw audio bytes and extract basic diagnostics."""
+async def run_missed_call_sweeper(interval_seconds: float = MISSED_CALL_SWEEP_SECONDS) -> None:
+    """
+    Periodically mark timed-out calls as missed.
+    
+    Started once from the application lifespan and cancelled on shutdown,
+    so the sweep runs once per interval regardless of call volume.
+    """
+    while True:
+        if not _missed_call_sweep_lock.locked():
+            async with _missed_call_sweep_lock:
+                try:
+                    if get_db() is not None:
+                        await check_missed_calls()
+                except Exception as e:
+                    logger.warning(f"Missed-call sweep failed: {e}")
+        await asyncio.sleep(interval_seconds)
+
+
+def _to_object_id_expr(field: str) -> dict:
+    """Aggregation expression converting a string id field to ObjectId (null if invalid)."""
+    return {"$convert": {"input": field, "to": "objectId", "onError": None, "onNull": None}}
+
+
+def _inspect_audio_payload(audio_source: Union[bytes, str, Path]) -> dict:
+    """Inspect raw audio bytes (or a WAV file path) and extract basic diagnostics."""
     diagnostics = {
         "duration_seconds": 0.0,
         "sample_rate": 0,
@@ -122,7 +185,8 @@ def _inspect_audio_payload(audio_bytes: bytes) -> dict:
     }
 
     try:
-        with wave.open(io.BytesIO(audio_bytes), "rb") as wav_file:
+        source = io.BytesIO(audio_source) if isinstance(audio_source, (bytes, bytearray)) else str(audio_source)
+        with wave.open(source, "rb") as wav_file:
             frames = wav_file.getnframes()
             sample_rate = wav_file.getframerate()
             channels = wav_file.getnchannels()
@@ -144,14 +208,13 @@ def _inspect_audio_payload(audio_bytes: bytes) -> dict:
 @router.post("/initiate", response_model=CallInitiateResponse)
 async def initiate_call(
     data: CallInitiate,
-    background_tasks: BackgroundTasks,
-    user_id: str = Depends(require_auth)
+    user: dict = Depends(current_user)
 ):
     """
     Initiate a call to a client using Agora RTC.
     Allowed roles: interviewer, admin.
     """
-    user = await get_current_user(user_id)
+    job_oid = parse_object_id(data.jobId, "job")
     
     # Allow both interviewer and admin because frontend uses admin call flow.
     if user["role"] not in ["interviewer", "admin"]:
@@ -160,8 +223,15 @@ async def initiate_call(
     db = get_db()
     settings = get_settings()
     
-    # Get the job to find the client
-    job = await db.jobs.find_one({"_id": ObjectId(data.jobId)})
+    # Get the job to find the client, and the job's active calls for the
+    # opportunistic cleanup below; the two reads are independent
+    job, active_calls = await asyncio.gather(
+        db.jobs.find_one({"_id": job_oid}, {"createdByUserId": 1, "title": 1}),
+        db.calls.find(
+            {"jobId": job_oid, "status": {"$in": ["ringing", "accepted"]}},
+            {"status": 1, "startedAt": 1, "updatedAt": 1, "createdAt": 1},
+        ).to_list(length=20),
+    )
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
@@ -170,10 +240,6 @@ async def initiate_call(
     now = datetime.now(timezone.utc)
 
     # Opportunistic cleanup to prevent stale calls from blocking new sessions.
-    active_calls = await db.calls.find({
-        "jobId": data.jobId,
-        "status": {"$in": ["ringing", "accepted"]}
-    }).to_list(length=20)
 
     for active_call in active_calls:
         status = active_call.get("status")
@@ -220,10 +286,10 @@ async def initiate_call(
                 logger.info(f"[CALL-CLEANUP] Auto-ended stale accepted call: {call_id}, age={age_seconds}s")
 
     # Final guard: block only if a truly active call still exists.
-    existing_call = await db.calls.find_one({
-        "jobId": data.jobId,
-        "status": {"$in": ["ringing", "accepted"]}
-    })
+    existing_call = await db.calls.find_one(
+        {"jobId": job_oid, "status": {"$in": ["ringing", "accepted"]}},
+        {"status": 1},
+    )
     if existing_call:
         raise HTTPException(
             status_code=400,
@@ -231,7 +297,8 @@ async def initiate_call(
         )
     
     # Create unique channel name for Agora
-    call_id = str(ObjectId())
+    call_oid = ObjectId()
+    call_id = str(call_oid)
     channel_name = f"job_{data.jobId[:8]}_{call_id[:8]}"
     
     # Generate UIDs for participants
@@ -241,15 +308,9 @@ async def initiate_call(
     
     # Generate Agora RTC tokens
     try:
-        admin_token = generate_agora_token(
+        admin_token, client_token = generate_agora_tokens(
             channel_name=channel_name,
-            uid=admin_uid,
-            role=RtcTokenRole.PUBLISHER,
-            expire_seconds=3600
-        )
-        client_token = generate_agora_token(
-            channel_name=channel_name,
-            uid=client_uid,
+            uids=(admin_uid, client_uid),
             role=RtcTokenRole.PUBLISHER,
             expire_seconds=3600
         )
@@ -266,8 +327,8 @@ async def initiate_call(
     
     # Create call record
     call_doc = {
-        "_id": ObjectId(call_id),
-        "jobId": data.jobId,
+        "_id": call_oid,
+        "jobId": job_oid,
         "adminUserId": user["sub"],
         "clientUserId": client_user_id,
         "channelName": channel_name,
@@ -288,11 +349,23 @@ async def initiate_call(
     
     await db.calls.insert_one(call_doc)
     
-    # Schedule background task to check for missed calls
-    background_tasks.add_task(check_missed_calls)
-    
     logger.info(f"Call initiated: {call_id} for job {data.jobId} via Agora channel {channel_name}")
 
+    # Ring the client over its socket, if connected; polling picks it up otherwise
+    if client_user_id in _incoming_call_waiters:
+        _notify_incoming_call(
+            client_user_id,
+            _incoming_call_payload(
+                call_id=call_id,
+                job_id=data.jobId,
+                job_title=job.get("title", "Unknown Job"),
+                admin_username=user["username"],
+                channel_name=channel_name,
+                client_token=client_token,
+                client_uid=client_uid,
+            ),
+        )
+
     # PHASE 2: Backend API response logging
     starts_with_006 = admin_token.startswith('006')
     print(f"[AGORA-BACKEND-RESPONSE] channel={channel_name} uid={admin_uid} prefix={admin_token[:10]} length={len(admin_token)} starts_with_006={starts_with_006}")
@@ -326,39 +399,16 @@ async def initiate_call(
     )
 
 
-@router.get("/incoming", response_model=IncomingCallResponse)
-async def check_incoming_call(
-    user_id: str = Depends(require_auth)
-):
-    """
-    Check if there's an incoming call for the current client.
-    Called by client polling.
-    """
-    user = await get_current_user(user_id)
-    client_user_id = user["sub"]
-    
-    db = get_db()
-    
-    # Find a ringing call for this client
-    call = await db.calls.find_one({
-        "clientUserId": client_user_id,
-        "status": "ringing"
-    })
-    
-    if not call:
-        return IncomingCallResponse(hasIncomingCall=False)
-    
-    # Get job details for context
-    job = await db.jobs.find_one({"_id": ObjectId(call["jobId"])})
-    job_title = job.get("title", "Unknown Job") if job else "Unknown Job"
-    
-    # Get admin username
-    admin_user = await db.users.find_one({"_id": ObjectId(call["adminUserId"])})
-    admin_username = admin_user.get("username", "Admin") if admin_user else "Admin"
-    
-    # Get Agora connection info
-    channel_name = call.get("channelName", call.get("roomName", ""))
-    client_uid = call.get("clientUid", 0)
+def _incoming_call_payload(
+    call_id: str,
+    job_id: str,
+    job_title: str,
+    admin_username: str,
+    channel_name: str,
+    client_token: str,
+    client_uid: int,
+) -> IncomingCallResponse:
+    """Build the incoming-call response shared by polling and push delivery."""
     try:
         agora_app_id = get_agora_app_id()
     except RuntimeError as exc:
@@ -366,14 +416,14 @@ async def check_incoming_call(
     
     return IncomingCallResponse(
         hasIncomingCall=True,
-        callId=str(call["_id"]),
-        jobId=call["jobId"],
+        callId=call_id,
+        jobId=job_id,
         jobTitle=job_title,
         adminUsername=admin_username,
         agora=AgoraTokenInfo(
             appId=agora_app_id,
             channelName=channel_name,
-            token=call.get("clientToken", ""),
+            token=client_token,
             uid=client_uid,
         ),
         # Legacy fields
@@ -382,45 +432,268 @@ async def check_incoming_call(
     )
 
 
+async def _find_incoming_call(
+    client_user_id: str,
+    call_oid: Optional[ObjectId] = None,
+) -> IncomingCallResponse:
+    """Look up the ringing call (if any) for a client, optionally a specific one."""
+    db = get_db()
+    
+    query = {"clientUserId": client_user_id, "status": "ringing"}
+    if call_oid is not None:
+        query["_id"] = call_oid
+    
+    # Find a ringing call for this client together with the job title and
+    # admin username in one round-trip (this endpoint is polled by clients)
+    calls = await db.calls.aggregate([
+        {"$match": query},
+        {"$limit": 1},
+        {"$lookup": {
+            "from": "jobs",
+            "let": {"jid": "$jobId"},
+            "pipeline": [
+                {"$match": {"$expr": {"$eq": ["$_id", "$$jid"]}}},
+                {"$project": {"title": 1}},
+            ],
+            "as": "job",
+        }},
+        {"$lookup": {
+            "from": "users",
+            "let": {"aid": _to_object_id_expr("$adminUserId")},
+            "pipeline": [
+                {"$match": {"$expr": {"$eq": ["$_id", "$$aid"]}}},
+                {"$project": {"username": 1}},
+            ],
+            "as": "admin",
+        }},
+        {"$project": {
+            "jobId": 1,
+            "channelName": 1,
+            "roomName": 1,
+            "clientUid": 1,
+            "clientToken": 1,
+            "job.title": 1,
+            "admin.username": 1,
+        }},
+    ]).to_list(length=1)
+    
+    if not calls:
+        return IncomingCallResponse(hasIncomingCall=False)
+    call = calls[0]
+    
+    # Job details for context
+    job = call["job"][0] if call.get("job") else None
+    job_title = job.get("title", "Unknown Job") if job else "Unknown Job"
+    
+    # Admin username
+    admin_user = call["admin"][0] if call.get("admin") else None
+    admin_username = admin_user.get("username", "Admin") if admin_user else "Admin"
+    
+    return _incoming_call_payload(
+        call_id=str(call["_id"]),
+        job_id=str(call["jobId"]),
+        job_title=job_title,
+        admin_username=admin_username,
+        channel_name=call.get("channelName", call.get("roomName", "")),
+        client_token=call.get("clientToken", ""),
+        client_uid=call.get("clientUid", 0),
+    )
+
+
+def _notify_incoming_call(client_user_id: str, payload: IncomingCallResponse) -> None:
+    """Push a new ringing call to the client's open /incoming/ws sockets."""
+    message = payload.model_dump(mode="json")
+    for queue in _incoming_call_waiters.get(client_user_id, ()):
+        try:
+            queue.put_nowait(message)
+        except asyncio.QueueFull:
+            logger.warning(f"Incoming-call queue full for client {client_user_id}; dropping push")
+
+
+async def run_incoming_call_watcher() -> None:
+    """
+    Push calls initiated on any worker to this process's /incoming/ws sockets.
+    
+    Started once from the application lifespan and cancelled on shutdown.
+    Only inserts of ringing calls for a client with an open socket here cost
+    a lookup. Change streams need a replica set; on a standalone server the
+    watcher stops and clients on other workers fall back to GET /incoming.
+    """
+    resume_token = None
+    while True:
+        db = get_db()
+        if db is None:
+            await asyncio.sleep(INCOMING_CALL_WATCH_RETRY_SECONDS)
+            continue
+        try:
+            async with db.calls.watch(
+                INCOMING_CALL_WATCH_PIPELINE,
+                resume_after=resume_token,
+            ) as stream:
+                async for change in stream:
+                    resume_token = stream.resume_token
+                    call = change["fullDocument"]
+                    client_user_id = call.get("clientUserId")
+                    if client_user_id not in _incoming_call_waiters:
+                        continue
+                    payload = await _find_incoming_call(client_user_id, call["_id"])
+                    if payload.hasIncomingCall:
+                        _notify_incoming_call(client_user_id, payload)
+        except OperationFailure as e:
+            if e.code == 40573:  # $changeStream needs a replica set
+                logger.warning("Change streams unavailable; incoming-call push is per worker only")
+                return
+            logger.warning(f"Incoming-call watcher failed: {e}")
+            resume_token = None
+        except Exception as e:
+            logger.warning(f"Incoming-call watcher failed: {e}")
+        await asyncio.sleep(INCOMING_CALL_WATCH_RETRY_SECONDS)
+
+
+@router.get("/incoming", response_model=IncomingCallResponse)
+async def check_incoming_call(
+    user: dict = Depends(current_user)
+):
+    """
+    Check if there's an incoming call for the current client.
+    Polling fallback for clients without the /incoming/ws socket.
+    """
+    return await _find_incoming_call(user["sub"])
+
+
+async def _authenticate_socket(websocket: WebSocket) -> Optional[str]:
+    """Accept the socket and return the authenticated user id, or None."""
+    subprotocols = websocket.scope.get("subprotocols") or []
+    if len(subprotocols) >= 2 and subprotocols[0] == WS_AUTH_SUBPROTOCOL:
+        token = subprotocols[1]
+        await websocket.accept(subprotocol=WS_AUTH_SUBPROTOCOL)
+    else:
+        await websocket.accept()
+        try:
+            message = await asyncio.wait_for(websocket.receive_json(), WS_AUTH_TIMEOUT_SECONDS)
+        except (asyncio.TimeoutError, WebSocketDisconnect, ValueError):
+            return None
+        token = message.get("token") if isinstance(message, dict) else None
+    
+    payload = verify_token(token) if isinstance(token, str) else None
+    return payload.get("sub") if payload else None
+
+
+@router.websocket("/incoming/ws")
+async def incoming_call_socket(websocket: WebSocket):
+    """
+    Push incoming calls to the client as they are initiated.
+    
+    Browsers cannot set an Authorization header on a WebSocket, so the
+    bearer token is sent either as the subprotocol pair ``("bearer", token)``
+    or as a first message ``{"token": ...}``. Any call already ringing when
+    the socket opens is sent immediately. Calls initiated on another worker
+    arrive through run_incoming_call_watcher; without change streams those
+    clients rely on GET /incoming.
+    """
+    user_id = await _authenticate_socket(websocket)
+    user = None
+    if user_id:
+        try:
+            user = await get_current_user(user_id)
+        except HTTPException:
+            pass
+    if user is None:
+        with suppress(RuntimeError, WebSocketDisconnect):
+            await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    client_user_id = user["sub"]
+    
+    queue: asyncio.Queue = asyncio.Queue(maxsize=INCOMING_CALL_QUEUE_SIZE)
+    _incoming_call_waiters.setdefault(client_user_id, set()).add(queue)
+    
+    # The client only sends keepalives; reading them is how a disconnect
+    # is noticed while waiting on the queue
+    async def _wait_for_disconnect() -> None:
+        with suppress(WebSocketDisconnect):
+            while True:
+                await websocket.receive_text()
+    
+    # A call from this worker arrives both as a direct push and from the
+    # change stream; send it once
+    last_sent_call_id = None
+    
+    async def _send_call(message: dict) -> None:
+        nonlocal last_sent_call_id
+        if message.get("callId") == last_sent_call_id:
+            return
+        last_sent_call_id = message.get("callId")
+        await websocket.send_json(message)
+    
+    disconnected = asyncio.create_task(_wait_for_disconnect())
+    next_call = None
+    try:
+        pending = await _find_incoming_call(client_user_id)
+        if pending.hasIncomingCall:
+            await _send_call(pending.model_dump(mode="json"))
+        
+        next_call = asyncio.create_task(queue.get())
+        while True:
+            done, _ = await asyncio.wait(
+                {next_call, disconnected},
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if disconnected in done:
+                break
+            await _send_call(next_call.result())
+            next_call = asyncio.create_task(queue.get())
+    except WebSocketDisconnect:
+        pass
+    finally:
+        disconnected.cancel()
+        if next_call is not None:
+            next_call.cancel()
+        waiters = _incoming_call_waiters.get(client_user_id)
+        if waiters is not None:
+            waiters.discard(queue)
+            if not waiters:
+                del _incoming_call_waiters[client_user_id]
+
+
 @router.post("/{call_id}/accept", response_model=CallAcceptResponse)
 async def accept_call(
     call_id: str,
-    user_id: str = Depends(require_auth)
+    user: dict = Depends(current_user)
 ):
     """
     Accept an incoming call and join the Agora channel.
     Only the target client can accept.
     """
-    user = await get_current_user(user_id)
+    call_oid = parse_object_id(call_id, "call")
     
     db = get_db()
     
-    # Find the call
-    call = await db.calls.find_one({"_id": ObjectId(call_id)})
-    if not call:
-        raise HTTPException(status_code=404, detail="Call not found")
-    
-    # Verify this is the target client
-    if call["clientUserId"] != user["sub"]:
-        raise HTTPException(status_code=403, detail="You cannot accept this call")
-    
-    # Verify call is still ringing
-    if call["status"] != "ringing":
-        raise HTTPException(status_code=400, detail=f"Call is not ringing (status: {call['status']})")
-    
     now = datetime.now(timezone.utc)
     
-    # Update call status
-    await db.calls.update_one(
-        {"_id": ObjectId(call_id)},
+    # Ownership/state checks and the transition happen atomically, so two
+    # accepts racing on the same call cannot both succeed
+    call = await _calls_for_state_changes(db).find_one_and_update(
+        {"_id": call_oid, "clientUserId": user["sub"], "status": "ringing"},
         {
             "$set": {
                 "status": "accepted",
                 "startedAt": now,
                 "updatedAt": now,
             }
-        }
+        },
+        projection={"channelName": 1, "roomName": 1, "clientUid": 1, "clientToken": 1},
+        return_document=ReturnDocument.AFTER,
     )
+    if call is None:
+        # Slow path: work out which precondition failed
+        current = await db.calls.find_one(
+            {"_id": call_oid}, {"clientUserId": 1, "status": 1}
+        )
+        if not current:
+            raise HTTPException(status_code=404, detail="Call not found")
+        if current["clientUserId"] != user["sub"]:
+            raise HTTPException(status_code=403, detail="You cannot accept this call")
+        raise HTTPException(status_code=400, detail=f"Call is not ringing (status: {current['status']})")
     
     logger.info(f"Call accepted: {call_id}")
     
@@ -454,41 +727,39 @@ async def accept_call(
 @router.post("/{call_id}/reject")
 async def reject_call(
     call_id: str,
-    user_id: str = Depends(require_auth)
+    user: dict = Depends(current_user)
 ):
     """
     Reject an incoming call.
     Only the target client can reject.
     """
-    user = await get_current_user(user_id)
+    call_oid = parse_object_id(call_id, "call")
     
     db = get_db()
     
-    # Find the call
-    call = await db.calls.find_one({"_id": ObjectId(call_id)})
-    if not call:
-        raise HTTPException(status_code=404, detail="Call not found")
-    
-    # Verify this is the target client
-    if call["clientUserId"] != user["sub"]:
-        raise HTTPException(status_code=403, detail="You cannot reject this call")
-    
-    # Verify call is still ringing
-    if call["status"] != "ringing":
-        raise HTTPException(status_code=400, detail=f"Call is not ringing (status: {call['status']})")
-    
     now = datetime.now(timezone.utc)
     
-    # Update call status
-    await db.calls.update_one(
-        {"_id": ObjectId(call_id)},
+    # Ownership/state checks and the transition happen atomically
+    call = await _calls_for_state_changes(db).find_one_and_update(
+        {"_id": call_oid, "clientUserId": user["sub"], "status": "ringing"},
         {
             "$set": {
                 "status": "rejected",
                 "updatedAt": now,
             }
-        }
+        },
+        projection={"_id": 1},
     )
+    if call is None:
+        # Slow path: work out which precondition failed
+        current = await db.calls.find_one(
+            {"_id": call_oid}, {"clientUserId": 1, "status": 1}
+        )
+        if not current:
+            raise HTTPException(status_code=404, detail="Call not found")
+        if current["clientUserId"] != user["sub"]:
+            raise HTTPException(status_code=403, detail="You cannot reject this call")
+        raise HTTPException(status_code=400, detail=f"Call is not ringing (status: {current['status']})")
     
     logger.info(f"Call rejected: {call_id}")
     
@@ -498,46 +769,47 @@ async def reject_call(
 @router.post("/{call_id}/end")
 async def end_call(
     call_id: str,
-    user_id: str = Depends(require_auth)
+    user: dict = Depends(current_user)
 ):
     """
     End an active call.
     Either admin or client can end the call.
     """
-    user = await get_current_user(user_id)
+    call_oid = parse_object_id(call_id, "call")
     
     db = get_db()
     
-    # Find the call
-    call = await db.calls.find_one({"_id": ObjectId(call_id)})
-    if not call:
-        raise HTTPException(status_code=404, detail="Call not found")
-    
-    # Verify user is part of this call
-    if call["clientUserId"] != user["sub"] and call["adminUserId"] != user["sub"]:
-        raise HTTPException(status_code=403, detail="You are not part of this call")
-    
-    # Idempotent end: if already closed, do not fail the caller.
-    if call["status"] in ["ended", "rejected", "missed"]:
-        return {"success": True, "message": f"Call already closed (status: {call['status']})"}
-
-    # Verify call is active
-    if call["status"] not in ["ringing", "accepted"]:
-        raise HTTPException(status_code=400, detail=f"Call is not active (status: {call['status']})")
-    
     now = datetime.now(timezone.utc)
     
-    # Update call status
-    await db.calls.update_one(
-        {"_id": ObjectId(call_id)},
+    # Participant/state checks and the transition happen atomically
+    call = await _calls_for_state_changes(db).find_one_and_update(
+        {
+            "_id": call_oid,
+            "$or": [{"clientUserId": user["sub"]}, {"adminUserId": user["sub"]}],
+            "status": {"$in": ["ringing", "accepted"]},
+        },
         {
             "$set": {
                 "status": "ended",
                 "endedAt": now,
                 "updatedAt": now,
             }
-        }
+        },
+        projection={"_id": 1},
     )
+    if call is None:
+        # Slow path: work out which precondition failed
+        current = await db.calls.find_one(
+            {"_id": call_oid}, {"clientUserId": 1, "adminUserId": 1, "status": 1}
+        )
+        if not current:
+            raise HTTPException(status_code=404, detail="Call not found")
+        if current["clientUserId"] != user["sub"] and current["adminUserId"] != user["sub"]:
+            raise HTTPException(status_code=403, detail="You are not part of this call")
+        # Idempotent end: if already closed, do not fail the caller.
+        if current["status"] in ["ended", "rejected", "missed"]:
+            return {"success": True, "message": f"Call already closed (status: {current['status']})"}
+        raise HTTPException(status_code=400, detail=f"Call is not active (status: {current['status']})")
     
     logger.info(f"Call ended: {call_id}")
     
@@ -549,14 +821,14 @@ async def upload_recording(
     call_id: str,
     file: UploadFile = File(...),
     transcript: Optional[str] = Form(None),
-    user_id: str = Depends(require_auth)
+    user: dict = Depends(current_user)
 ):
     """
     Upload a call recording and trigger ML analysis.
     Only the client (who recorded) can upload.
     Optionally include a transcript for improved text-based analysis.
     """
-    user = await get_current_user(user_id)
+    call_oid = parse_object_id(call_id, "call")
     
     db = get_db()
     settings = get_settings()
@@ -565,7 +837,10 @@ async def upload_recording(
     )
     
     # Find the call
-    call = await db.calls.find_one({"_id": ObjectId(call_id)})
+    call = await db.calls.find_one(
+        {"_id": call_oid},
+        {"clientUserId": 1, "adminUserId": 1, "jobId": 1, "status": 1, "startedAt": 1, "endedAt": 1},
+    )
     if not call:
         raise HTTPException(status_code=404, detail="Call not found")
     
@@ -589,15 +864,14 @@ async def upload_recording(
     recording_path = recordings_dir / recording_filename
     
     try:
-        contents = await file.read()
-        logger.info(f"[GATE1] Recording payload read callId={call_id} bytes={len(contents)}")
-        with open(recording_path, "wb") as f:
-            f.write(contents)
+        # Stream to disk in chunks; inference reads the file back from disk
+        recording_size = await save_upload_file(file, recording_path)
+        logger.info(f"[GATE1] Recording payload read callId={call_id} bytes={recording_size}")
 
         debug_filename = f"{call_id}_{int(time.time())}.{file_extension}"
         debug_recording_path = debug_recordings_dir / debug_filename
-        with open(debug_recording_path, "wb") as debug_file:
-            debug_file.write(contents)
+        # copyfile uses sendfile(2) on Linux; run it off the event loop
+        await asyncio.to_thread(shutil.copyfile, recording_path, debug_recording_path)
         
         logger.info(f"Recording saved: {recording_path}")
         logger.info(f"[GATE1] Audio saved to disk callId={call_id} path={recording_path}")
@@ -610,7 +884,7 @@ async def upload_recording(
 
     file_exists = recording_path.exists()
     file_size = recording_path.stat().st_size if file_exists else 0
-    audio_diag = _inspect_audio_payload(contents)
+    audio_diag = _inspect_audio_payload(recording_path)
     logger.info(
         f"[GATE1 AUDIO] file path={recording_path} exists={file_exists} size={file_size}"
     )
@@ -640,17 +914,49 @@ async def upload_recording(
             f"[GATE1 MODEL] classifier loaded before load_model call={classifier.is_loaded}"
         )
         if not classifier.is_loaded:
-            classifier.load_model()
+            await asyncio.to_thread(classifier.load_model)
         logger.info(
             f"[GATE1 MODEL] classifier loaded after load_model call={classifier.is_loaded}"
         )
 
+        # Decode once; the intent and deception extractors share the waveform
+        try:
+            waveform, _, _ = await asyncio.to_thread(decode_audio, recording_path)
+        except Exception as exc:
+            logger.error(f"[GATE1 AUDIO] decode failed: {exc}")
+            raise HTTPException(
+                status_code=400,
+                detail="Audio analysis failed: insufficient speech content",
+            )
+
+        # Optional cheap energy gate before pyin/STFT work: silence-dominated
+        # recordings (dropped calls, hold tones) are rejected without inference.
+        # Off by default, since quiet but valid phone recordings can fall below it.
+        min_active_speech_seconds = settings.gate1_min_active_speech_seconds
+        if min_active_speech_seconds > 0:
+            active_speech_seconds = estimate_active_speech_seconds(
+                waveform,
+                silence_threshold_db=settings.gate1_silence_threshold_db,
+            )
+            logger.info(f"[GATE1 AUDIO] active_speech_seconds={round(active_speech_seconds, 2)}")
+            if active_speech_seconds < min_active_speech_seconds:
+                logger.error(
+                    f"[GATE1 AUDIO] insufficient speech content: active_speech_seconds={round(active_speech_seconds, 2)}"
+                )
+                raise HTTPException(
+                    status_code=400,
+                    detail="Audio analysis failed: insufficient speech content",
+                )
+
         risk_classifier = getattr(classifier, "_classifier", None)
         feature_vector = None
         if risk_classifier is not None:
-            feature_vector = risk_classifier.extract_features(
-                audio_data=contents,
+            # Feature extraction and inference are CPU-bound; keep them off
+            # the event loop so polling endpoints stay responsive
+            feature_vector = await asyncio.to_thread(
+                risk_classifier.extract_features,
                 transcript=transcript,
+                waveform=waveform,
             )
 
         if feature_vector is None:
@@ -680,7 +986,11 @@ async def upload_recording(
                 detail="Audio analysis failed: insufficient speech content",
             )
         
-        prediction_result, audio_duration = classifier.predict(contents, transcript=transcript)
+        prediction_result, _ = await asyncio.to_thread(
+            classifier.predict,
+            transcript=transcript,
+            features=feature_vector,
+        )
         logger.info(
             f"[GATE1 MODEL] intent prediction label={prediction_result.predicted_intent} confidence={prediction_result.confidence}"
         )
@@ -696,9 +1006,9 @@ async def upload_recording(
         logger.info(f"[GATE1] Running deception detector callId={call_id}")
         deception_detector = get_deception_detector()
         if not deception_detector.is_loaded:
-            deception_detector.load_model()
+            await asyncio.to_thread(deception_detector.load_model)
         
-        deception_result = deception_detector.predict(contents)
+        deception_result = await asyncio.to_thread(deception_detector.predict, waveform=waveform)
         
         # Step 3: Combine Intent + Deception Analysis (NEW)
         from cultivator.services.combined_analysis import combine_intent_and_deception
@@ -745,7 +1055,7 @@ async def upload_recording(
     try:
         logger.info(f"[GATE1 DB] saving analysis for callId={call_id} collection=calls")
         await db.calls.update_one(
-            {"_id": ObjectId(call_id)},
+            {"_id": call_oid},
             {
                 "$set": {
                     "recording": {
@@ -765,7 +1075,7 @@ async def upload_recording(
     
     # Also save to call_assessments collection for interview workflow
     call_assessment = {
-        "jobId": call["jobId"],
+        "jobId": str(call["jobId"]),
         "clientId": call["clientUserId"],
         "adminId": call["adminUserId"],
         "callStartedAt": call.get("startedAt"),
@@ -789,7 +1099,7 @@ async def upload_recording(
             f"[GATE1 DB] saving analysis for callId={call_id} collection=call_assessments"
         )
         await db.call_assessments.update_one(
-            {"jobId": call["jobId"], "clientId": call["clientUserId"]},
+            {"jobId": str(call["jobId"]), "clientId": call["clientUserId"]},
             {"$set": call_assessment},
             upsert=True
         )
@@ -803,10 +1113,9 @@ async def upload_recording(
     # Delete temporary processing file after successful analysis and database update.
     # Permanent debug copy under backend/debug_recordings is retained.
     try:
-        if recording_path.exists():
-            recording_path.unlink()
-            logger.info(f"Recording deleted after analysis: {recording_path}")
-    except Exception as e:
+        recording_path.unlink(missing_ok=True)
+        logger.info(f"Recording deleted after analysis: {recording_path}")
+    except OSError as e:
         logger.error(f"Failed to delete recording file: {e}")
         # Don't fail the request if deletion fails
     
@@ -822,14 +1131,14 @@ async def upload_recording(
 @router.get("/{call_id}", response_model=CallResponse)
 async def get_call(
     call_id: str,
-    user_id: str = Depends(require_auth)
+    user: dict = Depends(current_user)
 ):
     """Get call details."""
-    user = await get_current_user(user_id)
+    call_oid = parse_object_id(call_id, "call")
     
     db = get_db()
     
-    call = await db.calls.find_one({"_id": ObjectId(call_id)})
+    call = await db.calls.find_one({"_id": call_oid})
     if not call:
         raise HTTPException(status_code=404, detail="Call not found")
     
@@ -841,7 +1150,7 @@ async def get_call(
     
     return CallResponse(
         id=str(call["_id"]),
-        jobId=call["jobId"],
+        jobId=str(call["jobId"]),
         interviewerUserId=call["adminUserId"],
         cultivatorUserId=call["clientUserId"],
         channelName=channel_name,
@@ -860,21 +1169,24 @@ async def get_call(
 @router.post("/{call_id}/recording/start", response_model=StartRecordingResponse)
 async def start_cloud_recording(
     call_id: str,
-    user_id: str = Depends(require_auth)
+    user: dict = Depends(current_user)
 ):
     """
     Start Agora cloud recording for a call.
     This records the audio stream server-side.
     Allowed roles: interviewer, admin.
     """
-    user = await get_current_user(user_id)
+    call_oid = parse_object_id(call_id, "call")
     
     if user["role"] not in ["interviewer", "admin"]:
         raise HTTPException(status_code=403, detail="Only interviewer or admin can start cloud recording")
     
     db = get_db()
     
-    call = await db.calls.find_one({"_id": ObjectId(call_id)})
+    call = await db.calls.find_one(
+        {"_id": call_oid},
+        {"status": 1, "cloudRecording": 1, "channelName": 1, "roomName": 1, "recordingUid": 1},
+    )
     if not call:
         raise HTTPException(status_code=404, detail="Call not found")
     
@@ -934,7 +1246,7 @@ async def start_cloud_recording(
     
     # Update call with recording info
     await db.calls.update_one(
-        {"_id": ObjectId(call_id)},
+        {"_id": call_oid},
         {
             "$set": {
                 "cloudRecording": {
@@ -962,17 +1274,20 @@ async def start_cloud_recording(
 @router.post("/{call_id}/recording/stop", response_model=StopRecordingResponse)
 async def stop_cloud_recording(
     call_id: str,
-    user_id: str = Depends(require_auth)
+    user: dict = Depends(current_user)
 ):
     """
     Stop Agora cloud recording for a call.
     Returns information about the recorded files.
     """
-    user = await get_current_user(user_id)
+    call_oid = parse_object_id(call_id, "call")
     
     db = get_db()
     
-    call = await db.calls.find_one({"_id": ObjectId(call_id)})
+    call = await db.calls.find_one(
+        {"_id": call_oid},
+        {"clientUserId": 1, "adminUserId": 1, "cloudRecording": 1, "channelName": 1, "roomName": 1},
+    )
     if not call:
         raise HTTPException(status_code=404, detail="Call not found")
     
@@ -1007,7 +1322,7 @@ async def stop_cloud_recording(
     
     # Update call with recording result
     await db.calls.update_one(
-        {"_id": ObjectId(call_id)},
+        {"_id": call_oid},
         {
             "$set": {
                 "cloudRecording.status": "stopped",
@@ -10,10 +10,19 @@ from fastapi import APIRouter
 
 from cultivator.core.config import get_settings
 from cultivator.schemas.health import HealthResponse
-from cultivator.services.inference import get_classifier
 
 router = APIRouter()
 
+# Flipped by the application lifespan once the classifier has loaded, so
+# the polled health endpoints don't touch the classifier at all
+_model_ready = False
+
+
+def set_model_ready(ready: bool) -> None:
+    """Record whether the intent classifier is loaded and serving."""
+    global _model_ready
+    _model_ready = ready
+
 
 @router.get(
     "/health",
@@ -30,17 +39,16 @@ async def health_check() -> HealthResponse:
         HealthResponse with current status and component checks.
     """
     settings = get_settings()
-    classifier = get_classifier()
     
-    # Perform health checks
+    # Both checks reduce to the readiness flag (placeholder mode is also ready)
+    ready = _model_ready
     checks = {
-        "model_loaded": classifier.is_loaded,
-        "inference_ready": classifier.is_loaded and classifier.model is not None 
-            or classifier.is_loaded,  # Placeholder mode is also ready
+        "model_loaded": ready,
+        "inference_ready": ready,
     }
     
     # Determine overall status
-    status = "healthy" if all(checks.values()) else "degraded"
+    status = "healthy" if ready else "degraded"
     
     return HealthResponse(
         status=status,
@@ -64,9 +72,7 @@ async def readiness_check() -> dict:
     Returns:
         Simple ready status.
     """
-    classifier = get_classifier()
-    
     return {
-        "ready": classifier.is_loaded,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "ready": _model_ready,
+        "timestamp": datetime.now(timezone.utc),
     }
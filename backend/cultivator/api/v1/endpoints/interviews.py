@@ -4,24 +4,26 @@ Handles video interview recording, analysis, and status management.
 Uses Gate 2 ML model for facial expression analysis.
 """
 
+import asyncio
 import os
 import shutil
 import tempfile
-import subprocess
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional
 
-from bson import ObjectId
+import numpy as np
 from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form
+from pymongo import ReturnDocument
 
 from cultivator.core.database import get_db
 from cultivator.core.logging import get_logger
-from auth_utils import require_auth
+from cultivator.api.deps import current_interviewer
 from cultivator.schemas.interview import (
     InterviewInviteRequest,
     InterviewInviteResponse,
     InterviewAnalyzeResponse,
+    InterviewAnalysisQueuedResponse,
     InterviewResponse,
     InterviewStatusResponse,
     CallAssessmentResponse,
@@ -29,81 +31,192 @@ from cultivator.schemas.interview import (
     DeceptionAnalysis,
     SafetyAssessment,
 )
-from cultivator.services.inference import get_risk_classifier, get_deception_detector
+from cultivator.services.inference import (
+    TARGET_SAMPLE_RATE,
+    get_risk_classifier,
+    get_deception_detector,
+)
 from cultivator.services.gate2_inference import get_gate2_inference_service, get_gate2_deception_service
 from cultivator.services.safety_assessment import SafetyAssessmentService
 from cultivator.api.v1.endpoints.notifications import create_notification
+from cultivator.utils.ids import parse_object_id
+from cultivator.utils.hashing import new_content_hasher
+from cultivator.utils.uploads import save_upload_file
 
 logger = get_logger(__name__)
 router = APIRouter(prefix="/admin/interviews", tags=["Interviews"])
 
+# Video analysis is CPU heavy; cap how many run at once in this process so
+# concurrent uploads queue instead of oversubscribing the machine
+INTERVIEW_ANALYSIS_CONCURRENCY = 2
+_interview_analysis_slots = asyncio.Semaphore(INTERVIEW_ANALYSIS_CONCURRENCY)
 
-async def get_interviewer_user(user_id: str) -> dict:
-    """Resolve authenticated interviewer from user id."""
-    db = get_db()
-    user = await db.users.find_one({"_id": ObjectId(user_id)})
-    if not user:
-        raise HTTPException(status_code=401, detail="User not found")
-    if user.get("role") != "interviewer":
-        raise HTTPException(status_code=403, detail="Only interviewer can access this endpoint")
-    return {
-        "sub": user_id,
-        "username": user.get("username", "interviewer"),
-        "role": user.get("role"),
-    }
+# Uploads below either bound cannot yield a usable analysis (too few frames
+# for Gate 2, too little speech for Gate 1) and go straight to VERIFY.
+# A duration of 0 means the client did not report one.
+MIN_INTERVIEW_DURATION_SECONDS = 5.0
+MIN_INTERVIEW_VIDEO_BYTES = 64 * 1024
+
+# Strong references to in-flight background analyses (asyncio only keeps
+# weak references to tasks)
+_background_analyses: set = set()
+
+# Uploads are written to their own directory under here, so concurrent
+# uploads for the same interview never share (or delete) each other's files
+INTERVIEW_TMP_ROOT = Path(__file__).parent.parent.parent.parent.parent / "tmp" / "interviews"
 
+# Running background analyses refresh processingHeartbeatAt this often; a
+# "processing" interview whose heartbeat is older than STALE_PROCESSING_SECONDS
+# lost its task (crash or restart on any worker) and the lifespan-managed
+# sweeper resets it to "failed"
+PROCESSING_HEARTBEAT_SECONDS = 60
+STALE_PROCESSING_SECONDS = 5 * 60
+STALE_PROCESSING_SWEEP_SECONDS = 60
 
-def extract_audio_from_video(video_path: str, output_path: str) -> bool:
+
+async def extract_audio_from_video(video_path: str) -> Optional[np.ndarray]:
     """
     Extract audio from video file using ffmpeg.
     
+    ffmpeg runs as an asyncio subprocess so the event loop stays free
+    while the transcode is in progress. Raw PCM is streamed back over
+    stdout, so no intermediate WAV is written to or read from disk.
+    
     Args:
         video_path: Path to input video file
-        output_path: Path to output audio file (WAV)
         
     Returns:
-        True if extraction successful, False otherwise
+        16 kHz mono float32 waveform, or None if extraction failed
     """
     try:
         # Try using ffmpeg to extract audio
         cmd = [
-            "ffmpeg", "-y",
+            "ffmpeg",
             "-i", video_path,
             "-vn",  # No video
-            "-acodec", "pcm_s16le",  # WAV format
-            "-ar", "16000",  # 16kHz sample rate
+            "-f", "s16le",  # Raw 16-bit PCM, no container
+            "-acodec", "pcm_s16le",
+            "-ar", str(TARGET_SAMPLE_RATE),  # 16kHz sample rate
             "-ac", "1",  # Mono
-            output_path
+            "pipe:1",
         ]
         
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=60
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
         )
+        try:
+            pcm, stderr = await asyncio.wait_for(proc.communicate(), timeout=60)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            logger.warning("ffmpeg timed out extracting audio")
+            return None
         
-        if result.returncode == 0 and os.path.exists(output_path):
-            return True
+        if proc.returncode == 0 and pcm:
+            return np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
         
-        logger.warning(f"ffmpeg failed: {result.stderr}")
-        return False
+        logger.warning(f"ffmpeg failed: {stderr.decode(errors='replace')}")
+        return None
         
     except FileNotFoundError:
         logger.warning("ffmpeg not found, trying moviepy...")
         try:
             # Fallback to moviepy
-            from moviepy.editor import VideoFileClip
-            video = VideoFileClip(video_path)
-            video.audio.write_audiofile(output_path, fps=16000)
-            video.close()
-            return True
+            return await asyncio.to_thread(_extract_audio_with_moviepy, video_path)
         except Exception as e:
             logger.error(f"moviepy also failed: {e}")
-            return False
+            return None
     except Exception as e:
         logger.error(f"Audio extraction failed: {e}")
-        return False
+        return None
+
+
+def _extract_audio_with_moviepy(video_path: str) -> Optional[np.ndarray]:
+    """Blocking moviepy fallback used when ffmpeg is not on PATH."""
+    from moviepy.editor import VideoFileClip
+    video = VideoFileClip(video_path)
+    try:
+        if video.audio is None:
+            return None
+        samples = video.audio.to_soundarray(fps=TARGET_SAMPLE_RATE)
+    finally:
+        video.close()
+    if samples.ndim > 1:
+        samples = samples.mean(axis=1)
+    return samples.astype(np.float32, copy=False)
+
+
+def _decode_video_audio_with_pyav(video_path: str) -> Optional[np.ndarray]:
+    """
+    Decode a video's audio track to a 16 kHz mono float32 waveform in-process.
+    
+    Returns None when PyAV is not installed, the video has no audio stream
+    or decoding fails, so callers can fall back to the ffmpeg subprocess.
+    """
+    try:
+        import av
+    except ImportError:
+        return None
+    
+    try:
+        with av.open(video_path) as container:
+            if not container.streams.audio:
+                return None
+            stream = container.streams.audio[0]
+            resampler = av.AudioResampler(format="flt", layout="mono", rate=TARGET_SAMPLE_RATE)
+            chunks = []
+            for frame in container.decode(stream):
+                for resampled in resampler.resample(frame):
+                    chunks.append(resampled.to_ndarray().reshape(-1))
+            # Flush samples buffered inside the resampler
+            for resampled in resampler.resample(None):
+                chunks.append(resampled.to_ndarray().reshape(-1))
+    except Exception as e:
+        logger.warning(f"PyAV audio decode failed, falling back to ffmpeg: {e}")
+        return None
+    
+    if not chunks:
+        return None
+    return np.concatenate(chunks).astype(np.float32, copy=False)
+
+
+async def _run_gate1_audio_deception(video_path: str) -> Optional[dict]:
+    """Extract the audio track and run Gate 1 deception; None on failure."""
+    try:
+        # Decode in-process when PyAV is available (no ffmpeg spawn); either
+        # way the audio stays in memory rather than round-tripping a WAV
+        waveform = await asyncio.to_thread(_decode_video_audio_with_pyav, video_path)
+        if waveform is None:
+            waveform = await extract_audio_from_video(video_path)
+        if waveform is None or waveform.size == 0:
+            return None
+        deception_detector = get_deception_detector()
+        g1_result = await asyncio.to_thread(deception_detector.predict, waveform=waveform)
+        logger.info(
+            f"Gate 1 deception: {g1_result['label']} "
+            f"({g1_result['confidence']:.2%})"
+        )
+        return g1_result
+    except Exception as e:
+        logger.warning(f"Gate 1 deception analysis failed: {e}")
+        return None
+
+
+async def _run_gate2_visual_deception(video_path: str) -> Optional[tuple]:
+    """Run Gate 2 visual deception; returns (result, model_loaded) or None on failure."""
+    try:
+        gate2_deception_service = get_gate2_deception_service()
+        g2_dec_result = await asyncio.to_thread(gate2_deception_service.predict, video_path)
+        logger.info(
+            f"Gate 2 deception: {g2_dec_result.deception_label} "
+            f"({g2_dec_result.deception_confidence:.2%})"
+        )
+        return g2_dec_result, gate2_deception_service.is_loaded
+    except Exception as e:
+        logger.warning(f"Gate 2 deception analysis failed: {e}")
+        return None
 
 
 def _serialize_interview(doc: dict) -> InterviewResponse:
@@ -148,6 +261,7 @@ def _serialize_interview(doc: dict) -> InterviewResponse:
         confidence=doc.get("confidence"),
         reasons=doc.get("reasons", []),
         status=doc.get("status", "pending"),
+        processingStatus=doc.get("processingStatus"),
         createdAt=doc["createdAt"],
         emotion_distribution=doc.get("gate2_emotion_distribution"),
         dominant_emotion=doc.get("gate2_dominant_emotion"),
@@ -184,93 +298,88 @@ async def invite_for_interview(
     job_id: str,
     client_id: str,
     data: Optional[InterviewInviteRequest] = None,
-    user_id: str = Depends(require_auth),
+    admin: dict = Depends(current_interviewer),
 ):
     """
     Invite a client for an in-person interview.
     Creates/updates the interview record and sets application status.
     """
-    admin = await get_interviewer_user(user_id)
+    job_oid = parse_object_id(job_id, "job")
+    client_oid = parse_object_id(client_id, "client")
+    user_id = admin["sub"]
     db = get_db()
     
     if db is None:
         raise HTTPException(status_code=503, detail="Database not available")
     
-    # Verify job exists
-    job = await db.jobs.find_one({"_id": ObjectId(job_id)})
+    # Verify job and client exist; only the job title is read afterwards
+    job, client = await asyncio.gather(
+        db.jobs.find_one({"_id": job_oid}, {"title": 1}),
+        db.users.find_one({"_id": client_oid}, {"_id": 1}),
+    )
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    # Verify client exists
-    client = await db.users.find_one({"_id": ObjectId(client_id)})
     if not client:
         raise HTTPException(status_code=404, detail="Client not found")
     
     now = datetime.now(timezone.utc)
     
-    # Check for existing interview
-    existing_interview = await db.inperson_interviews.find_one({
-        "jobId": job_id,
-        "clientId": client_id,
-    })
-    
-    if existing_interview:
-        # Update existing
-        await db.inperson_interviews.update_one(
-            {"_id": existing_interview["_id"]},
-            {
-                "$set": {
-                    "interviewScheduledAt": data.scheduledAt if data else None,
-                    "notes": data.notes if data else None,
-                    "updatedAt": now,
-                }
-            }
-        )
-        interview_id = str(existing_interview["_id"])
-    else:
-        # Create new interview record
-        interview_doc = {
-            "jobId": job_id,
-            "clientId": client_id,
-            "adminId": admin["sub"],
-            "interviewScheduledAt": data.scheduledAt if data else None,
-            "interviewCompletedAt": None,
-            "videoDurationSeconds": None,
-            "analysisDecision": None,
-            "confidence": None,
-            "reasons": [],
-            "notes": data.notes if data else None,
-            "status": "pending",
-            "createdAt": now,
-            "updatedAt": now,
-        }
-        
-        result = await db.inperson_interviews.insert_one(interview_doc)
-        interview_id = str(result.inserted_id)
-    
-    # Update application status to invited_interview
-    await db.job_applications.update_many(
-        {"jobId": job_id, "applicantUserId": client_id},
-        {"$set": {"status": "invited_interview", "updatedAt": now}}
+    # Create or update the interview in one atomic upsert; the unique
+    # (jobId, clientId) index keeps concurrent invites from double-inserting
+    interview_write = db.inperson_interviews.find_one_and_update(
+        {"jobId": job_id, "clientId": client_id},
+        {
+            "$set": {
+                "interviewScheduledAt": data.scheduledAt if data else None,
+                "notes": data.notes if data else None,
+                "updatedAt": now,
+            },
+            "$setOnInsert": {
+                "adminId": admin["sub"],
+                "interviewCompletedAt": None,
+                "videoDurationSeconds": None,
+                "analysisDecision": None,
+                "confidence": None,
+                "reasons": [],
+                "status": "pending",
+                "createdAt": now,
+            },
+        },
+        projection={"_id": 1},
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
     )
     
-    # Update job status to invited_interview
-    await db.jobs.update_one(
-        {"_id": ObjectId(job_id)},
-        {"$set": {"status": "invited_interview", "updatedAt": now}}
-    )
-    
-    # Send notification to the client
     job_title = job.get("title", "your job post")
-    await create_notification(
-        user_id=client_id,
-        notification_type="interview_invite",
-        title="Interview Invitation",
-        message=f"You have been invited for an in-person interview for '{job_title}'. An admin will contact you to schedule the interview.",
-        job_id=job_id,
-        job_title=job_title,
+    
+    # The interview record, application status, job status and client
+    # notification are independent writes; issue them together
+    interview, *_ = await asyncio.gather(
+        interview_write,
+        # Update application status to invited_interview
+        db.job_applications.update_many(
+            {"jobId": job_id, "applicantUserId": client_id},
+            {"$set": {"status": "invited_interview", "updatedAt": now}}
+        ),
+        # Update job status to invited_interview
+        db.jobs.update_one(
+            {"_id": job_oid},
+            {"$set": {"status": "invited_interview", "updatedAt": now}}
+        ),
+        # Send notification to the client
+        create_notification(
+            user_id=client_id,
+            notification_type="interview_invite",
+            title="Interview Invitation",
+            message=f"You have been invited for an in-person interview for '{job_title}'. An admin will contact you to schedule the interview.",
+            job_id=job_id,
+            job_title=job_title,
+        ),
     )
     
+    interview_id = str(interview["_id"])
+    
     logger.info(f"Client {client_id} invited for interview for job {job_id}")
     
     return InterviewInviteResponse(
@@ -281,64 +390,163 @@ async def invite_for_interview(
     )
 
 
-@router.post("/{job_id}/{client_id}/analyze-video", response_model=InterviewAnalyzeResponse)
-async def analyze_interview_video(
+async def _record_unanalyzable_interview(
+    db,
+    interview: dict,
     job_id: str,
     client_id: str,
-    file: UploadFile = File(...),
-    duration_seconds: float = Form(0.0),
-    user_id: str = Depends(require_auth),
-):
-    """
-    Analyze an uploaded interview video using Gate 2 ML model.
+    duration_seconds: float,
+    video_size: int,
+) -> InterviewAnalyzeResponse:
+    """Mark a too-short interview upload as VERIFY without running any model."""
+    now = datetime.now(timezone.utc)
+    reasons = [
+        f"Interview video too short to analyze ({duration_seconds:.1f}s, {video_size} bytes)",
+        "Manual verification required",
+    ]
+    new_status = "verify_required"
     
-    - Extracts frames from video
-    - Detects faces and analyzes facial expressions
-    - Returns APPROVE / VERIFY / REJECT decision with emotion signals
-    - Video file is NOT stored permanently (deleted after analysis)
+    await asyncio.gather(
+        db.inperson_interviews.update_one(
+            {"_id": interview["_id"]},
+            {
+                "$set": {
+                    "interviewCompletedAt": now,
+                    "videoDurationSeconds": duration_seconds,
+                    "analysisDecision": "VERIFY",
+                    "confidence": 0.0,
+                    "reasons": reasons,
+                    "status": "completed",
+                    "updatedAt": now,
+                }
+            },
+        ),
+        db.job_applications.update_many(
+            {"jobId": job_id, "applicantUserId": client_id},
+            {"$set": {"status": new_status, "updatedAt": now}}
+        ),
+    )
+    
+    logger.info(
+        f"Interview video too short for job {job_id}, client {client_id} "
+        f"(duration={duration_seconds}s, size={video_size}); skipped analysis"
+    )
+    
+    return InterviewAnalyzeResponse(
+        success=True,
+        interviewId=str(interview["_id"]),
+        decision="VERIFY",
+        confidence=0.0,
+        reasons=reasons,
+        applicationStatus=new_status,
+        message="Interview video too short to analyze: VERIFY",
+    )
+
+
+async def _apply_cached_interview_analysis(
+    db,
+    interview: dict,
+    job_id: str,
+    client_id: str,
+    cached: dict,
+) -> InterviewAnalyzeResponse:
+    """Persist and return a cached analysis for a re-uploaded video."""
+    now = datetime.now(timezone.utc)
+    response = InterviewAnalyzeResponse(**cached["response"])
+    response.interviewId = str(interview["_id"])
+    
+    await asyncio.gather(
+        db.inperson_interviews.update_one(
+            {"_id": interview["_id"]},
+            {"$set": {**cached["updateFields"], "interviewCompletedAt": now, "updatedAt": now}},
+        ),
+        db.job_applications.update_many(
+            {"jobId": job_id, "applicantUserId": client_id},
+            {"$set": {"status": response.applicationStatus, "updatedAt": now}}
+        ),
+    )
+    
+    logger.info(f"Interview analysis cache hit for job {job_id}, client {client_id}: {response.decision}")
+    return response
+
+
+async def _analyze_saved_interview(
+    db,
+    interview: dict,
+    job_id: str,
+    client_id: str,
+    temp_video_path: str,
+    duration_seconds: float,
+    video_digest: Optional[str] = None,
+) -> InterviewAnalyzeResponse:
     """
-    admin = await get_interviewer_user(user_id)
-    db = get_db()
+    Run Gate 2 emotion, both deception gates and the safety assessment on a
+    saved interview video, then persist the outcome.
     
-    if db is None:
-        raise HTTPException(status_code=503, detail="Database not available")
+    Shared by the synchronous and background analysis endpoints; at most
+    INTERVIEW_ANALYSIS_CONCURRENCY analyses run at once per process.
+    When video_digest is given, a previous analysis of the same bytes for
+    the same job, client and call assessment is reused instead of
+    re-running the models.
+    """
+    video_size = os.path.getsize(temp_video_path)
+    if (
+        0 < duration_seconds < MIN_INTERVIEW_DURATION_SECONDS
+        or video_size < MIN_INTERVIEW_VIDEO_BYTES
+    ):
+        return await _record_unanalyzable_interview(
+            db, interview, job_id, client_id, duration_seconds, video_size
+        )
     
-    # Verify interview exists
-    interview = await db.inperson_interviews.find_one({
+    # Gate 1 intent for the safety assessment
+    call_assessment = await db.call_assessments.find_one(
+        {"jobId": job_id, "clientId": client_id},
+        {"decision": 1, "confidence": 1},
+    )
+    # The safety assessment (and so the decision) folds in the call
+    # assessment, so a cached result is only reused while it is unchanged
+    cache_key = {
         "jobId": job_id,
         "clientId": client_id,
-    })
+        "callDecision": call_assessment.get("decision") if call_assessment else None,
+        "callConfidence": call_assessment.get("confidence") if call_assessment else None,
+    }
     
-    if not interview:
-        raise HTTPException(
-            status_code=404, 
-            detail="Interview not found. Please invite the client first."
+    if video_digest:
+        cached = await db.interview_analyses_cache.find_one(
+            {"_id": video_digest, **cache_key},
+            {"updateFields": 1, "response": 1},
         )
+        if cached:
+            return await _apply_cached_interview_analysis(
+                db, interview, job_id, client_id, cached
+            )
     
-    now = datetime.now(timezone.utc)
-    temp_video_path = None
-    
-    # Create temp directory for this interview
-    temp_dir = Path(__file__).parent.parent.parent.parent.parent / "tmp" / "interviews" / str(interview["_id"])
-    temp_dir.mkdir(parents=True, exist_ok=True)
+    async with _interview_analysis_slots:
+        now = datetime.now(timezone.utc)
     
-    try:
-        # Save uploaded video to temp file
-        file_extension = Path(file.filename or "video.mp4").suffix or ".mp4"
-        temp_video_path = str(temp_dir / f"interview{file_extension}")
-        
-        content = await file.read()
-        with open(temp_video_path, "wb") as f:
-            f.write(content)
-        
-        logger.info(f"Saved temp video: {temp_video_path} ({len(content)} bytes)")
-        
-        # Get Gate 2 inference service
+        # Gate 2 emotion analysis, Gate 1 audio deception and Gate 2 visual
+        # deception only read the temp video, so run them concurrently.
+        # The deception helpers swallow their own failures; only Gate 2
+        # emotion analysis is allowed to fail the request.
         gate2_service = get_gate2_inference_service()
-        
-        # Run Gate 2 video analysis in a thread to avoid blocking the event loop
-        import asyncio
-        result = await asyncio.to_thread(gate2_service.predict, temp_video_path)
+        # The rules-based visual deception fallback re-runs the shared emotion
+        # service internally, so only overlap it when its own model is loaded.
+        overlap_visual_deception = get_gate2_deception_service().is_loaded
+        tasks = [
+            asyncio.to_thread(gate2_service.predict, temp_video_path),
+            _run_gate1_audio_deception(temp_video_path),
+        ]
+        if overlap_visual_deception:
+            tasks.append(_run_gate2_visual_deception(temp_video_path))
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+        if isinstance(outcomes[0], BaseException):
+            raise outcomes[0]
+        result, g1_result = outcomes[0], outcomes[1]
+        if overlap_visual_deception:
+            g2_dec_outcome = outcomes[2]
+        else:
+            g2_dec_outcome = await _run_gate2_visual_deception(temp_video_path)
         
         decision = result.decision_label
         
@@ -366,62 +574,36 @@ async def analyze_interview_video(
                    f"dominant={result.dominant_emotion}")
         
         # === DECEPTION DETECTION ===
-        # Gate 1 (audio) deception: extract audio from video, then analyze
+        # Gate 1 (audio) deception
         gate1_deception_result = None
-        try:
-            audio_path = str(temp_dir / "interview_audio.wav")
-            audio_extracted = extract_audio_from_video(temp_video_path, audio_path)
-            if audio_extracted and os.path.exists(audio_path):
-                deception_detector = get_deception_detector()
-                with open(audio_path, "rb") as af:
-                    audio_bytes = af.read()
-                g1_result = await asyncio.to_thread(
-                    deception_detector.predict, audio_bytes
-                )
-                gate1_deception_result = DeceptionAnalysis(
-                    deception_label=g1_result["label"],
-                    deception_confidence=g1_result["confidence"],
-                    deception_scores=g1_result["scores"],
-                    deception_signals=g1_result["signals"],
-                    deception_model_type=g1_result["model_type"],
-                )
-                reasons.append(
-                    f"Audio deception analysis: {g1_result['label']} "
-                    f"({g1_result['confidence']:.0%})"
-                )
-                logger.info(
-                    f"Gate 1 deception: {g1_result['label']} "
-                    f"({g1_result['confidence']:.2%})"
-                )
-        except Exception as e:
-            logger.warning(f"Gate 1 deception analysis failed: {e}")
+        if g1_result:
+            gate1_deception_result = DeceptionAnalysis(
+                deception_label=g1_result["label"],
+                deception_confidence=g1_result["confidence"],
+                deception_scores=g1_result["scores"],
+                deception_signals=g1_result["signals"],
+                deception_model_type=g1_result["model_type"],
+            )
+            reasons.append(
+                f"Audio deception analysis: {g1_result['label']} "
+                f"({g1_result['confidence']:.0%})"
+            )
 
-        # Gate 2 (visual) deception: analyze video frames
+        # Gate 2 (visual) deception
         gate2_deception_result = None
-        try:
-            gate2_deception_service = get_gate2_deception_service()
-            g2_dec_result = await asyncio.to_thread(
-                gate2_deception_service.predict, temp_video_path
-            )
+        if g2_dec_outcome:
+            g2_dec_result, g2_dec_model_loaded = g2_dec_outcome
             gate2_deception_result = DeceptionAnalysis(
                 deception_label=g2_dec_result.deception_label,
                 deception_confidence=g2_dec_result.deception_confidence,
                 deception_scores=g2_dec_result.deception_scores,
                 deception_signals=g2_dec_result.signals,
-                deception_model_type=(
-                    "ml" if gate2_deception_service.is_loaded else "rules"
-                ),
+                deception_model_type="ml" if g2_dec_model_loaded else "rules",
             )
             reasons.append(
                 f"Visual deception analysis: {g2_dec_result.deception_label} "
                 f"({g2_dec_result.deception_confidence:.0%})"
             )
-            logger.info(
-                f"Gate 2 deception: {g2_dec_result.deception_label} "
-                f"({g2_dec_result.deception_confidence:.2%})"
-            )
-        except Exception as e:
-            logger.warning(f"Gate 2 deception analysis failed: {e}")
         
         # Adjust final decision based on deception results
         deception_detected = False
@@ -448,11 +630,6 @@ async def analyze_interview_video(
             gate1_intent = "MEDIUM_INTENT"  # Default assumption
             gate1_intent_confidence = 0.5
             
-            call_assessment = await db.call_assessments.find_one({
-                "jobId": job_id,
-                "clientId": client_id,
-            })
-            
             if call_assessment:
                 # Extract intent from call assessment
                 decision_label = call_assessment.get("decision", "")
@@ -540,11 +717,6 @@ async def analyze_interview_video(
                 decision = "VERIFY"
             update_fields["analysisDecision"] = decision
 
-        await db.inperson_interviews.update_one(
-            {"_id": interview["_id"]},
-            {"$set": update_fields},
-        )
-        
         # Update application status based on decision
         if decision == "APPROVE":
             new_status = "approved"
@@ -553,14 +725,21 @@ async def analyze_interview_video(
         else:
             new_status = "verify_required"
         
-        await db.job_applications.update_many(
-            {"jobId": job_id, "applicantUserId": client_id},
-            {"$set": {"status": new_status, "updatedAt": now}}
+        # The interview record and application status are independent writes
+        await asyncio.gather(
+            db.inperson_interviews.update_one(
+                {"_id": interview["_id"]},
+                {"$set": update_fields},
+            ),
+            db.job_applications.update_many(
+                {"jobId": job_id, "applicantUserId": client_id},
+                {"$set": {"status": new_status, "updatedAt": now}}
+            ),
         )
         
         logger.info(f"Interview analyzed for job {job_id}, client {client_id}: {decision}")
         
-        return InterviewAnalyzeResponse(
+        response = InterviewAnalyzeResponse(
             success=True,
             interviewId=str(interview["_id"]),
             decision=decision,
@@ -581,34 +760,309 @@ async def analyze_interview_video(
             safety_assessment=safety_assessment_result,
         )
         
-    finally:
-        # ALWAYS clean up temp files (privacy rule)
-        if temp_video_path and os.path.exists(temp_video_path):
+        if video_digest:
             try:
-                os.unlink(temp_video_path)
-                logger.debug(f"Deleted temp video: {temp_video_path}")
+                await db.interview_analyses_cache.replace_one(
+                    {"_id": video_digest},
+                    {
+                        **cache_key,
+                        "updateFields": update_fields,
+                        "response": response.model_dump(),
+                        "createdAt": now,
+                    },
+                    upsert=True,
+                )
             except Exception as e:
-                logger.warning(f"Failed to delete temp video: {e}")
+                logger.warning(f"Failed to cache interview analysis: {e}")
+
+        return response
+
+
+def _make_interview_temp_dir(interview_id) -> Path:
+    """Create a fresh temp directory for one upload of an interview video."""
+    INTERVIEW_TMP_ROOT.mkdir(parents=True, exist_ok=True)
+    return Path(tempfile.mkdtemp(prefix=f"{interview_id}-", dir=INTERVIEW_TMP_ROOT))
+
+
+def _cleanup_interview_temp(temp_video_path: Optional[str], temp_dir: Path) -> None:
+    """Delete the temp video and its directory (privacy rule)."""
+    if temp_video_path:
+        try:
+            Path(temp_video_path).unlink(missing_ok=True)
+            logger.debug(f"Deleted temp video: {temp_video_path}")
+        except OSError as e:
+            logger.warning(f"Failed to delete temp video: {e}")
+    
+    # Clean up temp directory (rmtree tolerates it already being gone)
+    shutil.rmtree(temp_dir, ignore_errors=True)
+    logger.debug(f"Cleaned up temp dir: {temp_dir}")
+
+
+@router.post("/{job_id}/{client_id}/analyze-video", response_model=InterviewAnalyzeResponse)
+async def analyze_interview_video(
+    job_id: str,
+    client_id: str,
+    file: UploadFile = File(...),
+    duration_seconds: float = Form(0.0),
+    admin: dict = Depends(current_interviewer),
+):
+    """
+    Analyze an uploaded interview video using Gate 2 ML model.
+    
+    - Extracts frames from video
+    - Detects faces and analyzes facial expressions
+    - Returns APPROVE / VERIFY / REJECT decision with emotion signals
+    - Video file is NOT stored permanently (deleted after analysis)
+    """
+    db = get_db()
+    
+    if db is None:
+        raise HTTPException(status_code=503, detail="Database not available")
+    
+    # Verify interview exists
+    interview = await db.inperson_interviews.find_one(
+        {"jobId": job_id, "clientId": client_id},
+        {"_id": 1},
+    )
+    
+    if not interview:
+        raise HTTPException(
+            status_code=404, 
+            detail="Interview not found. Please invite the client first."
+        )
+    
+    temp_video_path = None
+    
+    # Create temp directory for this upload
+    temp_dir = _make_interview_temp_dir(interview["_id"])
+    
+    try:
+        # Save uploaded video to temp file
+        file_extension = Path(file.filename or "video.mp4").suffix or ".mp4"
+        temp_video_path = str(temp_dir / f"interview{file_extension}")
         
-        # Clean up temp directory
-        if temp_dir.exists():
-            try:
-                shutil.rmtree(temp_dir, ignore_errors=True)
-                logger.debug(f"Cleaned up temp dir: {temp_dir}")
-            except Exception as e:
-                logger.warning(f"Failed to clean temp dir: {e}")
+        hasher = new_content_hasher()
+        video_size = await save_upload_file(file, temp_video_path, hasher=hasher)
+        
+        logger.info(f"Saved temp video: {temp_video_path} ({video_size} bytes)")
+        
+        return await _analyze_saved_interview(
+            db,
+            interview,
+            job_id,
+            client_id,
+            temp_video_path,
+            duration_seconds,
+            hasher.hexdigest(),
+        )
+        
+    finally:
+        # ALWAYS clean up temp files (privacy rule)
+        await asyncio.to_thread(_cleanup_interview_temp, temp_video_path, temp_dir)
+        
+
+async def _analyze_interview_in_background(
+    db,
+    interview: dict,
+    job_id: str,
+    client_id: str,
+    temp_video_path: str,
+    temp_dir: Path,
+    duration_seconds: float,
+    video_digest: Optional[str] = None,
+) -> None:
+    """
+    Background counterpart of analyze_interview_video; records the outcome as processingStatus.
+    
+    Cancellation (application shutdown) is recorded as "failed" as well, so
+    the interview is never left at "processing". While running, the task keeps
+    processingHeartbeatAt fresh so the stale-analysis sweeper leaves it alone.
+    """
+    processing_status = "failed"
+    heartbeat = asyncio.create_task(_beat_processing_heartbeat(db, interview["_id"]))
+    try:
+        await _analyze_saved_interview(
+            db,
+            interview,
+            job_id,
+            client_id,
+            temp_video_path,
+            duration_seconds,
+            video_digest,
+        )
+        processing_status = "completed"
+    except asyncio.CancelledError:
+        logger.warning(f"Background interview analysis cancelled for job {job_id}, client {client_id}")
+        raise
+    except Exception as e:
+        logger.error(f"Background interview analysis failed for job {job_id}, client {client_id}: {e}")
+    finally:
+        heartbeat.cancel()
+        # ALWAYS clean up temp files (privacy rule)
+        await asyncio.to_thread(_cleanup_interview_temp, temp_video_path, temp_dir)
+        try:
+            await db.inperson_interviews.update_one(
+                {"_id": interview["_id"]},
+                {"$set": {"processingStatus": processing_status, "updatedAt": datetime.now(timezone.utc)}},
+            )
+        except Exception as e:
+            logger.error(f"Failed to record processingStatus={processing_status} for interview {interview['_id']}: {e}")
+
+
+async def _beat_processing_heartbeat(db, interview_id) -> None:
+    """Refresh processingHeartbeatAt until cancelled by the owning analysis."""
+    while True:
+        await asyncio.sleep(PROCESSING_HEARTBEAT_SECONDS)
+        try:
+            await db.inperson_interviews.update_one(
+                {"_id": interview_id, "processingStatus": "processing"},
+                {"$set": {"processingHeartbeatAt": datetime.now(timezone.utc)}},
+            )
+        except Exception as e:
+            logger.warning(f"Failed to refresh processing heartbeat for interview {interview_id}: {e}")
+
+
+async def cancel_background_analyses() -> None:
+    """Cancel in-flight background analyses and wait for them to record their status."""
+    tasks = list(_background_analyses)
+    for task in tasks:
+        task.cancel()
+    if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
+        logger.info(f"Cancelled {len(tasks)} background interview analyses")
+
+
+async def reset_stale_interview_analyses() -> None:
+    """Mark interviews left at "processing" by a lost background task as failed."""
+    db = get_db()
+    if db is None:
+        return
+    now = datetime.now(timezone.utc)
+    stale_before = now - timedelta(seconds=STALE_PROCESSING_SECONDS)
+    result = await db.inperson_interviews.update_many(
+        {
+            "processingStatus": "processing",
+            "$or": [
+                {"processingHeartbeatAt": {"$lt": stale_before}},
+                # Queued before heartbeats were recorded
+                {"processingHeartbeatAt": {"$exists": False}, "updatedAt": {"$lt": stale_before}},
+            ],
+        },
+        {"$set": {"processingStatus": "failed", "updatedAt": now}},
+    )
+    if result.modified_count:
+        logger.warning(f"Reset {result.modified_count} stale interview analyses to failed")
+
+
+async def run_stale_analysis_sweeper(interval_seconds: float = STALE_PROCESSING_SWEEP_SECONDS) -> None:
+    """
+    Periodically reset interviews whose background analysis was lost.
+    
+    Started once from the application lifespan and cancelled on shutdown.
+    The first sweep runs at startup, so interviews orphaned by a crash are
+    reset within STALE_PROCESSING_SECONDS plus one interval.
+    """
+    while True:
+        try:
+            await reset_stale_interview_analyses()
+        except Exception as e:
+            logger.warning(f"Stale interview analysis sweep failed: {e}")
+        await asyncio.sleep(interval_seconds)
+
+
+@router.post(
+    "/{job_id}/{client_id}/analyze-video/async",
+    response_model=InterviewAnalysisQueuedResponse,
+    status_code=202,
+)
+async def queue_interview_video_analysis(
+    job_id: str,
+    client_id: str,
+    file: UploadFile = File(...),
+    duration_seconds: float = Form(0.0),
+    _: dict = Depends(current_interviewer),
+):
+    """
+    Save an interview video and analyze it in the background.
+    
+    Returns as soon as the upload is on disk. Poll
+    ``GET /admin/interviews/{job_id}/{client_id}`` until
+    ``interview.processingStatus`` is ``completed`` or ``failed``.
+    """
+    db = get_db()
+    
+    if db is None:
+        raise HTTPException(status_code=503, detail="Database not available")
+    
+    interview = await db.inperson_interviews.find_one(
+        {"jobId": job_id, "clientId": client_id},
+        {"_id": 1},
+    )
+    
+    if not interview:
+        raise HTTPException(
+            status_code=404, 
+            detail="Interview not found. Please invite the client first."
+        )
+    
+    temp_dir = _make_interview_temp_dir(interview["_id"])
+    
+    file_extension = Path(file.filename or "video.mp4").suffix or ".mp4"
+    temp_video_path = str(temp_dir / f"interview{file_extension}")
+    hasher = new_content_hasher()
+    try:
+        video_size = await save_upload_file(file, temp_video_path, hasher=hasher)
+    except Exception:
+        await asyncio.to_thread(_cleanup_interview_temp, temp_video_path, temp_dir)
+        raise
+    logger.info(f"Saved temp video: {temp_video_path} ({video_size} bytes)")
+    
+    # Claim the interview; a second upload while one is still being analyzed
+    # would race it and the last task to finish would decide the status
+    now = datetime.now(timezone.utc)
+    claimed = await db.inperson_interviews.update_one(
+        {"_id": interview["_id"], "processingStatus": {"$ne": "processing"}},
+        {"$set": {"processingStatus": "processing", "processingHeartbeatAt": now, "updatedAt": now}},
+    )
+    if not claimed.matched_count:
+        await asyncio.to_thread(_cleanup_interview_temp, temp_video_path, temp_dir)
+        raise HTTPException(
+            status_code=409,
+            detail="An analysis is already running for this interview",
+        )
+    
+    task = asyncio.create_task(
+        _analyze_interview_in_background(
+            db,
+            interview,
+            job_id,
+            client_id,
+            temp_video_path,
+            temp_dir,
+            duration_seconds,
+            hasher.hexdigest(),
+        )
+    )
+    _background_analyses.add(task)
+    task.add_done_callback(_background_analyses.discard)
+    
+    return InterviewAnalysisQueuedResponse(
+        success=True,
+        interviewId=str(interview["_id"]),
+        processingStatus="processing",
+        message="Interview video received; analysis is running",
+    )
 
 
 @router.get("/{job_id}/{client_id}", response_model=InterviewStatusResponse)
 async def get_interview_status(
     job_id: str,
     client_id: str,
-    user_id: str = Depends(require_auth),
+    _: dict = Depends(current_interviewer),
 ):
     """
     Get interview status and call assessment for a job/client.
     """
-    _ = await get_interviewer_user(user_id)
     db = get_db()
     
     if db is None:
@@ -637,12 +1091,12 @@ async def get_interview_status(
 async def reject_application(
     job_id: str,
     client_id: str,
-    user_id: str = Depends(require_auth),
+    _: dict = Depends(current_interviewer),
 ):
     """
     Reject a client's application without interview.
     """
-    _ = await get_interviewer_user(user_id)
+    job_oid = parse_object_id(job_id, "job")
     db = get_db()
     
     if db is None:
@@ -659,7 +1113,7 @@ async def reject_application(
     if result.modified_count == 0:
         # Maybe the job itself, update job status
         await db.jobs.update_one(
-            {"_id": ObjectId(job_id)},
+            {"_id": job_oid},
             {"$set": {"status": "closed", "updatedAt": now}}
         )
     
@@ -4,13 +4,13 @@ Allows clients to create jobs and everyone to view them.
 """
 
 from datetime import datetime, timezone
-from bson import ObjectId
 from fastapi import APIRouter, HTTPException, Depends, Query
 from typing import Optional, List
 
 from cultivator.core.database import get_db
 from cultivator.core.logging import get_logger
-from auth_utils import require_auth
+from cultivator.api.deps import current_user
+from cultivator.utils.ids import parse_object_id
 from cultivator.schemas.job import JobCreate, JobResponse, JobListResponse
 from cultivator.schemas.call import CallResponse, AnalysisResult
 from cultivator.schemas.interview import InterviewResponse
@@ -18,52 +18,45 @@ from cultivator.schemas.interview import InterviewResponse
 logger = get_logger(__name__)
 router = APIRouter(prefix="/jobs", tags=["Jobs"])
 
-
-async def get_current_user(user_id: str) -> dict:
-    """Resolve authenticated user data for role and username checks."""
-    db = get_db()
-    user = await db.users.find_one({"_id": ObjectId(user_id)})
-    if not user:
-        raise HTTPException(status_code=401, detail="User not found")
-    return {
-        "sub": user_id,
-        "username": user.get("username", "unknown"),
-        "role": user.get("role", "client"),
-    }
+# Fields read by job_to_response; list endpoints fetch nothing else
+JOB_PROJECTION = {
+    "createdByUserId": 1,
+    "createdByUsername": 1,
+    "title": 1,
+    "districtOrLocation": 1,
+    "startsOnText": 1,
+    "priorExperience": 1,
+    "status": 1,
+    "createdAt": 1,
+    "updatedAt": 1,
+}
+JOB_LIST_LIMIT = 100
 
 
 def job_to_response(job: dict) -> JobResponse:
     """Convert MongoDB job to response."""
-    return JobResponse(
-        id=str(job["_id"]),
-        createdByUserId=job["createdByUserId"],
-        createdByUsername=job.get("createdByUsername", "Unknown"),
-        title=job["title"],
-        districtOrLocation=job["districtOrLocation"],
-        startsOnText=job.get("startsOnText", "Immediate"),
-        priorExperience=job.get("priorExperience", "None"),
-        status=job["status"],
-        createdAt=job["createdAt"],
-        updatedAt=job["updatedAt"],
-    )
+    return JobResponse.model_validate(job)
 
 
 @router.get("/", response_model=JobListResponse)
 async def get_jobs(
     status: Optional[str] = Query(None),
-    user_id: str = Depends(require_auth)
+    _: dict = Depends(current_user)
 ):
     """Get all jobs. Optionally filter by status."""
-    await get_current_user(user_id)  # Verify token and user exists
-    
     db = get_db()
     
     query = {}
     if status:
         query["status"] = status
     
-    cursor = db.jobs.find(query).sort("createdAt", -1)
-    jobs = await cursor.to_list(length=100)
+    cursor = (
+        db.jobs.find(query, JOB_PROJECTION)
+        .sort("createdAt", -1)
+        .limit(JOB_LIST_LIMIT)
+        .batch_size(JOB_LIST_LIMIT)
+    )
+    jobs = await cursor.to_list(length=JOB_LIST_LIMIT)
     
     return JobListResponse(
         jobs=[job_to_response(job) for job in jobs],
@@ -72,13 +65,16 @@ async def get_jobs(
 
 
 @router.get("/my", response_model=JobListResponse)
-async def get_my_jobs(user_id: str = Depends(require_auth)):
+async def get_my_jobs(user: dict = Depends(current_user)):
     """Get jobs created by the current user."""
-    user = await get_current_user(user_id)
-    
     db = get_db()
-    cursor = db.jobs.find({"createdByUserId": user["sub"]}).sort("createdAt", -1)
-    jobs = await cursor.to_list(length=100)
+    cursor = (
+        db.jobs.find({"createdByUserId": user["sub"]}, JOB_PROJECTION)
+        .sort("createdAt", -1)
+        .limit(JOB_LIST_LIMIT)
+        .batch_size(JOB_LIST_LIMIT)
+    )
+    jobs = await cursor.to_list(length=JOB_LIST_LIMIT)
     
     return JobListResponse(
         jobs=[job_to_response(job) for job in jobs],
@@ -87,10 +83,8 @@ async def get_my_jobs(user_id: str = Depends(require_auth)):
 
 
 @router.post("/", response_model=JobResponse)
-async def create_job(data: JobCreate, user_id: str = Depends(require_auth)):
+async def create_job(data: JobCreate, user: dict = Depends(current_user)):
     """Create a new job posting. Only clients can create jobs."""
-    user = await get_current_user(user_id)
-    
     if user["role"] != "client":
         raise HTTPException(status_code=403, detail="Only clients can create jobs")
     
@@ -121,11 +115,9 @@ async def create_job(data: JobCreate, user_id: str = Depends(require_auth)):
 async def update_job_status(
     job_id: str,
     status: str = Query(...),
-    user_id: str = Depends(require_auth)
+    user: dict = Depends(current_user)
 ):
     """Update job status. Only interviewer can update status."""
-    user = await get_current_user(user_id)
-    
     if user["role"] != "interviewer":
         raise HTTPException(status_code=403, detail="Only interviewer can update job status")
     
@@ -135,7 +127,7 @@ async def update_job_status(
     db = get_db()
     
     result = await db.jobs.update_one(
-        {"_id": ObjectId(job_id)},
+        {"_id": parse_object_id(job_id, "job")},
         {"$set": {"status": status, "updatedAt": datetime.now(timezone.utc)}}
     )
     
@@ -148,15 +140,14 @@ async def update_job_status(
 @router.get("/{job_id}/call-analyses")
 async def get_job_call_analyses(
     job_id: str,
-    user_id: str = Depends(require_auth)
+    user: dict = Depends(current_user)
 ):
     """Get all call analyses for a specific job."""
-    user = await get_current_user(user_id)
-    
     db = get_db()
     
     # Verify job exists and user has permission
-    job = await db.jobs.find_one({"_id": ObjectId(job_id)})
+    job_oid = parse_object_id(job_id, "job")
+    job = await db.jobs.find_one({"_id": job_oid}, {"createdByUserId": 1})
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
@@ -169,7 +160,7 @@ async def get_job_call_analyses(
     
     # Get all calls for this job that have analysis
     cursor = db.calls.find({
-        "jobId": job_id,
+        "jobId": job_oid,
         "analysis": {"$exists": True, "$ne": None}
     }).sort("createdAt", -1)
     
@@ -179,7 +170,7 @@ async def get_job_call_analyses(
     for call in calls:
         call_data = {
             "id": str(call["_id"]),
-            "jobId": call.get("jobId"),
+            "jobId": str(call["jobId"]) if call.get("jobId") else None,
             "adminUserId": call.get("adminUserId"),
             "clientUserId": call.get("clientUserId"),
             "status": call.get("status"),
@@ -204,15 +195,13 @@ async def get_job_call_analyses(
 @router.get("/{job_id}/interview-analyses")
 async def get_job_interview_analyses(
     job_id: str,
-    user_id: str = Depends(require_auth)
+    user: dict = Depends(current_user)
 ):
     """Get all interview analyses for a specific job."""
-    user = await get_current_user(user_id)
-    
     db = get_db()
     
     # Verify job exists and user has permission
-    job = await db.jobs.find_one({"_id": ObjectId(job_id)})
+    job = await db.jobs.find_one({"_id": parse_object_id(job_id, "job")}, {"createdByUserId": 1})
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
@@ -11,7 +11,8 @@ from fastapi import APIRouter, HTTPException, Depends
 
 from cultivator.core.database import get_db
 from cultivator.core.logging import get_logger
-from auth_utils import require_auth
+from cultivator.api.deps import current_user
+from cultivator.utils.ids import parse_object_id
 from cultivator.schemas.notification import (
     NotificationCreate,
     NotificationResponse,
@@ -22,18 +23,23 @@ from cultivator.schemas.notification import (
 logger = get_logger(__name__)
 router = APIRouter(prefix="/notifications", tags=["Notifications"])
 
+# Upper bound on ids accepted by a single mark-read request
+MAX_MARK_READ_IDS = 500
 
-async def get_current_user(user_id: str) -> dict:
-    """Resolve authenticated user details."""
-    db = get_db()
-    user = await db.users.find_one({"_id": ObjectId(user_id)})
-    if not user:
-        raise HTTPException(status_code=401, detail="User not found")
-    return {
-        "sub": user_id,
-        "username": user.get("username", "unknown"),
-        "role": user.get("role", "client"),
-    }
+# Largest page get_notifications will return
+MAX_NOTIFICATIONS_LIMIT = 200
+
+# Fields read by _serialize_notification
+NOTIFICATION_PROJECTION = {
+    "userId": 1,
+    "type": 1,
+    "title": 1,
+    "message": 1,
+    "jobId": 1,
+    "jobTitle": 1,
+    "isRead": 1,
+    "createdAt": 1,
+}
 
 
 def _serialize_notification(doc: dict) -> NotificationResponse:
@@ -85,18 +91,30 @@ async def create_notification(
     
     try:
         result = await db.notifications.insert_one(notification_doc)
-        logger.info(f"Notification created for user {user_id}: {title}")
-        return str(result.inserted_id)
     except Exception as e:
         logger.error(f"Failed to create notification: {e}")
         return None
+    
+    # Keep the denormalized unread counter on the user in step, only once the
+    # insert has succeeded. Only existing counters are incremented: $inc on a
+    # missing field would seed it at 1 regardless of older unread notifications.
+    try:
+        await db.users.update_one(
+            {"_id": ObjectId(user_id), "unreadNotifications": {"$exists": True}},
+            {"$inc": {"unreadNotifications": 1}},
+        )
+    except Exception as e:
+        logger.error(f"Failed to update unread counter for user {user_id}: {e}")
+    
+    logger.info(f"Notification created for user {user_id}: {title}")
+    return str(result.inserted_id)
 
 
 @router.get("/", response_model=NotificationListResponse)
 async def get_notifications(
     unread_only: bool = False,
     limit: int = 50,
-    user_id: str = Depends(require_auth),
+    user: dict = Depends(current_user),
 ):
     """
     Get notifications for the current user.
@@ -104,26 +122,35 @@ async def get_notifications(
     - unread_only: If true, only return unread notifications
     - limit: Maximum number of notifications to return
     """
-    user = await get_current_user(user_id)
     db = get_db()
     
     if db is None:
         raise HTTPException(status_code=503, detail="Database not available")
     
     user_id = user["sub"]
-    
-    # Build query
-    query = {"userId": user_id}
+    limit = max(1, min(limit, MAX_NOTIFICATIONS_LIMIT))
+    
+    # Page of notifications (newest first) plus both counts in one round-trip
+    items_pipeline = [
+        {"$sort": {"createdAt": -1}},
+        {"$limit": limit},
+        {"$project": NOTIFICATION_PROJECTION},
+    ]
     if unread_only:
-        query["isRead"] = False
-    
-    # Get notifications (newest first)
-    cursor = db.notifications.find(query).sort("createdAt", -1).limit(limit)
-    notifications = await cursor.to_list(length=limit)
-    
-    # Get counts
-    total = await db.notifications.count_documents({"userId": user_id})
-    unread_count = await db.notifications.count_documents({"userId": user_id, "isRead": False})
+        items_pipeline.insert(0, {"$match": {"isRead": False}})
+    
+    facets = await db.notifications.aggregate([
+        {"$match": {"userId": user_id}},
+        {"$facet": {
+            "items": items_pipeline,
+            "total": [{"$count": "n"}],
+            "unread": [{"$match": {"isRead": False}}, {"$count": "n"}],
+        }},
+    ]).to_list(length=1)
+    result = facets[0] if facets else {}
+    notifications = result.get("items", [])
+    total = result["total"][0]["n"] if result.get("total") else 0
+    unread_count = result["unread"][0]["n"] if result.get("unread") else 0
     
     return NotificationListResponse(
         notifications=[_serialize_notification(n) for n in notifications],
@@ -135,7 +162,7 @@ async def get_notifications(
 @router.post("/mark-read")
 async def mark_notifications_read(
     data: Optional[MarkReadRequest] = None,
-    user_id: str = Depends(require_auth),
+    user: dict = Depends(current_user),
 ):
     """
     Mark notifications as read.
@@ -143,7 +170,6 @@ async def mark_notifications_read(
     - If notificationIds provided, mark those specific ones
     - If not provided, mark ALL notifications as read
     """
-    user = await get_current_user(user_id)
     db = get_db()
     
     if db is None:
@@ -154,9 +180,14 @@ async def mark_notifications_read(
     
     if data and data.notificationIds:
         # Mark specific notifications
-        object_ids = [ObjectId(nid) for nid in data.notificationIds]
+        if len(data.notificationIds) > MAX_MARK_READ_IDS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Too many notification IDs (max {MAX_MARK_READ_IDS})",
+            )
+        object_ids = [parse_object_id(nid, "notification") for nid in set(data.notificationIds)]
         result = await db.notifications.update_many(
-            {"_id": {"$in": object_ids}, "userId": user_id},
+            {"_id": {"$in": object_ids}, "userId": user_id, "isRead": False},
             {"$set": {"isRead": True, "readAt": now}}
         )
     else:
@@ -166,6 +197,12 @@ async def mark_notifications_read(
             {"$set": {"isRead": True, "readAt": now}}
         )
     
+    if result.modified_count:
+        await db.users.update_one(
+            {"_id": ObjectId(user_id), "unreadNotifications": {"$exists": True}},
+            {"$inc": {"unreadNotifications": -result.modified_count}},
+        )
+    
     return {
         "success": True,
         "markedCount": result.modified_count,
@@ -173,15 +210,24 @@ async def mark_notifications_read(
 
 
 @router.get("/unread-count")
-async def get_unread_count(user_id: str = Depends(require_auth)):
-    """Get the count of unread notifications for the current user."""
-    user = await get_current_user(user_id)
+async def get_unread_count(user: dict = Depends(current_user)):
+    """
+    Get the count of unread notifications for the current user.
+    
+    Served from the denormalized unreadNotifications counter on the user
+    document. New users start at 0 and existing users are seeded by
+    scripts/backfill_unread_notifications.py; until then a user without the
+    field is counted from the notifications collection on every read.
+    """
     db = get_db()
     
     if db is None:
         raise HTTPException(status_code=503, detail="Database not available")
     
     user_id = user["sub"]
-    count = await db.notifications.count_documents({"userId": user_id, "isRead": False})
+    counter = await db.users.find_one({"_id": ObjectId(user_id)}, {"unreadNotifications": 1})
+    count = counter.get("unreadNotifications") if counter else None
+    if count is None:
+        count = await db.notifications.count_documents({"userId": user_id, "isRead": False})
     
     return {"unreadCount": count}
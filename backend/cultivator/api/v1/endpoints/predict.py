@@ -4,11 +4,14 @@ Prediction endpoint for buyer intent classification.
 Accepts audio input via file upload or base64-encoded JSON.
 """
 
+import asyncio
 import time
-from typing import Optional
+from typing import Dict, MutableMapping, Optional, Tuple
 
+from cachetools import LRUCache, TTLCache
 from fastapi import APIRouter, File, HTTPException, UploadFile, status
 
+from cultivator.core.config import get_settings
 from cultivator.core.logging import get_logger
 from cultivator.core.middleware import get_correlation_id
 from cultivator.schemas.prediction import (
@@ -18,9 +21,11 @@ from cultivator.schemas.prediction import (
     PredictionResponse,
 )
 from cultivator.services.inference import get_classifier
+from cultivator.utils.hashing import content_digest
 from cultivator.utils.audio import (
     AudioValidationError,
     decode_base64_audio,
+    read_audio_upload,
     validate_audio_format,
     validate_audio_size,
 )
@@ -28,6 +33,65 @@ from cultivator.utils.audio import (
 logger = get_logger(__name__)
 router = APIRouter()
 
+# (audio digest, sample rate) -> (PredictionResult, audio duration); built lazily from settings
+_prediction_cache: Optional[MutableMapping[Tuple[str, int], tuple]] = None
+# One lock per in-flight key so concurrent identical requests share one inference
+_prediction_locks: Dict[Tuple[str, int], asyncio.Lock] = {}
+
+
+def _get_prediction_cache() -> Optional[MutableMapping[Tuple[str, int], tuple]]:
+    """Return the prediction cache, or None when caching is disabled."""
+    global _prediction_cache
+    if _prediction_cache is None:
+        settings = get_settings()
+        if settings.prediction_cache_size <= 0:
+            return None
+        if settings.prediction_cache_ttl_seconds > 0:
+            _prediction_cache = TTLCache(
+                maxsize=settings.prediction_cache_size,
+                ttl=settings.prediction_cache_ttl_seconds,
+            )
+        else:
+            _prediction_cache = LRUCache(maxsize=settings.prediction_cache_size)
+    return _prediction_cache
+
+
+async def _predict_cached(classifier, audio_bytes: bytes, sample_rate: int = 16000) -> tuple:
+    """
+    Run classifier.predict, memoized on the audio content.
+    
+    Identical audio submitted again (UI retries, test suites) is served
+    from memory; concurrent identical requests wait for the first one.
+    
+    Returns:
+        Tuple of (PredictionResult, audio_duration_seconds).
+    """
+    cache = _get_prediction_cache()
+    if cache is None:
+        # Feature extraction and inference are CPU-bound; keep them off the event loop
+        return await asyncio.to_thread(
+            classifier.predict, audio_bytes, sample_rate=sample_rate
+        )
+    
+    key = (content_digest(audio_bytes), sample_rate)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+    
+    lock = _prediction_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+        try:
+            result = await asyncio.to_thread(
+                classifier.predict, audio_bytes, sample_rate=sample_rate
+            )
+            cache[key] = result
+        finally:
+            _prediction_locks.pop(key, None)
+    return result
+
 
 @router.post(
     "/predict/upload",
@@ -79,11 +143,8 @@ async def predict_from_upload(
             content_type=audio_file.content_type,
         )
         
-        # Read file content
-        audio_bytes = await audio_file.read()
-        
-        # Validate size
-        validate_audio_size(audio_bytes)
+        # Read file content, stopping early if it is over the size limit
+        audio_bytes = await read_audio_upload(audio_file)
         
         # Get classifier and predict
         classifier = get_classifier()
@@ -94,7 +155,7 @@ async def predict_from_upload(
                 detail="Model not loaded. Service unavailable.",
             )
         
-        prediction_result, audio_duration = classifier.predict(audio_bytes)
+        prediction_result, audio_duration = await _predict_cached(classifier, audio_bytes)
         
         # Calculate processing time
         processing_time_ms = (time.perf_counter() - start_time) * 1000
@@ -198,7 +259,8 @@ async def predict_from_base64(
                 detail="Model not loaded. Service unavailable.",
             )
         
-        prediction_result, audio_duration = classifier.predict(
+        prediction_result, audio_duration = await _predict_cached(
+            classifier,
             audio_bytes,
             sample_rate=request.sample_rate or 16000,
         )
@@ -5,7 +5,7 @@ Loads configuration from environment variables and .env file.
 
 from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import FrozenSet, List, Optional
 
 from pydantic import Field, AliasChoices
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -59,6 +59,18 @@ class Settings(BaseSettings):
         default="smartagri",
         description="MongoDB database name",
     )
+    mongodb_max_pool_size: int = Field(
+        default=200,
+        description="Maximum MongoDB connections in the pool",
+    )
+    mongodb_min_pool_size: int = Field(
+        default=20,
+        description="MongoDB connections kept open (and warmed at startup)",
+    )
+    mongodb_compressors: str = Field(
+        default="zstd,snappy,zlib",
+        description="Wire compressors in preference order; unavailable ones are skipped",
+    )
 
     # Simple auth secret
     auth_secret: str = Field(
@@ -81,11 +93,36 @@ class Settings(BaseSettings):
         default=30.0,
         description="Maximum audio duration in seconds",
     )
-    supported_audio_formats: List[str] = Field(
-        default=["wav", "mp3", "ogg", "flac", "m4a"],
+    supported_audio_formats: FrozenSet[str] = Field(
+        default=frozenset({"wav", "mp3", "ogg", "flac", "m4a"}),
         description="Supported audio file formats",
     )
     sample_rate: int = Field(default=16000, description="Target audio sample rate")
+    max_audio_bytes: int = Field(
+        default=50 * 1024 * 1024,
+        description="Largest audio payload accepted by the predict endpoints",
+    )
+    gate1_min_active_speech_seconds: float = Field(
+        default=0.0,
+        description=(
+            "Reject call recordings with less audible audio than this before "
+            "Gate 1 inference (0 disables the check)"
+        ),
+    )
+    gate1_silence_threshold_db: float = Field(
+        default=-45.0,
+        description="Frames quieter than this (dBFS) count as silence for the Gate 1 speech check",
+    )
+
+    # Prediction cache settings
+    prediction_cache_size: int = Field(
+        default=1024,
+        description="Predictions kept in the in-memory cache keyed by audio hash (0 disables)",
+    )
+    prediction_cache_ttl_seconds: float = Field(
+        default=0.0,
+        description="Expire cached predictions after this many seconds (0 keeps them until evicted)",
+    )
 
     # Agora settings for audio/video calling
     agora_app_id: str = Field(
@@ -155,6 +192,14 @@ class Settings(BaseSettings):
         default=True,
         description="Use JSON format for logs",
     )
+    log_buffer_capacity: int = Field(
+        default=512,
+        description="Log records buffered before a batched write (ERROR and above flush immediately)",
+    )
+    log_flush_interval_seconds: float = Field(
+        default=1.0,
+        description="Maximum time a buffered log record waits before being written",
+    )
 
 
 @lru_cache()
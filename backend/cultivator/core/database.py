@@ -15,8 +15,11 @@ This is usually caused by:
 2. OR set SKIP_MONGODB=true in .env to develop without database
 """
 
+import asyncio
 import os
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.errors import OperationFailure
 from typing import Optional
 
 from cultivator.core.config import get_settings
@@ -30,6 +33,10 @@ _db: Optional[AsyncIOMotorDatabase] = None
 _connection_failed: bool = False
 
 
+class UniqueIndexError(RuntimeError):
+    """A unique index the application relies on could not be built."""
+
+
 async def connect_db() -> None:
     """Connect to MongoDB on application startup."""
     global _client, _db, _connection_failed
@@ -51,11 +58,22 @@ async def connect_db() -> None:
             settings.mongodb_url,
             serverSelectionTimeoutMS=10000,
             tlsAllowInvalidCertificates=True,
+            maxPoolSize=settings.mongodb_max_pool_size,
+            minPoolSize=settings.mongodb_min_pool_size,
+            maxIdleTimeMS=60000,
+            waitQueueTimeoutMS=5000,
+            compressors=settings.mongodb_compressors,
+            retryWrites=True,
         )
         
         # Verify connection
         await _client.admin.command("ping")
         _db = _client[settings.mongodb_database]
+        
+        # Open the minimum pool now so the first requests don't pay for handshakes
+        await asyncio.gather(
+            *(_client.admin.command("ping") for _ in range(settings.mongodb_min_pool_size))
+        )
         _connection_failed = False
         
         logger.info(f"Connected to database: {settings.mongodb_database}")
@@ -63,6 +81,10 @@ async def connect_db() -> None:
         # Create indexes
         await _create_indexes()
         
+    except UniqueIndexError:
+        # Running without the constraint would silently allow duplicates
+        _connection_failed = True
+        raise
     except Exception as e:
         _connection_failed = True
         error_msg = str(e)
@@ -106,6 +128,37 @@ def is_db_connected() -> bool:
     return _db is not None and not _connection_failed
 
 
+async def _create_unique_index(collection, keys: list) -> None:
+    """
+    Create a unique index, replacing an older non-unique one on the same keys.
+    
+    Raises UniqueIndexError if the index cannot be built (e.g. existing
+    documents violate uniqueness); upserts rely on it, so startup stops
+    rather than running without it.
+    """
+    try:
+        await collection.create_index(keys, unique=True)
+        return
+    except OperationFailure as e:
+        # 85/86: an index on these keys already exists with other options
+        if e.code not in (85, 86):
+            raise UniqueIndexError(
+                f"Could not create unique index on {collection.name} {keys}: {e}"
+            ) from e
+    
+    index_name = "_".join(f"{field}_{direction}" for field, direction in keys)
+    await collection.drop_index(index_name)
+    try:
+        await collection.create_index(keys, unique=True)
+    except OperationFailure as e:
+        # Put the plain index back so lookups stay indexed while data is cleaned up
+        await collection.create_index(keys)
+        raise UniqueIndexError(
+            f"Duplicate documents prevent a unique index on {collection.name} {keys}; "
+            f"remove them first (scripts/dedupe_{collection.name}.py): {e}"
+        ) from e
+
+
 async def _create_indexes() -> None:
     """Create required database indexes."""
     db = get_db()
@@ -113,39 +166,62 @@ async def _create_indexes() -> None:
         logger.warning("Cannot create indexes - database not connected")
         return
     
-    # Users indexes
-    await db.users.create_index("username", unique=True)
-    await db.users.create_index("email", unique=True, sparse=True)
-    
-    # Client profiles index
-    await db.client_profiles.create_index("userId", unique=True)
-    
-    # Jobs indexes
-    await db.jobs.create_index("createdByUserId")
-    await db.jobs.create_index("status")
-    
-    # Job applications indexes
-    await db.job_applications.create_index("jobId")
-    await db.job_applications.create_index("applicantUserId")
-    await db.job_applications.create_index([("jobId", 1), ("applicantUserId", 1)], unique=True)
-    
-    # Call assessments indexes
-    await db.call_assessments.create_index("jobId")
-    await db.call_assessments.create_index("clientId")
-    await db.call_assessments.create_index([("jobId", 1), ("clientId", 1)])
-    
-    # In-person interviews indexes
-    await db.inperson_interviews.create_index("jobId")
-    await db.inperson_interviews.create_index("clientId")
-    await db.inperson_interviews.create_index([("jobId", 1), ("clientId", 1)])
-    
-    # Call Tasks indexes
-    await db.call_tasks.create_index([("assignedAdminId", 1), ("scheduledDate", 1), ("status", 1)])
-    await db.call_tasks.create_index([("status", 1), ("scheduledDate", 1)])
-    
-    # Notifications indexes
-    await db.notifications.create_index("userId")
-    await db.notifications.create_index([("userId", 1), ("isRead", 1)])
-    await db.notifications.create_index([("userId", 1), ("createdAt", -1)])
+    # One createIndexes command per collection, all collections in parallel
+    await asyncio.gather(
+        db.users.create_indexes([
+            IndexModel("username", unique=True),
+            IndexModel("email", unique=True, sparse=True),
+        ]),
+        db.client_profiles.create_indexes([
+            IndexModel("userId", unique=True),
+        ]),
+        db.jobs.create_indexes([
+            IndexModel("createdByUserId"),
+            IndexModel("status"),
+            # Newest-first job lists, optionally filtered by status or creator
+            IndexModel([("createdAt", DESCENDING)]),
+            IndexModel([("status", ASCENDING), ("createdAt", DESCENDING)]),
+            IndexModel([("createdByUserId", ASCENDING), ("createdAt", DESCENDING)]),
+        ]),
+        db.job_applications.create_indexes([
+            IndexModel("jobId"),
+            IndexModel("applicantUserId"),
+            IndexModel([("jobId", ASCENDING), ("applicantUserId", ASCENDING)], unique=True),
+            IndexModel([("applicantUserId", ASCENDING), ("createdAt", DESCENDING)]),
+            IndexModel([("createdAt", DESCENDING)]),
+        ]),
+        db.call_assessments.create_indexes([
+            IndexModel("jobId"),
+            IndexModel("clientId"),
+            IndexModel([("jobId", ASCENDING), ("clientId", ASCENDING)]),
+        ]),
+        db.inperson_interviews.create_indexes([
+            IndexModel("jobId"),
+            IndexModel("clientId"),
+            # Stale-analysis sweep looks up "processing" interviews
+            IndexModel("processingStatus"),
+        ]),
+        # One interview per (job, client); invite_for_interview upserts on it
+        _create_unique_index(db.inperson_interviews, [("jobId", 1), ("clientId", 1)]),
+        # Cached interview analyses keyed by video hash expire after a week
+        db.interview_analyses_cache.create_indexes([
+            IndexModel("createdAt", expireAfterSeconds=7 * 24 * 3600),
+        ]),
+        db.call_tasks.create_indexes([
+            IndexModel([("assignedAdminId", ASCENDING), ("scheduledDate", ASCENDING), ("status", ASCENDING)]),
+            IndexModel([("status", ASCENDING), ("scheduledDate", ASCENDING)]),
+        ]),
+        db.calls.create_indexes([
+            IndexModel([("clientUserId", ASCENDING), ("status", ASCENDING)]),
+            IndexModel([("jobId", ASCENDING), ("status", ASCENDING)]),
+            IndexModel([("status", ASCENDING), ("createdAt", ASCENDING)]),
+        ]),
+        db.notifications.create_indexes([
+            IndexModel("userId"),
+            IndexModel([("userId", ASCENDING), ("isRead", ASCENDING)]),
+            # Covers the list page and both counts of the notifications $facet
+            IndexModel([("userId", ASCENDING), ("createdAt", DESCENDING), ("isRead", ASCENDING)]),
+        ]),
+    )
     
     logger.info("Database indexes created")
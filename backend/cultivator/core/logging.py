@@ -3,29 +3,90 @@ Structured logging configuration with JSON support.
 Provides consistent logging across the application.
 """
 
+import asyncio
+import atexit
 import logging
+import queue
 import sys
-from datetime import datetime, timezone
+import time
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
 from typing import Any, Dict, Optional
-import json
+
+import orjson
 
 from cultivator.core.config import get_settings
 
+# Background thread that formats and writes records queued by the root logger
+_queue_listener: Optional[QueueListener] = None
+# Buffer between the listener and the console handler
+_memory_handler: Optional[MemoryHandler] = None
+
+
+class BatchingMemoryHandler(MemoryHandler):
+    """
+    MemoryHandler that writes each flushed batch to its stream in one call.
+    
+    The stock MemoryHandler replays buffered records through the target one
+    at a time, which still costs a write per line on a line-buffered stream.
+    """
+
+    def __init__(self, capacity: int, flushLevel: int, target: logging.StreamHandler) -> None:
+        super().__init__(capacity, flushLevel=flushLevel, target=target, flushOnClose=True)
+
+    def flush(self) -> None:
+        """Format buffered records and write them to the target stream together."""
+        with self.lock:
+            target = self.target
+            if not self.buffer or target is None:
+                return
+            records, self.buffer = self.buffer, []
+            chunks = []
+            for record in records:
+                if record.levelno < target.level or not target.filter(record):
+                    continue
+                try:
+                    chunks.append(target.format(record) + target.terminator)
+                except Exception:
+                    target.handleError(record)
+            if not chunks:
+                return
+            with target.lock:
+                try:
+                    target.stream.write("".join(chunks))
+                    target.flush()
+                except Exception:
+                    target.handleError(records[-1])
 
-class FlushingStreamHandler(logging.StreamHandler):
-    """Custom stream handler that flushes after every emit for immediate output."""
 
-    def emit(self, record: logging.LogRecord) -> None:
-        """Emit a record and immediately flush the stream."""
-        try:
-            super().emit(record)
-        finally:
-            self.flush()
+class LocalQueueHandler(QueueHandler):
+    """
+    QueueHandler for a listener in the same process.
+    
+    Records are queued as-is instead of being pre-formatted, so formatting
+    happens on the listener thread and formatters still see exc_info and extras.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
 
 
 class JSONFormatter(logging.Formatter):
     """Custom JSON formatter for structured logging."""
 
+    def __init__(self) -> None:
+        super().__init__()
+        # (whole second, formatted date/time) for the last timestamp rendered
+        self._second_cache: tuple = (None, "")
+
+    def _format_timestamp(self, created: float) -> str:
+        """Render record.created as UTC ISO 8601 with milliseconds, reusing the per-second prefix."""
+        second = int(created)
+        cached_second, prefix = self._second_cache
+        if second != cached_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._second_cache = (second, prefix)
+        return f"{prefix}.{int((created - second) * 1000):03d}Z"
+
     def format(self, record: logging.LogRecord) -> str:
         """
         Format log record as JSON.
@@ -37,7 +98,8 @@ class JSONFormatter(logging.Formatter):
             JSON formatted string.
         """
         log_data: Dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            # When the record was created, not when the listener got round to it
+            "timestamp": self._format_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -58,7 +120,7 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_data, default=str)
+        return orjson.dumps(log_data, default=str, option=orjson.OPT_UTC_Z).decode()
 
 
 class StandardFormatter(logging.Formatter):
@@ -99,21 +161,24 @@ def setup_logging(
     Returns:
         Configured root logger.
     """
+    global _queue_listener, _memory_handler
     settings = get_settings()
     
     level = log_level or settings.log_level
     use_json = json_format if json_format is not None else settings.log_json_format
 
     # Get root logger
+    level_no = getattr(logging, level.upper())
     root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, level.upper()))
+    root_logger.setLevel(level_no)
 
     # Remove existing handlers
+    shutdown_logging()
     root_logger.handlers.clear()
 
-    # Create console handler with immediate flushing (use stderr for better buffering behavior)
-    console_handler = FlushingStreamHandler(sys.stderr)
-    console_handler.setLevel(getattr(logging, level.upper()))
+    # Create console handler (use stderr for better buffering behavior)
+    console_handler = logging.StreamHandler(sys.stderr)
+    console_handler.setLevel(level_no)
 
     # Set formatter based on configuration
     if use_json:
@@ -121,7 +186,18 @@ def setup_logging(
     else:
         console_handler.setFormatter(StandardFormatter())
 
-    root_logger.addHandler(console_handler)
+    # Batch console writes; errors are written straight away
+    _memory_handler = BatchingMemoryHandler(
+        settings.log_buffer_capacity,
+        flushLevel=logging.ERROR,
+        target=console_handler,
+    )
+
+    # Callers only enqueue records; formatting and writing happen on the listener thread
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root_logger.addHandler(LocalQueueHandler(log_queue))
+    _queue_listener = QueueListener(log_queue, _memory_handler, respect_handler_level=True)
+    _queue_listener.start()
 
     # Reduce noise from third-party libraries
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
@@ -134,6 +210,54 @@ def setup_logging(
     return root_logger
 
 
+def flush_logging() -> None:
+    """Write out any log records still held in the batching buffer."""
+    memory_handler = _memory_handler
+    if memory_handler is not None:
+        memory_handler.flush()
+
+
+async def run_log_flusher(interval_seconds: Optional[float] = None) -> None:
+    """
+    Periodically flush buffered log records.
+    
+    Started from the application lifespan and cancelled on shutdown; bounds
+    how long a quiet period can leave records unwritten.
+    """
+    if interval_seconds is None:
+        interval_seconds = get_settings().log_flush_interval_seconds
+    while True:
+        await asyncio.sleep(interval_seconds)
+        await asyncio.to_thread(flush_logging)
+
+
+def shutdown_logging() -> None:
+    """
+    Stop the background log listener after draining queued records.
+    
+    The root logger is switched back to writing through the console handler
+    directly, so anything logged afterwards is not lost.
+    """
+    global _queue_listener, _memory_handler
+    listener = _queue_listener
+    memory_handler = _memory_handler
+    if listener is None or memory_handler is None:
+        return
+    _queue_listener = None
+    _memory_handler = None
+
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers[:]:
+        if isinstance(handler, LocalQueueHandler):
+            root_logger.removeHandler(handler)
+    root_logger.addHandler(memory_handler.target)
+    listener.stop()
+    memory_handler.flush()
+
+
+atexit.register(shutdown_logging)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger with the specified name.
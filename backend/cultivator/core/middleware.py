@@ -3,13 +3,12 @@ Custom middleware for request processing.
 Includes correlation ID injection and request logging.
 """
 
+import logging
 import time
 import uuid
 from contextvars import ContextVar
-from typing import Callable
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from cultivator.core.logging import get_logger
 
@@ -18,6 +17,21 @@ logger = get_logger(__name__)
 # Context variable for correlation ID (thread-safe)
 correlation_id_var: ContextVar[str] = ContextVar("correlation_id", default="")
 
+# ASGI header names are lowercase bytes
+_CORRELATION_ID_HEADER = b"x-correlation-id"
+_PROCESS_TIME_HEADER = b"x-process-time-ms"
+_new_uuid = uuid.uuid4
+
+# Health probes and API docs assets: timed, but not logged
+_UNLOGGED_PATHS = frozenset({
+    "/api/v1/health",
+    "/health",
+    "/docs",
+    "/redoc",
+    "/openapi.json",
+    "/favicon.ico",
+})
+
 
 def get_correlation_id() -> str:
     """
@@ -29,109 +43,163 @@ def get_correlation_id() -> str:
     return correlation_id_var.get()
 
 
-class CorrelationIdMiddleware(BaseHTTPMiddleware):
+def _append_header(message: Message, name: bytes, value: bytes) -> None:
+    """Append a raw header to an ``http.response.start`` message."""
+    headers = message.setdefault("headers", [])
+    if not isinstance(headers, list):
+        headers = message["headers"] = list(headers)
+    headers.append((name, value))
+
+
+def _add_process_time_header(message: Message, elapsed_us: int) -> None:
+    """Add the X-Process-Time-Ms header (milliseconds, 3 decimals) to a response start message."""
+    _append_header(message, _PROCESS_TIME_HEADER, b"%d.%03d" % divmod(elapsed_us, 1000))
+
+
+class CorrelationIdMiddleware:
     """
     Middleware to inject and propagate correlation IDs.
     
     Extracts correlation ID from X-Correlation-ID header or generates a new one.
     Makes it available throughout the request lifecycle.
+    
+    Written as a plain ASGI callable rather than BaseHTTPMiddleware so requests
+    are not routed through an extra task and memory stream.
     """
 
-    HEADER_NAME = "X-Correlation-ID"
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable,
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process request with correlation ID.
         
         Args:
-            request: Incoming request.
-            call_next: Next middleware/handler in chain.
-            
-        Returns:
-            Response with correlation ID header.
+            scope: ASGI connection scope.
+            receive: ASGI receive channel.
+            send: ASGI send channel; wrapped to add the response header.
         """
-        # Extract or generate correlation ID
-        correlation_id = request.headers.get(
-            self.HEADER_NAME,
-            str(uuid.uuid4()),
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Extract or generate correlation ID; the raw bytes are echoed back as-is
+        raw_id = next(
+            (value for name, value in scope["headers"] if name == _CORRELATION_ID_HEADER),
+            None,
         )
+        if raw_id:
+            correlation_id = raw_id.decode("latin-1")
+        else:
+            correlation_id = _new_uuid().hex
+            raw_id = correlation_id.encode("ascii")
         
         # Set context variable
         correlation_id_var.set(correlation_id)
 
-        # Process request
-        response = await call_next(request)
-
-        # Add correlation ID to response headers
-        response.headers[self.HEADER_NAME] = correlation_id
+        async def send_with_correlation_id(message: Message) -> None:
+            # Add correlation ID to response headers
+            if message["type"] == "http.response.start":
+                _append_header(message, _CORRELATION_ID_HEADER, raw_id)
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_with_correlation_id)
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+class RequestLoggingMiddleware:
     """
     Middleware for logging request/response details.
     
-    Logs request method, path, status code, and processing time.
+    Logs request method, path, status code, and processing time. Requests to
+    ``_UNLOGGED_PATHS`` (and docs assets), and all requests while INFO is
+    disabled, still get the timing header but build no log records.
     """
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable,
-    ) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Log request and response details.
         
+        Processing time is measured up to the start of the response, which is
+        when the X-Process-Time-Ms header has to be written.
+        
         Args:
-            request: Incoming request.
-            call_next: Next middleware/handler in chain.
-            
-        Returns:
-            Response from handler.
+            scope: ASGI connection scope.
+            receive: ASGI receive channel.
+            send: ASGI send channel; wrapped to time and log the response.
         """
-        start_time = time.perf_counter()
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_ns = time.monotonic_ns()
+        path = scope["path"]
+        # isEnabledFor is cached by logging and reset on level changes, so this stays current
+        if (
+            path in _UNLOGGED_PATHS
+            or path.startswith("/docs/")
+            or not logger.isEnabledFor(logging.INFO)
+        ):
+            async def send_with_timing_only(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    _add_process_time_header(message, (time.monotonic_ns() - start_ns) // 1000)
+                await send(message)
+
+            await self.app(scope, receive, send_with_timing_only)
+            return
+
         correlation_id = get_correlation_id()
+        method = scope["method"]
+        client = scope.get("client")
+        client_ip = client[0] if client else None
         
         # Log incoming request
         logger.info(
-            f">>> {request.method} {request.url.path} [{correlation_id}]",
+            ">>> %s %s [%s]",
+            method,
+            path,
+            correlation_id,
             extra={
                 "extra_data": {
-                    "method": request.method,
-                    "path": request.url.path,
-                    "client_ip": request.client.host if request.client else None,
+                    "method": method,
+                    "path": path,
+                    "client_ip": client_ip,
                 },
                 "correlation_id": correlation_id,
             },
         )
-        
-        # Process request
-        response = await call_next(request)
-        
-        # Calculate processing time
-        process_time_ms = (time.perf_counter() - start_time) * 1000
-        
-        # Log response
-        logger.info(
-            f"<<< {request.method} {request.url.path} - {response.status_code} ({process_time_ms:.2f}ms) [{correlation_id}]",
-            extra={
-                "extra_data": {
-                    "method": request.method,
-                    "path": request.url.path,
-                    "status_code": response.status_code,
-                    "process_time_ms": round(process_time_ms, 2),
-                    "client_ip": request.client.host if request.client else None,
-                },
-                "correlation_id": correlation_id,
-            },
-        )
-
-        # Add processing time header
-        response.headers["X-Process-Time-Ms"] = str(round(process_time_ms, 2))
 
-        return response
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Calculate processing time (integer microseconds)
+                elapsed_us = (time.monotonic_ns() - start_ns) // 1000
+                process_time_ms = elapsed_us / 1000
+                status_code = message["status"]
+
+                # Add processing time header
+                _add_process_time_header(message, elapsed_us)
+
+                # Log response
+                logger.info(
+                    "<<< %s %s - %s (%.3fms) [%s]",
+                    method,
+                    path,
+                    status_code,
+                    process_time_ms,
+                    correlation_id,
+                    extra={
+                        "extra_data": {
+                            "method": method,
+                            "path": path,
+                            "status_code": status_code,
+                            "process_time_ms": round(process_time_ms, 2),
+                            "client_ip": client_ip,
+                        },
+                        "correlation_id": correlation_id,
+                    },
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_timing)
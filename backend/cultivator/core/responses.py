@@ -0,0 +1,23 @@
+"""
+JSON response class used by the cultivator app.
+
+Extends FastAPI's ORJSONResponse so handlers returning plain dicts can
+include numpy scalars/arrays (model scores) and ObjectId values without
+converting them by hand first.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse as _ORJSONResponse
+
+
+class ORJSONResponse(_ORJSONResponse):
+    """ORJSONResponse that also serializes numpy values, non-str keys and ObjectIds."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
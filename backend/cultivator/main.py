@@ -5,22 +5,38 @@ Cultivator Intention Prediction System
 Smart Agri-Suite - Backend API
 """
 
+import asyncio
 import logging
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from typing import AsyncGenerator
 
 from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 
 from cultivator.api.v1.routes import router as api_v1_router
 from cultivator.core.config import get_settings
-from cultivator.core.logging import get_logger, setup_logging
+from cultivator.core.logging import get_logger, run_log_flusher, setup_logging, shutdown_logging
+from cultivator.core.responses import ORJSONResponse
 from cultivator.core.middleware import CorrelationIdMiddleware, RequestLoggingMiddleware, get_correlation_id
-from cultivator.core.database import connect_db, close_db
-from cultivator.services.inference import get_classifier, reset_classifier
+from cultivator.core.database import UniqueIndexError, connect_db, close_db
+from cultivator.api.v1.endpoints.calls import run_incoming_call_watcher, run_missed_call_sweeper
+from cultivator.api.v1.endpoints.interviews import (
+    cancel_background_analyses,
+    run_stale_analysis_sweeper,
+)
+from cultivator.api.v1.endpoints.health import set_model_ready
+from cultivator.services.inference import (
+    get_classifier,
+    get_deception_detector,
+    reset_classifier,
+    warm_up_audio_features,
+)
 from cultivator.services.agora import validate_agora_credentials_at_startup
+from cultivator.services.gate2_inference import (
+    get_gate2_deception_service,
+    get_gate2_inference_service,
+)
 
 # Initialize logging
 setup_logging()
@@ -30,6 +46,9 @@ logger = get_logger(__name__)
 logging.getLogger("uvicorn.access").setLevel(logging.CRITICAL)
 logging.getLogger("uvicorn").setLevel(logging.INFO)
 
+# Validation errors included in the warning log for a rejected request
+MAX_LOGGED_VALIDATION_ERRORS = 3
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -59,21 +78,81 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Connect to MongoDB
     try:
         await connect_db()
+    except UniqueIndexError:
+        logger.critical("Required unique index could not be created; refusing to start")
+        raise
     except Exception as e:
         logger.error(f"Failed to connect to MongoDB: {e}")
         # Continue without database for health checks
     
     # Initialize classifier (loads model)
-    classifier = get_classifier()
+    classifier = await asyncio.to_thread(get_classifier)
     logger.info(f"Model loaded: {classifier.is_loaded}")
+    try:
+        await asyncio.to_thread(classifier.warm_up)
+    except Exception as e:
+        logger.warning(f"Intent classifier warm-up failed: {e}")
+    set_model_ready(classifier.is_loaded)
+    
+    # Load the Gate 1 deception model now instead of on the first recording
+    try:
+        deception_detector = await asyncio.to_thread(get_deception_detector)
+        logger.info(f"Deception model loaded: {deception_detector.is_loaded}")
+    except Exception as e:
+        logger.warning(f"Deception model not loaded at startup: {e}")
+    
+    # Gate 2 services unpickle their models and build the face detector on
+    # first use; do it here so the first interview upload doesn't pay for it
+    try:
+        gate2_service = await asyncio.to_thread(get_gate2_inference_service)
+        gate2_deception_service = await asyncio.to_thread(get_gate2_deception_service)
+        logger.info(
+            f"Gate 2 models loaded: emotion={gate2_service.is_loaded} "
+            f"deception={gate2_deception_service.is_loaded}"
+        )
+    except Exception as e:
+        logger.warning(f"Gate 2 models not loaded at startup: {e}")
+    
+    # Compile librosa's Numba kernels now rather than on the first upload
+    try:
+        await asyncio.to_thread(warm_up_audio_features)
+    except Exception as e:
+        logger.warning(f"Audio feature warm-up failed: {e}")
+    
+    # Single periodic sweep for ringing calls that timed out
+    missed_call_sweeper = asyncio.create_task(run_missed_call_sweeper())
+    
+    # Periodic reset of interviews whose background analysis was lost
+    stale_analysis_sweeper = asyncio.create_task(run_stale_analysis_sweeper())
+    
+    # One change stream per process pushes calls initiated on other workers
+    incoming_call_watcher = asyncio.create_task(run_incoming_call_watcher())
+    
+    # Bound how long batched log records wait before being written
+    log_flusher = asyncio.create_task(run_log_flusher())
     
     yield
     
     # Shutdown
     logger.info("Shutting down application...")
+    missed_call_sweeper.cancel()
+    incoming_call_watcher.cancel()
+    stale_analysis_sweeper.cancel()
+    log_flusher.cancel()
+    with suppress(asyncio.CancelledError):
+        await missed_call_sweeper
+    with suppress(asyncio.CancelledError):
+        await incoming_call_watcher
+    with suppress(asyncio.CancelledError):
+        await stale_analysis_sweeper
+    with suppress(asyncio.CancelledError):
+        await log_flusher
+    await cancel_background_analyses()
     await close_db()
+    set_model_ready(False)
     reset_classifier()
     logger.info("Cleanup complete")
+    shutdown_logging()
 
 
 def create_app() -> FastAPI:
@@ -96,6 +175,7 @@ def create_app() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         openapi_url="/openapi.json",
+        default_response_class=ORJSONResponse,
         lifespan=lifespan,
     )
     
@@ -131,12 +211,13 @@ def register_exception_handlers(app: FastAPI) -> None:
     Args:
         app: FastAPI application instance.
     """
+    debug = get_settings().debug
     
     @app.exception_handler(RequestValidationError)
     async def validation_exception_handler(
         request: Request,
         exc: RequestValidationError,
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         """Handle request validation errors."""
         correlation_id = get_correlation_id()
         
@@ -150,21 +231,28 @@ def register_exception_handlers(app: FastAPI) -> None:
         logger.warning(
             f"Validation error: {field} - {message}",
             extra={
-                "extra_data": {"errors": errors},
+                "extra_data": {
+                    "errors": errors[:MAX_LOGGED_VALIDATION_ERRORS],
+                    "error_count": len(errors),
+                },
                 "correlation_id": correlation_id,
             },
         )
         
-        return JSONResponse(
+        error_content = {
+            "code": "VALIDATION_ERROR",
+            "message": message,
+            "field": field,
+        }
+        # Full error list (which echoes the rejected input) only in debug
+        if debug:
+            error_content["details"] = errors
+        
+        return ORJSONResponse(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             content={
                 "success": False,
-                "error": {
-                    "code": "VALIDATION_ERROR",
-                    "message": message,
-                    "field": field,
-                    "details": errors,
-                },
+                "error": error_content,
                 "correlation_id": correlation_id,
             },
         )
@@ -173,7 +261,7 @@ def register_exception_handlers(app: FastAPI) -> None:
     async def http_exception_handler(
         request: Request,
         exc: HTTPException,
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         """Handle HTTP exceptions."""
         correlation_id = get_correlation_id()
         
@@ -186,7 +274,7 @@ def register_exception_handlers(app: FastAPI) -> None:
                 "message": str(exc.detail),
             }
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=exc.status_code,
             content={
                 "success": False,
@@ -199,7 +287,7 @@ def register_exception_handlers(app: FastAPI) -> None:
     async def general_exception_handler(
         request: Request,
         exc: Exception,
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         """Handle unexpected exceptions."""
         correlation_id = get_correlation_id()
         
@@ -208,7 +296,7 @@ def register_exception_handlers(app: FastAPI) -> None:
             extra={"correlation_id": correlation_id},
         )
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={
                 "success": False,
@@ -243,8 +331,10 @@ if __name__ == "__main__":
     
     settings = get_settings()
     
+    # uvicorn[standard] ships uvloop and httptools; "auto" picks them up where
+    # available and falls back to asyncio/h11 (uvloop has no Windows build)
     uvicorn.run(
-        "app.main:app",
+        "cultivator.main:app",
         host=settings.host,
         port=settings.port,
         reload=settings.debug,
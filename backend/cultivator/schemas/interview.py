@@ -127,6 +127,14 @@ class InterviewAnalyzeResponse(BaseModel):
     safety_assessment: Optional[SafetyAssessment] = None
 
 
+class InterviewAnalysisQueuedResponse(BaseModel):
+    """Response after queueing an interview video for background analysis."""
+    success: bool
+    interviewId: str
+    processingStatus: str
+    message: str
+
+
 class InterviewResponse(BaseModel):
     """Full interview record response."""
     id: str
@@ -140,6 +148,7 @@ class InterviewResponse(BaseModel):
     confidence: Optional[float] = None
     reasons: List[str] = []
     status: str  # pending, completed
+    processingStatus: Optional[str] = None  # processing, completed, failed (background analysis)
     createdAt: datetime
     # Gate 2 detailed fields
     emotion_distribution: Optional[Dict[str, float]] = None
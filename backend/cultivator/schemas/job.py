@@ -4,7 +4,8 @@ Job schemas.
 
 from datetime import datetime
 from typing import Optional, List, Literal
-from pydantic import BaseModel, Field
+from bson import ObjectId
+from pydantic import BaseModel, Field, field_validator
 
 
 class JobCreate(BaseModel):
@@ -16,18 +17,25 @@ class JobCreate(BaseModel):
 
 
 class JobResponse(BaseModel):
-    """Job response."""
-    id: str
+    """Job response. Validates straight from a MongoDB job document."""
+    id: str = Field(validation_alias="_id")
     createdByUserId: str
-    createdByUsername: str
+    createdByUsername: str = "Unknown"
     title: str
     districtOrLocation: str
-    startsOnText: str
-    priorExperience: str
+    startsOnText: str = "Immediate"
+    priorExperience: str = "None"
     status: str
     createdAt: datetime
     updatedAt: datetime
 
+    model_config = {"populate_by_name": True}
+
+    @field_validator("id", mode="before")
+    @classmethod
+    def _object_id_to_str(cls, v):
+        return str(v) if isinstance(v, ObjectId) else v
+
 
 class JobListResponse(BaseModel):
     """List of jobs response."""
@@ -2,9 +2,9 @@
 Prediction request and response schemas.
 """
 
-from typing import Dict, List, Optional
+from typing import Annotated, Dict, List, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, StringConstraints
 
 
 class IntentScore(BaseModel):
@@ -92,7 +92,8 @@ class Base64AudioRequest(BaseModel):
         description="Base64-encoded audio data",
         min_length=1,
     )
-    audio_format: str = Field(
+    # Lower-cased and stripped by pydantic-core, no Python validator call
+    audio_format: Annotated[str, StringConstraints(strip_whitespace=True, to_lower=True)] = Field(
         default="wav",
         description="Audio format/extension",
         examples=["wav", "mp3", "ogg"],
@@ -103,12 +104,6 @@ class Base64AudioRequest(BaseModel):
         examples=[16000, 44100],
     )
 
-    @field_validator("audio_format")
-    @classmethod
-    def validate_format(cls, v: str) -> str:
-        """Normalize audio format to lowercase."""
-        return v.lower().strip()
-
     model_config = {
         "json_schema_extra": {
             "example": {
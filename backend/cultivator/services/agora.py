@@ -13,7 +13,8 @@ import hashlib
 import hmac
 import json
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any, Tuple
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Sequence, Tuple
 from enum import IntEnum
 
 import aiohttp
@@ -129,6 +130,10 @@ class AgoraCloudRecording:
         self.customer_secret = settings.agora_customer_secret
         self.api_base = self.API_REGIONS.get("us")
         
+        # Credentials don't change at runtime; encode the auth header once
+        credentials = f"{self.customer_id}:{self.customer_secret}"
+        self._auth_header = f"Basic {base64.b64encode(credentials.encode()).decode()}"
+        
         # Storage configuration
         self.storage_config = {
             "vendor": settings.agora_recording_vendor,
@@ -139,10 +144,8 @@ class AgoraCloudRecording:
         }
     
     def _get_auth_header(self) -> str:
-        """Generate Basic Auth header for Agora RESTful API."""
-        credentials = f"{self.customer_id}:{self.customer_secret}"
-        encoded = base64.b64encode(credentials.encode()).decode()
-        return f"Basic {encoded}"
+        """Get the Basic Auth header for Agora RESTful API."""
+        return self._auth_header
     
     def _get_headers(self) -> Dict[str, str]:
         """Get headers for API requests."""
@@ -361,29 +364,20 @@ class AgoraCloudRecording:
             return None
 
 
-def generate_agora_token(
-    channel_name: str,
-    uid: int,
-    role: RtcTokenRole = RtcTokenRole.PUBLISHER,
-    expire_seconds: int = 3600
-) -> str:
+@lru_cache()
+def _get_agora_credentials() -> Tuple[str, str]:
     """
-    Generate an Agora RTC token for a user.
+    Read and check the Agora App ID and certificate once.
+    
+    Failures are not cached, so a missing credential keeps raising
+    until it is configured.
     
-    Args:
-        channel_name: The channel/room name
-        uid: User ID (use 0 for dynamic assignment)
-        role: Publisher or Subscriber
-        expire_seconds: Token validity duration
-        
     Returns:
-        RTC token string
+        Tuple of (app_id, app_certificate)
     """
     settings = get_settings()
     app_id = settings.agora_app_id or ""
     app_certificate = settings.agora_app_certificate or ""
-    current_ts = int(time.time())
-    privilege_expired_ts = current_ts + expire_seconds
 
     if not app_id or not app_certificate:
         missing = []
@@ -398,6 +392,18 @@ def generate_agora_token(
         logger.error(f"[AGORA-BACKEND-GENERATE] {msg}")
         raise RuntimeError(msg)
 
+    return app_id, app_certificate
+
+
+def _build_checked_token(
+    app_id: str,
+    app_certificate: str,
+    channel_name: str,
+    uid: int,
+    role: RtcTokenRole,
+    privilege_expired_ts: int
+) -> str:
+    """Build one RTC token and reject anything that isn't a 006 token."""
     token = AgoraTokenBuilder.build_token_with_uid(
         app_id,
         app_certificate,
@@ -419,6 +425,73 @@ def generate_agora_token(
         logger.error(f"[AGORA-BACKEND-GENERATE] {msg}")
         raise RuntimeError(msg)
     
+    return token
+
+
+def generate_agora_tokens(
+    channel_name: str,
+    uids: Sequence[int],
+    role: RtcTokenRole = RtcTokenRole.PUBLISHER,
+    expire_seconds: int = 3600
+) -> List[str]:
+    """
+    Generate Agora RTC tokens for several participants of one channel.
+    
+    Credentials and the expiry timestamp are resolved once for the batch,
+    and the per-token debug logging is collapsed into a single line.
+    
+    Args:
+        channel_name: The channel/room name
+        uids: User IDs to mint tokens for, in order
+        role: Publisher or Subscriber
+        expire_seconds: Token validity duration
+        
+    Returns:
+        RTC token strings, one per UID
+    """
+    app_id, app_certificate = _get_agora_credentials()
+    privilege_expired_ts = int(time.time()) + expire_seconds
+
+    tokens = [
+        _build_checked_token(
+            app_id, app_certificate, channel_name, uid, role, privilege_expired_ts
+        )
+        for uid in uids
+    ]
+
+    logger.info(
+        f"[AGORA-TOKEN-DEBUG] Generated {len(tokens)} tokens channel={channel_name} "
+        f"uids={list(uids)} role={getattr(role, 'name', str(role))} expiry={privilege_expired_ts}"
+    )
+    return tokens
+
+
+def generate_agora_token(
+    channel_name: str,
+    uid: int,
+    role: RtcTokenRole = RtcTokenRole.PUBLISHER,
+    expire_seconds: int = 3600
+) -> str:
+    """
+    Generate an Agora RTC token for a user.
+    
+    Args:
+        channel_name: The channel/room name
+        uid: User ID (use 0 for dynamic assignment)
+        role: Publisher or Subscriber
+        expire_seconds: Token validity duration
+        
+    Returns:
+        RTC token string
+    """
+    app_id, app_certificate = _get_agora_credentials()
+    current_ts = int(time.time())
+    privilege_expired_ts = current_ts + expire_seconds
+
+    token = _build_checked_token(
+        app_id, app_certificate, channel_name, uid, role, privilege_expired_ts
+    )
+    
     logger.info("[AGORA-TOKEN-DEBUG] Token generation")
     logger.info(f"[AGORA-TOKEN-DEBUG] AppID length: {len(app_id)}")
     logger.info(f"[AGORA-TOKEN-DEBUG] Certificate length: {len(app_certificate)}")
@@ -515,6 +588,7 @@ def validate_agora_credentials_at_startup() -> bool:
         raise ValueError(error_msg) from e
 
 
+@lru_cache()
 def get_agora_app_id() -> str:
     """Get the Agora App ID from settings."""
     settings = get_settings()
@@ -13,9 +13,10 @@ and uses it for predictions, falling back to heuristic rules otherwise.
 
 import json
 import random
+import re
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
@@ -94,9 +95,225 @@ TEXT_FEATURES = [
 
 ALL_FEATURES = AUDIO_FEATURES + TEXT_FEATURES
 
+# Red flag keyword lists for transcript text features
+URGENCY_KEYWORDS = ["urgent", "immediately", "hurry", "right now", "today only", "limited time"]
+MONEY_KEYWORDS = ["send money", "transfer", "payment", "fee", "deposit", "prize", "won", "lottery"]
+SECRECY_KEYWORDS = ["don't tell", "secret", "keep this between", "confidential"]
+PRESSURE_KEYWORDS = ["you must", "have to", "no choice", "final warning", "legal action"]
+ID_AVOIDANCE_KEYWORDS = ["i am", "this is", "calling from", "representative"]
+OTP_PIN_KEYWORDS = ["otp", "pin", "password", "code", "verification"]
+
+
+def _compile_keywords(keywords: List[str]) -> "re.Pattern[str]":
+    """Compile keywords into one case-insensitive scan (lookahead allows overlaps)."""
+    alternation = "|".join(re.escape(kw) for kw in keywords)
+    return re.compile(f"(?=({alternation}))", re.IGNORECASE)
+
+
+_URGENCY_RE = _compile_keywords(URGENCY_KEYWORDS)
+_MONEY_RE = _compile_keywords(MONEY_KEYWORDS)
+_SECRECY_RE = _compile_keywords(SECRECY_KEYWORDS)
+_PRESSURE_RE = _compile_keywords(PRESSURE_KEYWORDS)
+_ID_AVOIDANCE_RE = _compile_keywords(ID_AVOIDANCE_KEYWORDS)
+_OTP_PIN_RE = _compile_keywords(OTP_PIN_KEYWORDS)
+
 # Intent labels for the buyer intent classification task
 INTENT_LABELS: List[str] = ["PROCEED", "VERIFY", "REJECT"]
 
+# All Gate 1 feature extractors work on 16 kHz mono audio
+TARGET_SAMPLE_RATE = 16000
+
+
+def decode_audio(audio_data: Union[bytes, str, Path]) -> Tuple[np.ndarray, int, int]:
+    """
+    Decode raw audio bytes into a 16 kHz mono waveform.
+    
+    Decode once and pass the waveform to the feature extractors when
+    the same recording feeds more than one model.
+    
+    Args:
+        audio_data: Raw audio bytes (WAV format), or a path to read from
+            directly without loading the file into memory first.
+        
+    Returns:
+        Tuple of (waveform, sample_rate, original_channel_count).
+    """
+    import io
+    import warnings
+    
+    try:
+        import librosa
+        import soundfile as sf
+    except ImportError:
+        msg = "Audio decoding dependencies missing: install librosa and soundfile"
+        logger.error(f"[GATE1 AUDIO] {msg}")
+        raise RuntimeError(msg)
+    
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        
+        if isinstance(audio_data, (bytes, bytearray)):
+            audio_buffer = io.BytesIO(audio_data)
+        else:
+            audio_buffer = str(audio_data)
+        try:
+            # float32 halves the memory traffic of every downstream pass
+            y, sr = sf.read(audio_buffer, dtype="float32")
+            channel_count = int(y.shape[1]) if len(y.shape) > 1 else 1
+            # Downmix before resampling so only one channel is resampled
+            if len(y.shape) > 1:
+                y = np.mean(y, axis=1, dtype=np.float32)
+            # Resample to 16kHz if needed
+            if sr != TARGET_SAMPLE_RATE:
+                y = librosa.resample(y, orig_sr=sr, target_sr=TARGET_SAMPLE_RATE)
+                sr = TARGET_SAMPLE_RATE
+        except Exception:
+            # Fallback to librosa
+            if isinstance(audio_buffer, io.BytesIO):
+                audio_buffer.seek(0)
+            y, sr = librosa.load(audio_buffer, sr=TARGET_SAMPLE_RATE, mono=True)
+            channel_count = 1
+    
+    return y, sr, channel_count
+
+
+def estimate_active_speech_seconds(
+    y: np.ndarray,
+    sr: int = TARGET_SAMPLE_RATE,
+    frame_ms: int = 30,
+    silence_threshold_db: float = -45.0,
+) -> float:
+    """
+    Estimate how many seconds of a waveform are above the silence floor.
+    
+    A cheap energy gate (no STFT) used to reject silence-dominated
+    recordings before running the full feature extraction.
+    
+    Args:
+        y: Mono waveform in [-1, 1].
+        sr: Sample rate of ``y``.
+        frame_ms: Frame length for the RMS gate.
+        silence_threshold_db: Frames quieter than this (dBFS) count as silence.
+        
+    Returns:
+        Seconds of audio in frames louder than the threshold.
+    """
+    frame_length = max(1, int(sr * frame_ms / 1000))
+    n_frames = len(y) // frame_length
+    if n_frames == 0:
+        return 0.0
+    
+    frames = y[: n_frames * frame_length].reshape(n_frames, frame_length)
+    rms = np.sqrt(np.mean(np.square(frames, dtype=np.float32), axis=1))
+    threshold = 10.0 ** (silence_threshold_db / 20.0)
+    active_frames = int(np.count_nonzero(rms > threshold))
+    return active_frames * frame_length / sr
+
+
+def numpy_prosodic_features(
+    y: np.ndarray,
+    sr: int = TARGET_SAMPLE_RATE,
+    frame_length: int = 2048,
+    hop_length: int = 512,
+) -> Dict[str, float]:
+    """
+    Energy and zero-crossing features computed with plain numpy.
+    
+    Frames the waveform like librosa's rms/zero_crossing_rate defaults
+    (centred, zero padded) so the values sit on the same scale. Used when
+    librosa is unavailable; pitch, tempo and MFCC features are left at 0.
+    
+    Args:
+        y: Mono waveform in [-1, 1].
+        sr: Sample rate of ``y``.
+        frame_length: Samples per analysis frame.
+        hop_length: Samples between frame starts.
+        
+    Returns:
+        Dict with every DECEPTION_AUDIO_FEATURES key.
+    """
+    features = {f: 0.0 for f in DECEPTION_AUDIO_FEATURES}
+    if len(y) == 0:
+        return features
+    
+    y = np.asarray(y, dtype=np.float32)
+    padded = np.pad(y, frame_length // 2)
+    frames = np.lib.stride_tricks.sliding_window_view(padded, frame_length)[::hop_length]
+    
+    rms = np.sqrt(np.mean(np.square(frames), axis=1))
+    crossings = np.diff(np.signbit(frames), axis=1)
+    zcr = np.count_nonzero(crossings, axis=1) / frame_length
+    
+    energy_threshold = 0.01 * rms.max() if rms.max() > 0 else 1e-6
+    rms_mean = float(rms.mean())
+    
+    features.update({
+        "duration_seconds": round(len(y) / sr, 2),
+        "rms_mean": round(rms_mean, 6),
+        "rms_std": round(float(rms.std()), 6),
+        "zcr_mean": round(float(zcr.mean()), 6),
+        "pause_ratio": round(float(np.mean(rms < energy_threshold)), 4),
+    })
+    if len(rms) > 2 and rms_mean > 0:
+        features["shimmer"] = round(float(np.mean(np.abs(np.diff(rms))) / rms_mean), 6)
+    if len(rms) > 1:
+        features["energy_contour_slope"] = round(float(np.polyfit(np.arange(len(rms)), rms, 1)[0]), 8)
+    return features
+
+
+def _compute_spectrograms(y: np.ndarray, sr: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the magnitude STFT and log-power mel spectrogram once.
+    
+    Uses librosa's default framing (n_fft=2048, hop_length=512), so
+    features derived from these match the y= variants the models were
+    trained on while paying for a single STFT.
+    
+    Returns:
+        Tuple of (magnitude_spectrogram, log_mel_spectrogram).
+    """
+    import librosa
+    
+    S = np.abs(librosa.stft(y))
+    log_mel = librosa.power_to_db(librosa.feature.melspectrogram(S=S ** 2, sr=sr))
+    return S, log_mel
+
+
+def warm_up_audio_features() -> None:
+    """
+    Run the librosa feature kernels once on synthetic audio.
+    
+    pyin and the onset/tempo helpers are Numba-compiled on first call,
+    which otherwise lands on the first recording a user uploads.
+    """
+    import warnings
+    
+    try:
+        import librosa
+    except ImportError:
+        logger.warning("[GATE1 AUDIO] librosa not installed; skipping feature warm-up")
+        return
+    
+    start_time = time.time()
+    t = np.arange(TARGET_SAMPLE_RATE, dtype=np.float32) / TARGET_SAMPLE_RATE
+    y = (0.1 * np.sin(2 * np.pi * 220.0 * t)).astype(np.float32)
+    
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        librosa.pyin(
+            y,
+            fmin=librosa.note_to_hz("C2"),
+            fmax=librosa.note_to_hz("C7"),
+            sr=TARGET_SAMPLE_RATE,
+        )
+        onset_env = librosa.onset.onset_strength(y=y, sr=TARGET_SAMPLE_RATE)
+        librosa.feature.tempo(onset_envelope=onset_env, sr=TARGET_SAMPLE_RATE)
+        librosa.onset.onset_detect(onset_envelope=onset_env, sr=TARGET_SAMPLE_RATE)
+    
+    logger.info(
+        f"[GATE1 AUDIO] feature kernels warmed in {round((time.time() - start_time) * 1000, 1)} ms"
+    )
+
 
 class IntentRiskClassifier:
     """
@@ -213,52 +430,41 @@ class IntentRiskClassifier:
         self.is_loaded = False
         logger.info("Model unloaded")
 
-    def _extract_audio_features(self, audio_data: bytes) -> np.ndarray:
+    def _extract_audio_features(
+        self,
+        audio_data: Optional[bytes] = None,
+        waveform: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
         """
         Extract audio features from raw bytes using librosa.
         
         Args:
             audio_data: Raw audio bytes (WAV format).
+            waveform: Pre-decoded 16 kHz mono waveform (skips decoding).
             
         Returns:
             Feature array matching the training format.
         """
-        import io
         import warnings
         
         try:
             import librosa
-            import soundfile as sf
         except ImportError:
             msg = "Audio feature extraction dependencies missing: install librosa and soundfile"
             logger.error(f"[GATE1 AUDIO] {msg}")
             raise RuntimeError(msg)
         
+        if waveform is not None:
+            y, sr, channel_count = waveform, TARGET_SAMPLE_RATE, 1
+        else:
+            y, sr, channel_count = decode_audio(audio_data)
+        
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
             
-            # Load audio from bytes
-            audio_buffer = io.BytesIO(audio_data)
-            try:
-                y, sr = sf.read(audio_buffer)
-                channel_count = int(y.shape[1]) if hasattr(y, "shape") and len(y.shape) > 1 else 1
-                # Resample to 16kHz if needed
-                if sr != 16000:
-                    y = librosa.resample(y, orig_sr=sr, target_sr=16000)
-                    sr = 16000
-            except Exception:
-                # Fallback to librosa
-                audio_buffer.seek(0)
-                y, sr = librosa.load(audio_buffer, sr=16000, mono=True)
-                channel_count = 1
-            
             if len(y) == 0:
                 return np.zeros((1, len(ALL_FEATURES)))
             
-            # Convert to mono if stereo
-            if len(y.shape) > 1:
-                y = np.mean(y, axis=1)
-            
             duration = len(y) / sr
             
             # RMS energy
@@ -274,9 +480,11 @@ class IntentRiskClassifier:
                     fmax=librosa.note_to_hz("C7"),
                     sr=sr,
                 )
-                f0_voiced = f0[~np.isnan(f0)] if f0 is not None else []
-                f0_mean = float(np.mean(f0_voiced)) if len(f0_voiced) > 0 else 0.0
-                f0_std = float(np.std(f0_voiced)) if len(f0_voiced) > 0 else 0.0
+                # pyin marks unvoiced frames as NaN; reduce over voiced frames
+                # directly instead of copying them out with a boolean index
+                voiced_count = int(np.count_nonzero(voiced_flag)) if f0 is not None else 0
+                f0_mean = float(np.nanmean(f0)) if voiced_count > 0 else 0.0
+                f0_std = float(np.nanstd(f0)) if voiced_count > 0 else 0.0
             except Exception:
                 f0_mean = 0.0
                 f0_std = 0.0
@@ -285,13 +493,16 @@ class IntentRiskClassifier:
             zcr = librosa.feature.zero_crossing_rate(y)[0]
             zcr_mean = float(np.mean(zcr)) if len(zcr) > 0 else 0.0
             
+            # One STFT shared by the spectral centroid and onset envelope
+            S, log_mel = _compute_spectrograms(y, sr)
+            
             # Spectral centroid
-            spec_cent = librosa.feature.spectral_centroid(y=y, sr=sr)[0]
+            spec_cent = librosa.feature.spectral_centroid(S=S, sr=sr)[0]
             spectral_centroid_mean = float(np.mean(spec_cent)) if len(spec_cent) > 0 else 0.0
             
             # Tempo proxy
             try:
-                onset_env = librosa.onset.onset_strength(y=y, sr=sr)
+                onset_env = librosa.onset.onset_strength(S=log_mel, sr=sr)
                 tempo = librosa.feature.tempo(onset_envelope=onset_env, sr=sr)[0]
                 tempo_proxy = float(tempo) if tempo else 0.0
             except Exception:
@@ -334,28 +545,19 @@ class IntentRiskClassifier:
         if not transcript:
             return {feat: 0 for feat in TEXT_FEATURES}
         
-        text_lower = transcript.lower()
-        
-        # Red flag keyword lists
-        urgency_kw = ["urgent", "immediately", "hurry", "right now", "today only", "limited time"]
-        money_kw = ["send money", "transfer", "payment", "fee", "deposit", "prize", "won", "lottery"]
-        secrecy_kw = ["don't tell", "secret", "keep this between", "confidential"]
-        pressure_kw = ["you must", "have to", "no choice", "final warning", "legal action"]
-        id_avoid_kw = ["i am", "this is", "calling from", "representative"]
-        otp_pin_kw = ["otp", "pin", "password", "code", "verification"]
-        
-        def count_keywords(text: str, keywords: list) -> int:
-            return sum(1 for kw in keywords if kw in text)
+        def count_keywords(pattern: "re.Pattern[str]") -> int:
+            # Number of distinct keywords present, matching `kw in text.lower()`
+            return len({m.group(1).lower() for m in pattern.finditer(transcript)})
         
         return {
             "transcript_char_len": len(transcript),
             "transcript_word_count": len(transcript.split()),
-            "urgency_count": count_keywords(text_lower, urgency_kw),
-            "money_count": count_keywords(text_lower, money_kw),
-            "secrecy_count": count_keywords(text_lower, secrecy_kw),
-            "pressure_count": count_keywords(text_lower, pressure_kw),
-            "id_avoidance_count": count_keywords(text_lower, id_avoid_kw),
-            "otp_pin_count": count_keywords(text_lower, otp_pin_kw),
+            "urgency_count": count_keywords(_URGENCY_RE),
+            "money_count": count_keywords(_MONEY_RE),
+            "secrecy_count": count_keywords(_SECRECY_RE),
+            "pressure_count": count_keywords(_PRESSURE_RE),
+            "id_avoidance_count": count_keywords(_ID_AVOIDANCE_RE),
+            "otp_pin_count": count_keywords(_OTP_PIN_RE),
         }
 
 
@@ -365,6 +567,7 @@ class IntentRiskClassifier:
         transcript: Optional[str] = None,
         audio_features: Optional[Dict[str, float]] = None,
         text_features: Optional[Dict[str, int]] = None,
+        waveform: Optional[np.ndarray] = None,
     ) -> np.ndarray:
         """
         Extract or prepare features for prediction.
@@ -374,6 +577,7 @@ class IntentRiskClassifier:
             transcript: Transcript text (for text feature extraction).
             audio_features: Pre-extracted audio features dict.
             text_features: Pre-extracted text features dict.
+            waveform: Pre-decoded 16 kHz mono waveform (used instead of audio_data).
             
         Returns:
             Feature array matching the training format.
@@ -393,9 +597,9 @@ class IntentRiskClassifier:
             return np.array(features).reshape(1, -1)
         
         # Extract features from raw audio and transcript
-        if audio_data is not None:
+        if audio_data is not None or waveform is not None:
             try:
-                audio_feats = self._extract_audio_features(audio_data)
+                audio_feats = self._extract_audio_features(audio_data, waveform=waveform)
                 
                 # If transcript provided, add text features
                 if transcript:
@@ -759,6 +963,22 @@ class IntentClassifier:
         self.is_loaded = False
         self.model = None
 
+    def warm_up(self) -> None:
+        """
+        Run one prediction on a zero feature vector.
+        
+        The first predict_proba call on a freshly unpickled model pays for
+        lazy allocations and imports; doing it here keeps that off the
+        first real request.
+        """
+        if not (self._classifier.use_ml_model and self._classifier.is_loaded):
+            return
+        start_time = time.time()
+        self._classifier.predict_with_ml(np.zeros((1, len(ALL_FEATURES))))
+        logger.info(
+            f"Intent classifier warmed in {round((time.time() - start_time) * 1000, 1)} ms"
+        )
+
     def preprocess_audio(
         self,
         audio_data: bytes,
@@ -770,9 +990,10 @@ class IntentClassifier:
 
     def predict(
         self,
-        audio_data: bytes,
+        audio_data: Optional[bytes] = None,
         sample_rate: int = 16000,
         transcript: Optional[str] = None,
+        features: Optional[np.ndarray] = None,
     ) -> Tuple[PredictionResult, float]:
         """
         Predict from audio data.
@@ -780,20 +1001,24 @@ class IntentClassifier:
         Uses real audio feature extraction with librosa.
         
         Args:
-            audio_data: Raw audio bytes.
+            audio_data: Raw audio bytes (optional when ``features`` is given).
             sample_rate: Audio sample rate (default 16000).
             transcript: Optional transcript text for text features.
+            features: Feature vector already extracted from this audio.
             
         Returns:
             Tuple of (PredictionResult, audio_duration).
         """
-        _, audio_duration = self.preprocess_audio(audio_data, sample_rate)
+        audio_duration = 0.0
+        if audio_data is not None:
+            _, audio_duration = self.preprocess_audio(audio_data, sample_rate)
         
         # Extract real features from audio and transcript
-        features = self._classifier.extract_features(
-            audio_data=audio_data,
-            transcript=transcript,
-        )
+        if features is None:
+            features = self._classifier.extract_features(
+                audio_data=audio_data,
+                transcript=transcript,
+            )
         
         # Use ML model if available
         if self._classifier.use_ml_model and self._classifier.is_loaded:
@@ -867,7 +1092,7 @@ def get_risk_classifier() -> IntentRiskClassifier:
 
 def reset_classifier() -> None:
     """Reset all global classifier instances (useful for testing)."""
-    global _classifier_instance, _risk_classifier_instance
+    global _classifier_instance, _risk_classifier_instance, _deception_detector_instance
     
     if _classifier_instance is not None:
         _classifier_instance.unload_model()
@@ -876,6 +1101,8 @@ def reset_classifier() -> None:
     if _risk_classifier_instance is not None:
         _risk_classifier_instance.unload_model()
     _risk_classifier_instance = None
+    
+    _deception_detector_instance = None
 
 
 # ============================================================================
@@ -964,42 +1191,45 @@ class Gate1DeceptionDetector:
             logger.error(f"[GATE1 MODEL] load failed: {e}")
             raise RuntimeError(f"Gate-1 deception model load failed: {e}") from e
 
-    def extract_deception_features(self, audio_data: bytes) -> Dict[str, float]:
+    def extract_deception_features(
+        self,
+        audio_data: Optional[bytes] = None,
+        waveform: Optional[np.ndarray] = None,
+    ) -> Dict[str, float]:
         """
         Extract extended prosodic features for deception detection.
 
+        Pass ``waveform`` (16 kHz mono) to reuse audio that was already decoded.
+
         Returns dict with all DECEPTION_AUDIO_FEATURES keys.
         """
-        import io
         import warnings
 
         try:
             import librosa
-            import soundfile as sf
         except ImportError:
-            msg = "Deception feature extraction dependencies missing: install librosa and soundfile"
-            logger.error(f"[GATE1 AUDIO] {msg}")
-            raise RuntimeError(msg)
+            librosa = None
+            if self.use_ml_model:
+                msg = "Deception feature extraction dependencies missing: install librosa and soundfile"
+                logger.error(f"[GATE1 AUDIO] {msg}")
+                raise RuntimeError(msg)
+
+        if waveform is not None:
+            y, sr = waveform, TARGET_SAMPLE_RATE
+        else:
+            y, sr, _ = decode_audio(audio_data)
+
+        if librosa is None:
+            # The rules fallback only needs energy cues, which numpy covers
+            logger.warning("[GATE1 AUDIO] librosa unavailable; using numpy energy features")
+            return numpy_prosodic_features(y, sr)
 
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
 
-            buf = io.BytesIO(audio_data)
-            try:
-                y, sr = sf.read(buf)
-                if sr != 16000:
-                    y = librosa.resample(y, orig_sr=sr, target_sr=16000)
-                    sr = 16000
-            except Exception:
-                buf.seek(0)
-                y, sr = librosa.load(buf, sr=16000, mono=True)
-
             if len(y) == 0:
                 return {f: 0.0 for f in DECEPTION_AUDIO_FEATURES}
 
-            if len(y.shape) > 1:
-                y = np.mean(y, axis=1)
-
             duration = len(y) / sr
 
             # RMS
@@ -1023,15 +1253,18 @@ class Gate1DeceptionDetector:
                 f0_mean, f0_std, f0_range = 0.0, 0.0, 0.0
                 f0_voiced = np.array([])
 
+            # One STFT shared by centroid, onsets, tempo and MFCCs
+            S, log_mel = _compute_spectrograms(y, sr)
+            onset_env = librosa.onset.onset_strength(S=log_mel, sr=sr)
+
             # ZCR + spectral centroid
             zcr = librosa.feature.zero_crossing_rate(y)[0]
             zcr_mean = float(np.mean(zcr))
-            sc = librosa.feature.spectral_centroid(y=y, sr=sr)[0]
+            sc = librosa.feature.spectral_centroid(S=S, sr=sr)[0]
             spectral_centroid_mean = float(np.mean(sc))
 
             # Tempo
             try:
-                onset_env = librosa.onset.onset_strength(y=y, sr=sr)
                 tempo = librosa.feature.tempo(onset_envelope=onset_env, sr=sr)[0]
                 tempo_proxy = float(tempo)
             except Exception:
@@ -1043,7 +1276,7 @@ class Gate1DeceptionDetector:
             pause_ratio = float(silent / len(rms)) if len(rms) > 0 else 0.0
 
             # Speech rate variation
-            onset_frames = librosa.onset.onset_detect(y=y, sr=sr)
+            onset_frames = librosa.onset.onset_detect(onset_envelope=onset_env, sr=sr)
             if len(onset_frames) > 2:
                 ioi = np.diff(librosa.frames_to_time(onset_frames, sr=sr))
                 speech_rate_variation = float(np.std(ioi))
@@ -1065,7 +1298,7 @@ class Gate1DeceptionDetector:
                 shimmer = 0.0
 
             # MFCCs
-            mfccs = librosa.feature.mfcc(y=y, sr=sr, n_mfcc=5)
+            mfccs = librosa.feature.mfcc(S=log_mel, sr=sr, n_mfcc=5)
             mfcc_means = [float(np.mean(mfccs[i])) for i in range(5)]
 
             # Energy slope
@@ -1098,18 +1331,21 @@ class Gate1DeceptionDetector:
             }
 
     def predict(
-        self, audio_data: bytes
+        self,
+        audio_data: Optional[bytes] = None,
+        waveform: Optional[np.ndarray] = None,
     ) -> Dict[str, Any]:
         """
         Predict whether audio speech is truthful or deceptive.
 
         Args:
             audio_data: Raw audio bytes (WAV format).
+            waveform: Pre-decoded 16 kHz mono waveform (used instead of audio_data).
 
         Returns:
             Dict with keys: label, confidence, scores, features, signals
         """
-        features = self.extract_deception_features(audio_data)
+        features = self.extract_deception_features(audio_data, waveform=waveform)
 
         if self.use_ml_model and self.model is not None:
             feat_array = np.array(
@@ -0,0 +1,28 @@
+"""
+Content hashing for cache keys.
+
+Uses BLAKE3 when the ``blake3`` package is installed (SIMD and
+multi-chunk parallel, several times faster on multi-MB media) and
+falls back to hashlib's BLAKE2b otherwise. Both produce 256-bit digests.
+"""
+
+import hashlib
+
+try:
+    from blake3 import blake3 as _blake3
+except ImportError:
+    _blake3 = None
+
+
+def new_content_hasher():
+    """Return a hashlib-style hasher (update/hexdigest) for content keys."""
+    if _blake3 is not None:
+        return _blake3()
+    return hashlib.blake2b(digest_size=32)
+
+
+def content_digest(data: bytes) -> str:
+    """Hex digest of ``data`` for use as a cache key."""
+    hasher = new_content_hasher()
+    hasher.update(data)
+    return hasher.hexdigest()
@@ -0,0 +1,30 @@
+"""
+MongoDB id helpers.
+
+Parses client-supplied ids once per request and turns malformed input
+into a 400 instead of a bson InvalidId surfacing as a 500.
+"""
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from fastapi import HTTPException
+
+
+def parse_object_id(value: str, label: str = "") -> ObjectId:
+    """
+    Parse a path/body id into an ObjectId.
+    
+    Args:
+        value: Hex id string from the request.
+        label: What the id refers to, used in the error message.
+        
+    Returns:
+        Parsed ObjectId.
+        
+    Raises:
+        HTTPException: 400 when the id is not a valid ObjectId.
+    """
+    try:
+        return ObjectId(value)
+    except (InvalidId, TypeError):
+        raise HTTPException(status_code=400, detail=f"Invalid {label} id" if label else "Invalid id")
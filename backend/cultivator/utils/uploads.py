@@ -0,0 +1,54 @@
+"""
+Upload handling utilities.
+
+Streams multipart uploads to disk in fixed-size chunks so request
+handlers never hold a whole file in memory.
+"""
+
+import asyncio
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from fastapi import UploadFile
+
+# 1 MiB keeps per-request memory flat while amortising syscall overhead
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def _write_chunk(out, chunk: bytes, hasher: Optional[Any]) -> None:
+    out.write(chunk)
+    if hasher is not None:
+        hasher.update(chunk)
+
+
+async def save_upload_file(
+    upload: UploadFile,
+    destination: Union[str, Path],
+    chunk_size: int = UPLOAD_CHUNK_SIZE,
+    hasher: Optional[Any] = None,
+) -> int:
+    """
+    Stream an uploaded file to disk chunk by chunk.
+    
+    Opening, each chunk write and closing run in a worker thread so
+    large files do not block the event loop.
+    
+    Args:
+        upload: Incoming FastAPI upload.
+        destination: Path of the file to create (overwritten if present).
+        chunk_size: Bytes to read per iteration.
+        hasher: Optional hashlib-style object fed every chunk, so callers
+            get a content digest without re-reading the file.
+        
+    Returns:
+        Number of bytes written.
+    """
+    written = 0
+    out = await asyncio.to_thread(open, destination, "wb")
+    try:
+        while chunk := await upload.read(chunk_size):
+            await asyncio.to_thread(_write_chunk, out, chunk, hasher)
+            written += len(chunk)
+    finally:
+        await asyncio.to_thread(out.close)
+    return written
@@ -1,12 +1,12 @@
 
 import ee
 import os
-import json
 import hashlib
 import time
 import pathlib
 import joblib
 import numpy as np
+import orjson
 from geopy.geocoders import Nominatim
 from typing import Dict, Any, List, Optional
 from functools import lru_cache
@@ -26,7 +26,7 @@ def _load_cache(city_name: str):
     if not p.exists():
         return None
     try:
-        data = json.loads(p.read_text())
+        data = orjson.loads(p.read_bytes())
         if time.time() - data.get("_cached_at", 0) < CACHE_TTL_SECONDS:
             print(f"✅ Cache hit for '{city_name}'")
             return data
@@ -38,7 +38,8 @@ def _load_cache(city_name: str):
 def _save_cache(city_name: str, result: dict):
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
     result["_cached_at"] = time.time()
-    _cache_path(city_name).write_text(json.dumps(result))
+    # orjson encodes straight to bytes (and handles numpy scalars) much faster than json
+    _cache_path(city_name).write_bytes(orjson.dumps(result, option=orjson.OPT_SERIALIZE_NUMPY))
 
 # ─── Constants ──────────────────────────────────────────────
 FEATURES = [
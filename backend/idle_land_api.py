@@ -1,11 +1,12 @@
 from fastapi import FastAPI, HTTPException, Depends, UploadFile, File, Header
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import Response, JSONResponse
+from fastapi.responses import Response
 from pydantic import BaseModel
 from typing import List, Dict, Tuple, Any, Optional
 from sqlalchemy.orm import Session
 import os
+import asyncio
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -16,6 +17,7 @@ import joblib
 from io import BytesIO
 from PIL import Image
 from functools import lru_cache
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 
 import rasterio
@@ -27,6 +29,9 @@ from rasterio.windows import from_bounds as window_from_bounds
 from shapely.geometry import shape, Point, Polygon, mapping
 import mercantile
 
+# Shared orjson response (numpy values, non-str keys, ObjectId fallback)
+from cultivator.core.responses import ORJSONResponse
+
 # --- Marketplace imports ---
 from marketplace.database import engine, get_db, Base as MarketplaceBase
 from marketplace import models as mp_models
@@ -43,29 +48,14 @@ from auth_utils import (
     UserRegister, UserLogin,
 )
 from bson import ObjectId
+from pymongo.errors import DuplicateKeyError
 import gee_service
 
 
-app = FastAPI(title="Idle Land Mobilization API", version="2.3.0")
-
-# CORS — allow all origins for mobile app development
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=False,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Mount media directory for static file serving
-os.makedirs("media/photos", exist_ok=True)
-os.makedirs("media/docs", exist_ok=True)
-app.mount("/media", StaticFiles(directory="media"), name="media")
-
-
-@app.on_event("startup")
-def _startup_create_tables():
-    """Create marketplace tables if they don't exist (fallback for non-Alembic usage)."""
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create marketplace tables and warm MongoDB on startup; close Mongo on shutdown."""
+    # Create marketplace tables if they don't exist (fallback for non-Alembic usage)
     try:
         MarketplaceBase.metadata.create_all(bind=engine)
         print("✅ Marketplace tables ready")
@@ -79,12 +69,33 @@ def _startup_create_tables():
     except Exception as e:
         print(f"⚠️ MongoDB not available (auth will fail): {e}")
 
+    yield
 
-@app.on_event("shutdown")
-async def _shutdown_mongo():
     await close_mongo()
 
 
+app = FastAPI(
+    title="Idle Land Mobilization API",
+    version="2.3.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
+
+# CORS — allow all origins for mobile app development
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_credentials=False,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+# Mount media directory for static file serving
+os.makedirs("media/photos", exist_ok=True)
+os.makedirs("media/docs", exist_ok=True)
+app.mount("/media", StaticFiles(directory="media"), name="media")
+
+
 MODEL_PATH_PRIMARY = os.path.join("model", "xgb_land_classifier.pkl")
 MODEL_PATH_FALLBACK = os.path.join("models", "idle_land_model.pkl")
 
@@ -198,12 +209,14 @@ async def auth_register(data: UserRegister):
     if db is None:
         raise HTTPException(status_code=503, detail="Database not available")
 
-    existing = await db.users.find_one({"username": data.username})
-    if existing:
-        raise HTTPException(status_code=400, detail="Username already exists")
-
-    existing = await db.users.find_one({"email": data.email})
+    # One lookup for both uniqueness checks
+    existing = await db.users.find_one(
+        {"$or": [{"username": data.username}, {"email": data.email}]},
+        {"username": 1},
+    )
     if existing:
+        if existing.get("username") == data.username:
+            raise HTTPException(status_code=400, detail="Username already exists")
         raise HTTPException(status_code=400, detail="Email already exists")
 
     now = datetime.now(timezone.utc)
@@ -214,15 +227,21 @@ async def auth_register(data: UserRegister):
         "address": data.address,
         "age": data.age,
         "role": data.role,
-        "passwordHash": hash_password(data.password),
+        # bcrypt is deliberately slow; hash off the event loop
+        "passwordHash": await asyncio.to_thread(hash_password, data.password),
+        "unreadNotifications": 0,
         "createdAt": now,
         "updatedAt": now,
     }
 
-    await db.users.insert_one(user_doc)
+    # The shared unique indexes still catch a concurrent registration
+    try:
+        await db.users.insert_one(user_doc)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="Username or email already exists")
     print(f"✅ User registered: {data.username} (role: {data.role})")
 
-    return JSONResponse({"success": True, "message": "Registration successful. Please login."})
+    return ORJSONResponse({"success": True, "message": "Registration successful. Please login."})
 
 
 @app.post("/api/v1/auth/login")
@@ -236,7 +255,7 @@ async def auth_login(data: UserLogin):
     if not user:
         raise HTTPException(status_code=401, detail="Invalid username or password")
 
-    if not verify_password(data.password, user["passwordHash"]):
+    if not await asyncio.to_thread(verify_password, data.password, user["passwordHash"]):
         raise HTTPException(status_code=401, detail="Invalid username or password")
 
     token = create_token(
@@ -247,7 +266,7 @@ async def auth_login(data: UserLogin):
 
     print(f"✅ User logged in: {data.username}")
 
-    return JSONResponse({
+    return ORJSONResponse({
         "token": token,
         "user": user_doc_to_response(user),
     })
@@ -264,7 +283,7 @@ async def auth_me(user_id: str = Depends(require_auth)):
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    return JSONResponse(user_doc_to_response(user))
+    return ORJSONResponse(user_doc_to_response(user))
 
 
 # ==================== MY LISTINGS ====================
@@ -298,7 +317,7 @@ def get_my_listings(
                 for p in (l.photos or [])
             ],
         })
-    return JSONResponse({"ok": True, "count": len(results), "listings": results})
+    return ORJSONResponse({"ok": True, "count": len(results), "listings": results})
 
 
 @app.get("/aoi")
@@ -331,7 +350,7 @@ def predict(req: PredictRequest):
 @app.get("/aoi/inspect")
 def aoi_inspect(lat: float, lng: float):
     try:
-        return JSONResponse(_inspect_point(lat, lng))
+        return ORJSONResponse(_inspect_point(lat, lng))
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"Missing raster: {FEATURES_TIF}")
     except Exception as e:
@@ -491,7 +510,7 @@ async def analyze_polygon(req: PolygonAnalysisRequest):
     print(f"📐 Processing polygon with {len(req.coordinates)} points")
     result = _run_polygon_analysis(req.coordinates)
     print("✅ Polygon analysis complete")
-    return JSONResponse(result)
+    return ORJSONResponse(result)
 
 
 @app.get("/tiles/classified/{z}/{x}/{y}.png")
@@ -558,7 +577,7 @@ def intelligence_evaluate(lat: float, lng: float):
             "spices": [],
             "intercropping": {"good_pairs": [], "avoid_pairs": [], "notes": []}
         }
-        return JSONResponse(base)
+        return ORJSONResponse(base)
 
     feats = base.get("features") or {}
     pred = base.get("prediction") or {}
@@ -570,7 +589,7 @@ def intelligence_evaluate(lat: float, lng: float):
         "intercropping": _intercropping(spices, feats),
         "health": _health_summary(feats, land_label),
     }
-    return JSONResponse(base)
+    return ORJSONResponse(base)
 
 
 @app.get("/aoi/summary")
@@ -654,7 +673,7 @@ def aoi_summary():
         "intercropping": inter,
     }
 
-    return JSONResponse(payload)
+    return ORJSONResponse(payload)
 
 
 # ==================== HELPER FUNCTIONS ====================
@@ -1167,7 +1186,7 @@ def create_listing(
 
     print(f"✅ Listing created: {listing.verification_code}")
 
-    return JSONResponse({
+    return ORJSONResponse({
         "ok": True,
         "id": listing.id,
         "verification_code": listing.verification_code,
@@ -1224,7 +1243,7 @@ def list_listings(
                 for p in (l.photos or [])
             ],
         })
-    return JSONResponse({"ok": True, "count": len(results), "listings": results})
+    return ORJSONResponse({"ok": True, "count": len(results), "listings": results})
 
 
 @app.get("/api/listings/{listing_id}")
@@ -1257,7 +1276,7 @@ def get_listing_detail(listing_id: int, db: Session = Depends(get_db)):
         for c in (listing.crop_scores or [])
     ]
 
-    return JSONResponse({
+    return ORJSONResponse({
         "ok": True,
         "listing": {
             "id": listing.id,
@@ -1352,7 +1371,7 @@ def upload_listing_photos(
     for p in saved_photos:
         db.refresh(p)
         
-    return JSONResponse({
+    return ORJSONResponse({
         "success": True,
         "photos": [{"id": p.id, "url": p.url, "is_primary": p.is_primary} for p in saved_photos]
     })
@@ -1406,7 +1425,7 @@ def upload_listing_documents(
     for d in saved_docs:
         db.refresh(d)
         
-    return JSONResponse({
+    return ORJSONResponse({
         "success": True,
         "documents": [{"id": d.id, "url": d.url, "doc_type": d.doc_type} for d in saved_docs]
     })
@@ -1420,10 +1439,11 @@ def upload_listing_documents(
 async def get_city_analysis(city: str):
     """Get land complexity analysis for a city."""
     try:
-        result = gee_service.analyze_city_complexity(city)
+        # Earth Engine calls and the disk cache write are blocking; keep them off the loop
+        result = await asyncio.to_thread(gee_service.analyze_city_complexity, city)
         if "error" in result:
             raise HTTPException(status_code=404, detail=result["error"])
-        return JSONResponse(result)
+        return ORJSONResponse(result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -1455,7 +1475,7 @@ async def get_point_analysis(lat: float, lng: float):
                 "health": {"headline": "No data available for this location", "tags": []},
             }
 
-        return JSONResponse(result)
+        return ORJSONResponse(result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -1493,7 +1513,7 @@ async def get_polygon_analysis(req: GeePolygonRequest):
                 "health": {"headline": "Insufficient data", "tags": []},
             }
 
-        return JSONResponse(result)
+        return ORJSONResponse(result)
     except HTTPException:
         raise
     except Exception as e:
@@ -1533,7 +1553,7 @@ def admin_stats(db: Session = Depends(get_db)):
     this_week = db.query(sa_func.count(mp_models.LandListing.id)).filter(mp_models.LandListing.submitted_at >= week_ago).scalar() or 0
     zones_count = db.query(sa_func.count(mp_models.RestrictedZone.id)).scalar() or 0
 
-    return JSONResponse({
+    return ORJSONResponse({
         "total_listings": total,
         "pending_count": pending,
         "verified_count": verified,
@@ -1574,7 +1594,7 @@ async def admin_update_status(listing_id: int, update: AdminStatusUpdate, db: Se
                 "createdAt": dt.now(tz.utc)
             })
 
-    return JSONResponse({"success": True, "message": f"Listing #{listing_id} marked as {update.status}."})
+    return ORJSONResponse({"success": True, "message": f"Listing #{listing_id} marked as {update.status}."})
 
 @app.get("/api/v1/user/notifications")
 async def get_my_notifications(user_id: str = Depends(require_auth)):
@@ -1586,7 +1606,7 @@ async def get_my_notifications(user_id: str = Depends(require_auth)):
         d["_id"] = str(d["_id"])
         if "createdAt" in d and hasattr(d["createdAt"], "isoformat"):
             d["createdAt"] = d["createdAt"].isoformat()
-    return JSONResponse(docs)
+    return ORJSONResponse(docs)
 
 @app.patch("/api/v1/user/notifications/{notif_id}/read")
 async def mark_notification_read(notif_id: str, user_id: str = Depends(require_auth)):
@@ -1595,7 +1615,7 @@ async def mark_notification_read(notif_id: str, user_id: str = Depends(require_a
         raise HTTPException(status_code=503, detail="Database not available")
     from bson.objectid import ObjectId
     await db.notifications.update_one({"_id": ObjectId(notif_id), "userId": user_id}, {"$set": {"read": True}})
-    return JSONResponse({"success": True})
+    return ORJSONResponse({"success": True})
 
 
 @app.delete("/api/listings/{listing_id}")
@@ -1608,7 +1628,7 @@ def admin_delete_listing(listing_id: int, db: Session = Depends(get_db)):
     db.query(mp_models.LandAnalytics).filter(mp_models.LandAnalytics.listing_id == listing_id).delete()
     db.delete(listing)
     db.commit()
-    return JSONResponse({"success": True, "message": f"Listing #{listing_id} deleted."})
+    return ORJSONResponse({"success": True, "message": f"Listing #{listing_id} deleted."})
 
 
 @app.post("/api/restricted-zones")
@@ -1625,7 +1645,7 @@ def admin_create_zone(zone: AdminZoneCreate, db: Session = Depends(get_db)):
     db.add(new_zone)
     db.commit()
     db.refresh(new_zone)
-    return JSONResponse({"success": True, "zone_id": new_zone.id})
+    return ORJSONResponse({"success": True, "zone_id": new_zone.id})
 
 
 @app.get("/api/restricted-zones")
@@ -1652,7 +1672,7 @@ def admin_list_zones(db: Session = Depends(get_db)):
             "created_at": z.created_at.isoformat() if z.created_at else None,
             "polygon_coordinates": geo.get("coordinates", []),
         })
-    return JSONResponse({"total": len(result), "zones": result})
+    return ORJSONResponse({"total": len(result), "zones": result})
 
 
 @app.delete("/api/restricted-zones/{zone_id}")
@@ -1663,7 +1683,7 @@ def admin_delete_zone(zone_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Zone not found.")
     db.delete(zone)
     db.commit()
-    return JSONResponse({"success": True, "message": f"Zone #{zone_id} deleted."})
+    return ORJSONResponse({"success": True, "message": f"Zone #{zone_id} deleted."})
 
 
 if __name__ == "__main__":
@@ -0,0 +1,59 @@
+"""
+Seed users.unreadNotifications from the notifications collection.
+
+The unread-count endpoint reads a counter on the user document that
+create_notification and mark-read keep in step, but only once it exists.
+Run once against existing data (ideally while the API is stopped); every
+user's counter is recomputed from its unread notifications, so counters
+left wrong by earlier deployments are corrected too.
+"""
+
+import asyncio
+import os
+import sys
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cultivator.core.config import get_settings
+
+BATCH_SIZE = 500
+
+
+async def backfill_unread_notifications():
+    print("Running migration to seed users.unreadNotifications...")
+    settings = get_settings()
+    client = AsyncIOMotorClient(settings.mongodb_url)
+    db = client[settings.mongodb_database]
+    updated = 0
+    try:
+        unread_by_user = {}
+        cursor = db.notifications.aggregate([
+            {"$match": {"isRead": False}},
+            {"$group": {"_id": "$userId", "n": {"$sum": 1}}},
+        ])
+        async for row in cursor:
+            unread_by_user[row["_id"]] = row["n"]
+
+        operations = []
+        async for user in db.users.find({}, {"_id": 1}):
+            count = unread_by_user.get(str(user["_id"]), 0)
+            operations.append(
+                UpdateOne({"_id": user["_id"]}, {"$set": {"unreadNotifications": count}})
+            )
+            if len(operations) >= BATCH_SIZE:
+                result = await db.users.bulk_write(operations, ordered=False)
+                updated += result.modified_count
+                operations = []
+        if operations:
+            result = await db.users.bulk_write(operations, ordered=False)
+            updated += result.modified_count
+        print(f"Migration complete: {updated} user counters updated.")
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(backfill_unread_notifications())
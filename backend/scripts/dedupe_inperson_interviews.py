@@ -0,0 +1,48 @@
+"""
+Remove duplicate inperson_interviews documents per (jobId, clientId).
+
+The application requires a unique index on (jobId, clientId) and refuses
+to start while duplicates exist. For each duplicated pair the most
+recently updated document is kept and the others are deleted. Run once
+against existing data, then restart the API.
+"""
+
+import asyncio
+import os
+import sys
+
+from motor.motor_asyncio import AsyncIOMotorClient
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cultivator.core.config import get_settings
+
+
+async def dedupe_inperson_interviews():
+    print("Running migration to remove duplicate in-person interviews...")
+    settings = get_settings()
+    client = AsyncIOMotorClient(settings.mongodb_url)
+    db = client[settings.mongodb_database]
+    deleted = 0
+    try:
+        cursor = db.inperson_interviews.aggregate([
+            {"$sort": {"updatedAt": -1, "createdAt": -1}},
+            {"$group": {
+                "_id": {"jobId": "$jobId", "clientId": "$clientId"},
+                "ids": {"$push": "$_id"},
+                "n": {"$sum": 1},
+            }},
+            {"$match": {"n": {"$gt": 1}}},
+        ], allowDiskUse=True)
+        async for group in cursor:
+            keep, *duplicates = group["ids"]
+            print(f"Keeping interview {keep} for {group['_id']}; removing {len(duplicates)}")
+            result = await db.inperson_interviews.delete_many({"_id": {"$in": duplicates}})
+            deleted += result.deleted_count
+        print(f"Migration complete: {deleted} duplicate interviews removed.")
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(dedupe_inperson_interviews())
@@ -0,0 +1,56 @@
+"""
+Convert calls.jobId from string to ObjectId.
+
+Calls now store jobId as an ObjectId matching jobs._id, so lookups and
+the (jobId, status) index work without string conversion. Run once
+against existing data; already-converted documents are left alone.
+"""
+
+import asyncio
+import os
+import sys
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cultivator.core.config import get_settings
+
+BATCH_SIZE = 500
+
+
+async def migrate_call_job_ids():
+    print("Running migration to convert calls.jobId strings to ObjectId...")
+    settings = get_settings()
+    client = AsyncIOMotorClient(settings.mongodb_url)
+    db = client[settings.mongodb_database]
+    converted = 0
+    skipped = 0
+    try:
+        operations = []
+        cursor = db.calls.find({"jobId": {"$type": "string"}}, {"jobId": 1})
+        async for call in cursor:
+            try:
+                job_oid = ObjectId(call["jobId"])
+            except InvalidId:
+                print(f"Skipping call {call['_id']}: invalid jobId {call['jobId']!r}")
+                skipped += 1
+                continue
+            operations.append(UpdateOne({"_id": call["_id"]}, {"$set": {"jobId": job_oid}}))
+            if len(operations) >= BATCH_SIZE:
+                result = await db.calls.bulk_write(operations, ordered=False)
+                converted += result.modified_count
+                operations = []
+        if operations:
+            result = await db.calls.bulk_write(operations, ordered=False)
+            converted += result.modified_count
+        print(f"Migration complete: {converted} calls converted, {skipped} skipped.")
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(migrate_call_job_ids())